@@ -95,6 +95,16 @@ Module Constants:
     PREVIEW_SLIDE_DURATION: A float for the the time taken, in seconds,
         to move a character preview into position during the intro and
         outro animations.
+    PREVIEW_CACHE_SIZE: An integer for the maximum number of character
+        preview spritesheets kept in memory at once. The least recently
+        viewed spritesheets are released first.
+    MUGSHOT_CACHE_SIZE: An integer for the maximum number of character
+        mugshots kept in memory at once. It should cover at least five
+        rows of the roster: the shown row, the rows above and below
+        it, and the next row in either direction, which is prefetched.
+    SLOT_CACHE_SIZE: An integer for the maximum number of framed
+        character slots kept in memory at once. The least recently
+        shown slots are released first.
 """
 
 
@@ -143,3 +153,6 @@ SHADOW_HEIGHT = 14
 SHADOW_COLOR = (0, 5, 90)
 OFFSET_FROM_SHADOW = 4
 PREVIEW_SLIDE_DURATION = 0.4
+PREVIEW_CACHE_SIZE = 16
+MUGSHOT_CACHE_SIZE = 30
+SLOT_CACHE_SIZE = 30
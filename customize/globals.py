@@ -16,10 +16,38 @@ Module Constants:
     DEFAULT_ACTIONS A tuple of Strings, containing the names of all
                     Actions that every character should have, such as
                     walking, blocking, and jumping.
+    IDLE_DELAY      The number of update cycles that must pass without
+                    player input or any running transitions before the
+                    game goes idle. While idle, the game stops updating
+                    at FRAME_RATE and waits for input instead.
+    IDLE_TIMEOUT    The longest time, in milliseconds, that the game
+                    will wait for input while idle before running a
+                    single update cycle to check whether it should
+                    wake up.
+    RENDER_AT_SCALE Set to True to have images magnified to the screen
+                    scale when they are loaded, so that States which
+                    support it can draw straight to a window-sized
+                    Surface instead of having every frame magnified.
+                    Only the Title Screen supports it so far; every
+                    other screen is still magnified on every frame.
+    UPSCALER        The name of the upscaler used for magnifying images
+                    when RENDER_AT_SCALE is True. This can be either
+                    'nearest' or 'scale2x'; the latter only applies to
+                    a screen scale of 2.
+    USE_PIXEL_CACHE Set to True to keep decoded copies of all images
+                    on disk, which makes them much faster to load.
+    PIXEL_CACHE_PATH The path to the folder that holds the decoded
+                    copies of images. It can be deleted at any time.
 """
 SCREEN_SIZE = (384, 226)
 FULL_SCALE = 3
 FRAME_RATE = 60.0
+IDLE_DELAY = 300
+IDLE_TIMEOUT = 100
+RENDER_AT_SCALE = False
+UPSCALER = 'nearest'
+USE_PIXEL_CACHE = True
+PIXEL_CACHE_PATH = 'cache/pixels'
 INPUT_NAMES = ("up", "back", "down", "forward", "light_punch",
                "medium_punch", "heavy_punch", "light_kick",
                "medium_kick", "heavy_kick", "start", "cancel")
@@ -0,0 +1,120 @@
+"""This module contains the AssetManager, which loads images from file
+and keeps them ready for drawing at the game's render scale.
+
+Normally, every Game State draws at the game's native resolution and
+the whole frame is magnified to fit the window on each update. If
+RENDER_AT_SCALE is enabled in customize/globals.py, images are instead
+magnified once as they are loaded, so that States which support it can
+draw straight onto a window-sized Surface. This also makes it
+affordable to use a higher-quality upscaler, since its cost is only
+paid at load time.
+
+So far, only the Title Screen supports this. The other screens draw
+text and shapes straight onto their native-resolution Surfaces, so they
+are still magnified on every update until they are converted.
+
+Module Constants:
+    NEAREST (String): The name of the upscaler that magnifies each
+        pixel into a solid square block.
+    SCALE2X (String): The name of the upscaler that uses the Scale2x
+        algorithm to smooth out diagonal edges. It only supports a
+        magnification rate of 2; other rates will use NEAREST instead.
+"""
+from pygame import transform
+from lib.graphics import import_image
+
+
+NEAREST = 'nearest'
+SCALE2X = 'scale2x'
+
+
+def scale_surface(surf, scale, upscaler=NEAREST):
+    """Return a copy of a Surface magnified by a certain rate.
+
+    If the rate is 1, the original Surface will be returned instead.
+
+    Args:
+        surf: The Surface to magnify.
+        scale: An integer for the magnification rate.
+        upscaler: Optional. A String for the name of the upscaler to
+            use. The default is NEAREST.
+    """
+    if scale == 1:
+        return surf
+    elif upscaler == SCALE2X and scale == 2:
+        return transform.scale2x(surf)
+    else:
+        return transform.scale(surf, (surf.get_width() * scale,
+                                      surf.get_height() * scale))
+
+
+class AssetManager(object):
+    """Loads images from file and pre-scales them to the render scale.
+
+    Every image is only loaded and magnified once; later requests for
+    the same file return the same Surface. Since those Surfaces are
+    shared, anything that alters an image after loading it, such as
+    flipping it or changing its transparency, should do so on its own
+    copy.
+
+    Attributes:
+        render_scale: An integer for the magnification rate that all
+            loaded images are pre-scaled by. 1 means that they are kept
+            at native resolution.
+        upscaler: A String for the name of the upscaler used for
+            magnifying images. See NEAREST and SCALE2X for the
+            possible values.
+        images: A dict mapping the file path of every loaded image to
+            its pre-scaled Surface.
+    """
+    def __init__(self, render_scale=1, upscaler=NEAREST):
+        """Declare and initialize instance variables.
+
+        Args:
+            render_scale: Optional. An integer for the magnification
+                rate that images will be pre-scaled by. The default is
+                1, which keeps images at native resolution.
+            upscaler: Optional. A String for the name of the upscaler
+                to use. The default is NEAREST.
+        """
+        self.render_scale = render_scale
+        self.upscaler = upscaler
+        self.images = {}
+
+    def set_render_scale(self, render_scale):
+        """Change the magnification rate of subsequently loaded images.
+
+        Images that were already loaded will be released, as they were
+        scaled for the old rate. Graphics that still hold them will
+        continue to draw at the old rate.
+
+        Args:
+            render_scale: An integer for the new magnification rate.
+        """
+        if render_scale != self.render_scale:
+            self.render_scale = render_scale
+            self.images = {}
+
+    def load_image(self, filepath):
+        """Return a Surface containing an image from file, converted
+        to the display format and magnified to the render scale.
+
+        Args:
+            filepath: A String for the file path to the image.
+        """
+        if filepath not in self.images:
+            self.images[filepath] = self.prescale(import_image(filepath))
+
+        return self.images[filepath]
+
+    def prescale(self, surf):
+        """Return a copy of a native-resolution Surface magnified to
+        the render scale.
+
+        Use this for Surfaces that aren't loaded from file, such as
+        rendered text.
+
+        Args:
+            surf: The Surface to magnify.
+        """
+        return scale_surface(surf, self.render_scale, self.upscaler)
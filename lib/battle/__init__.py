@@ -0,0 +1,2 @@
+__all__ = ["array_table", "cpu_player", "entities", "inputs", "match_runner",
+           "netplay", "projectiles", "simulation", "vec_env"]
\ No newline at end of file
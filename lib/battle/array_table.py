@@ -0,0 +1,133 @@
+"""This module contains the ArrayTable, a fixed-size store of records
+kept in struct-of-arrays form.
+
+Rather than creating one object per record, an ArrayTable keeps each
+field of every record in its own typed array, and identifies records
+by their slot index within those arrays. All of the memory a table
+will ever need is allocated when it is created, so adding and removing
+records never creates objects or triggers garbage collection. Copying
+or restoring the whole table is a handful of memory copies, one per
+array.
+"""
+from array import array
+
+
+class ArrayTable(object):
+    """A fixed number of record slots, with each field kept in its own
+    typed array.
+
+    Each column is also set as an attribute of the table under its own
+    name, so that a field of a record is read with, for example,
+    table.x[slot].
+
+    Attributes:
+        capacity: An integer for the number of record slots.
+        columns: A list of tuples, each containing the name and the
+            array typecode of a column, in the order they were given.
+        is_active: An array of flags indicating which slots hold a
+            record. A value of 1 means that the slot is in use.
+        free_slots: An array used as a stack of the unused slot indexes.
+            Only the first num_free entries are meaningful.
+        num_free: An integer for the number of unused slots.
+    """
+    def __init__(self, capacity, columns):
+        """Allocate the table's arrays.
+
+        Args:
+            capacity: An integer for the number of record slots.
+            columns: A list of tuples, each containing a String for the
+                name of a column and a String for the typecode of its
+                array, such as 'i' for integers or 'd' for floats.
+        """
+        self.capacity = capacity
+        self.columns = list(columns)
+        for name, typecode in self.columns:
+            setattr(self, name, array(typecode, [0] * capacity))
+
+        self.is_active = array('B', [0] * capacity)
+        # Slots are handed out lowest index first.
+        self.free_slots = array('i', xrange(capacity - 1, -1, -1))
+        self.num_free = capacity
+
+    def get_arrays(self):
+        """Return a list of every array in the table, including the
+        bookkeeping arrays, in a fixed order.
+        """
+        return ([getattr(self, name) for name, typecode in self.columns] +
+                [self.is_active, self.free_slots])
+
+    def num_active(self):
+        """Return an integer for the number of slots in use."""
+        return self.capacity - self.num_free
+
+    def allocate(self):
+        """Claim an unused slot and return its index.
+
+        The fields of the slot keep whatever values they held before,
+        so they should all be set by the caller.
+
+        Returns:
+            An integer for the index of the slot, or -1 if every slot
+            is already in use.
+        """
+        if self.num_free <= 0:
+            return -1
+
+        self.num_free -= 1
+        slot = self.free_slots[self.num_free]
+        self.is_active[slot] = 1
+        return slot
+
+    def release(self, slot):
+        """Return a slot to the table so that it can be claimed again.
+
+        Args:
+            slot: An integer for the index of a slot in use.
+        """
+        if not self.is_active[slot]:
+            return
+
+        self.is_active[slot] = 0
+        self.free_slots[self.num_free] = slot
+        self.num_free += 1
+
+    def clear(self):
+        """Release every slot."""
+        for slot in xrange(0, self.capacity):
+            self.is_active[slot] = 0
+            self.free_slots[slot] = self.capacity - 1 - slot
+        self.num_free = self.capacity
+
+    def snapshot(self):
+        """Return a copy of the table's entire contents, which can be
+        passed to restore() later.
+        """
+        return ([table_array.__copy__() for table_array in self.get_arrays()],
+                self.num_free)
+
+    def restore(self, snapshot):
+        """Return the table to the contents it had when a snapshot was
+        taken.
+
+        Args:
+            snapshot: A value returned by snapshot() on this table.
+        """
+        saved_arrays, num_free = snapshot
+        for table_array, saved_array in zip(self.get_arrays(), saved_arrays):
+            table_array[:] = saved_array
+        self.num_free = num_free
+
+    def clone(self):
+        """Return a new ArrayTable with the same columns and a copy of
+        this table's contents.
+        """
+        table_clone = ArrayTable(self.capacity, self.columns)
+        table_clone.restore(self.snapshot())
+        return table_clone
+
+    def to_bytes(self):
+        """Return a String containing the raw bytes of every array in
+        the table, for hashing or sending the table's state elsewhere.
+        """
+        return ''.join(table_array.tostring()
+                       for table_array in self.get_arrays())
@@ -0,0 +1,459 @@
+"""This module contains the CPUPlayer, a computer-controlled opponent
+that decides its inputs by looking a few update cycles into the future.
+
+Whenever the CPU is free to act, it copies the current battle into a
+scratch BattleSimulation and tries out a handful of plans there: moving,
+blocking, jumping, and every Action its character can currently
+perform, taken from the character's ActionIndex. Each plan is played
+out for a short horizon while the opponent is assumed to keep holding
+their current buttons, and is then scored by the damage it dealt and
+took, which comes from the Hitboxes and Hurtboxes that overlapped
+along the way. The best plan is then carried out over the following
+update cycles.
+
+Each decision has a strict time budget, which is checked after every
+update cycle played out. Plans are tried from the most to the least
+promising, and whichever scored best is used once the budget runs out,
+so the CPU never holds up an update cycle. While its fighter is
+performing an Action, the CPU only considers cancelling it once, and
+once more if it lands a hit, rather than on every cancelable frame.
+
+Decisions are also remembered by a checksum of the position they were
+made in. The checksum leaves out the frame count and running totals
+such as damage dealt, and rounds positions to whole pixels, so that
+positions that come up again are decided instantly.
+
+Module Constants:
+    LOOKAHEAD_FRAMES (int): The number of update cycles each plan is
+        played out for.
+    TIME_BUDGET (float): The most time, in seconds, that the CPU spends
+        on a single decision.
+    MEMO_SIZE (int): The number of past decisions that are remembered.
+    HOLD_FRAMES (int): The number of update cycles that a movement plan
+        is held before the CPU decides again.
+    DAMAGE_WEIGHT (float): How much each point of damage dealt, or
+        taken, adds to or subtracts from a plan's score.
+    DISTANCE_WEIGHT (float): How much each pixel of distance from the
+        opponent subtracts from a plan's score.
+    RECOIL_PENALTY (float): The amount subtracted from a plan's score if
+        it leaves the CPU in hitstun or blockstun.
+"""
+import zlib
+from array import array
+from collections import namedtuple, OrderedDict
+from timeit import default_timer
+from lib.battle.inputs import get_input_mask, get_action_input_mask
+from lib.battle.simulation import NEUTRAL, ACTING, RECOILING
+
+
+LOOKAHEAD_FRAMES = 12
+TIME_BUDGET = 0.004
+MEMO_SIZE = 4096
+HOLD_FRAMES = 6
+DAMAGE_WEIGHT = 10.0
+DISTANCE_WEIGHT = 0.05
+RECOIL_PENALTY = 50.0
+
+
+# A sequence of inputs that the CPU may carry out. input_masks is a
+# tuple with the bitmask to hold during each update cycle. If is_held is
+# True, the last bitmask keeps being held afterwards; otherwise, every
+# button is released.
+Plan = namedtuple('Plan', ['input_masks', 'is_held'])
+
+MOVEMENT_PLANS = (Plan((0,), True),
+                  Plan((get_input_mask(['forward']),), True),
+                  Plan((get_input_mask(['back']),), True),
+                  Plan((get_input_mask(['down', 'back']),), True),
+                  Plan((get_input_mask(['up', 'forward']),), True))
+# Holding no buttons lets an Action that is underway play out.
+IDLE_PLAN = MOVEMENT_PLANS[0]
+
+
+class CPUPlayer(object):
+    """A computer-controlled player.
+
+    Attributes:
+        player: An integer for the index of the player being controlled.
+        lookahead: An integer for the number of update cycles each plan
+            is played out for.
+        time_budget: A float for the most time, in seconds, spent on a
+            single decision.
+        scratch: The BattleSimulation that plans are tried out in. It
+            is cloned from the real battle the first time it's needed,
+            and again whenever the CPU is given a battle with different
+            characters.
+        plan: The Plan currently being carried out, or None.
+        plan_position: An integer for the number of update cycles of
+            the current Plan that have been carried out.
+        cancel_check: A tuple containing the Action, tick, and whether
+            it had hit, of the fighter's Action when the CPU last
+            considered cancelling it, or None.
+        memo: An OrderedDict mapping the position checksums of past
+            decisions to the Plans chosen, from the oldest to the most
+            recently used. It is cleared whenever scratch is cloned.
+        memo_size: An integer for the number of decisions kept in memo.
+        num_of_decisions: An integer for the number of decisions made.
+        num_of_memo_hits: An integer for the number of decisions that
+            were found in memo.
+        num_of_timeouts: An integer for the number of decisions that ran
+            out of time before trying every plan.
+    """
+    def __init__(self, player, lookahead=LOOKAHEAD_FRAMES,
+                 time_budget=TIME_BUDGET, memo_size=MEMO_SIZE):
+        """Declare and initialize instance variables.
+
+        Args:
+            player: An integer for the index of the player to control.
+            lookahead: Optional. An integer for the number of update
+                cycles each plan is played out for. The default is
+                LOOKAHEAD_FRAMES.
+            time_budget: Optional. A float for the most time, in
+                seconds, spent on a single decision. The default is
+                TIME_BUDGET.
+            memo_size: Optional. An integer for the number of past
+                decisions to remember. The default is MEMO_SIZE.
+        """
+        self.player = player
+        self.lookahead = lookahead
+        self.time_budget = time_budget
+        self.scratch = None
+        self.plan = None
+        self.plan_position = 0
+        self.cancel_check = None
+        self.memo = OrderedDict()
+        self.memo_size = memo_size
+        self.num_of_decisions = 0
+        self.num_of_memo_hits = 0
+        self.num_of_timeouts = 0
+
+    def get_input_mask(self, simulation):
+        """Return the input bitmask the CPU holds during the next update
+        cycle of a battle.
+
+        Args:
+            simulation: The BattleSimulation being played.
+        """
+        if self.is_plan_finished() and self.can_act(simulation):
+            self.plan = self.decide(simulation)
+            self.plan_position = 0
+
+        if self.plan is None:
+            return 0
+
+        input_mask = get_plan_input(self.plan, self.plan_position)
+        self.plan_position += 1
+        return input_mask
+
+    def is_plan_finished(self):
+        """Return a Boolean indicating whether the CPU is ready to
+        choose a new Plan.
+        """
+        if self.plan is None:
+            return True
+        elif self.plan.is_held:
+            return self.plan_position >= max(HOLD_FRAMES,
+                                             len(self.plan.input_masks))
+        else:
+            return self.plan_position >= len(self.plan.input_masks)
+
+    def can_act(self, simulation):
+        """Return a Boolean indicating whether the CPU should decide on
+        new inputs right now.
+
+        A fighter in NEUTRAL can always act. One performing an Action
+        can only act on a cancelable frame, and only if the CPU hasn't
+        already considered cancelling this run of the Action since it
+        last landed a hit.
+
+        Args:
+            simulation: The BattleSimulation being played.
+        """
+        player = self.player
+        mode = simulation.players.mode[player]
+        if mode == NEUTRAL:
+            self.cancel_check = None
+            return True
+        elif mode != ACTING:
+            return False
+
+        entities = simulation.entities.table
+        action = entities.action[player]
+        tick = entities.tick[player]
+        has_hit = entities.last_hit_frame[player] >= 0
+        if self.cancel_check is not None:
+            checked_action, checked_tick, checked_hit = self.cancel_check
+            # The tick only goes back down if the Action restarted.
+            if (checked_action == action and checked_hit == has_hit and
+                    checked_tick <= tick):
+                return False
+
+        cancel_graph = simulation.characters[player].cancel_graph
+        if cancel_graph.get_cancel_mask(action, entities.frame[player],
+                                        has_hit) == 0:
+            return False
+
+        self.cancel_check = (action, tick, has_hit)
+        return True
+
+    def decide(self, simulation):
+        """Choose the Plan that scores best over the next few update
+        cycles of a battle.
+
+        Args:
+            simulation: The BattleSimulation being played. Its state is
+                not changed.
+
+        Returns:
+            The chosen Plan.
+        """
+        # A battle with different characters needs its own scratch
+        # battle, since snapshots can only be restored into a clone, and
+        # the decisions made for the old characters no longer apply.
+        if (self.scratch is None or
+                self.scratch.characters is not simulation.characters):
+            self.scratch = simulation.clone()
+            self.memo.clear()
+
+        self.num_of_decisions += 1
+        position_hash = get_position_hash(simulation)
+        if position_hash in self.memo:
+            self.num_of_memo_hits += 1
+            plan = self.memo.pop(position_hash)
+            self.memo[position_hash] = plan
+            return plan
+
+        deadline = default_timer() + self.time_budget
+        start_snapshot = simulation.snapshot()
+
+        best_plan = None
+        best_score = None
+        for plan in self.get_plans(simulation):
+            score = self.score_plan(start_snapshot, plan, deadline)
+            if score is None:
+                # A Plan cut short can't be compared fairly with the
+                # others, so it is only used if nothing else was tried.
+                if best_plan is None:
+                    best_plan = plan
+                self.num_of_timeouts += 1
+                return best_plan
+            elif best_score is None or score > best_score:
+                best_plan = plan
+                best_score = score
+
+            if default_timer() >= deadline:
+                self.num_of_timeouts += 1
+                return best_plan
+
+        self.memo[position_hash] = best_plan
+        if len(self.memo) > self.memo_size:
+            self.memo.popitem(False)
+
+        return best_plan
+
+    def get_plans(self, simulation):
+        """Return a list of the Plans worth trying in a battle's current
+        state, from the most to the least promising.
+
+        Every Action the CPU's character could start from its current
+        condition with its current Special Gauge comes first, from the
+        highest input priority to the lowest. While an Action is being
+        performed, only the Actions it can currently be cancelled into
+        are included. They are followed by the movement Plans in
+        NEUTRAL, or by letting the current Action play out otherwise.
+
+        Args:
+            simulation: The BattleSimulation being played.
+        """
+        player = self.player
+        players = simulation.players
+        character = simulation.characters[player]
+        plans = []
+
+        if players.mode[player] == ACTING:
+            entities = simulation.entities.table
+            allowed_actions = character.cancel_graph.get_cancel_mask(
+                entities.action[player], entities.frame[player],
+                entities.last_hit_frame[player] >= 0)
+        else:
+            allowed_actions = None
+
+        for candidate in character.action_index.get_candidates(
+                players.condition[player]):
+            if candidate.meter_needed > players.meter[player]:
+                continue
+            if (allowed_actions is not None and
+                    not (allowed_actions >> candidate.action_index) & 1):
+                continue
+            plans.append(get_action_plan(candidate))
+
+        if players.mode[player] == NEUTRAL:
+            plans.extend(MOVEMENT_PLANS)
+        else:
+            plans.append(IDLE_PLAN)
+
+        return plans
+
+    def score_plan(self, start_snapshot, plan, deadline):
+        """Play a Plan out in the scratch battle and return its score.
+
+        Args:
+            start_snapshot: A snapshot of the real battle's current
+                state, which the scratch battle starts from.
+            plan: The Plan to try.
+            deadline: A float for the time, as given by default_timer(),
+                by which the decision must be made.
+
+        Returns:
+            A float that is higher for better outcomes, or None if the
+            deadline passed before the Plan was played out in full.
+        """
+        scratch = self.scratch
+        scratch.restore(start_snapshot)
+        player = self.player
+        opponent = scratch.get_opponent(player)
+        players = scratch.players
+        start_stamina = players.stamina[player]
+        start_opponent_stamina = players.stamina[opponent]
+        opponent_input = players.held_inputs[opponent]
+
+        input_masks = [0, 0]
+        input_masks[opponent] = opponent_input
+        for position in xrange(0, self.lookahead):
+            input_masks[player] = get_plan_input(plan, position)
+            if scratch.step(input_masks):
+                break
+            elif default_timer() >= deadline:
+                return None
+
+        damage_dealt = start_opponent_stamina - players.stamina[opponent]
+        damage_taken = start_stamina - players.stamina[player]
+        score = ((damage_dealt - damage_taken) * DAMAGE_WEIGHT -
+                 scratch.get_distance(player) * DISTANCE_WEIGHT)
+        if players.mode[player] == RECOILING:
+            score -= RECOIL_PENALTY
+
+        return score
+
+
+class CPUInputs(object):
+    """Produces inputs for a battle in which some of the players are
+    controlled by CPUPlayers.
+
+    Attributes:
+        cpu_players: A list of the CPUPlayers.
+        input_source: A callable that produces the inputs of the other
+            players, such as a RandomInputs object, or None if they
+            hold no buttons.
+    """
+    def __init__(self, cpu_players, input_source=None):
+        """Declare and initialize instance variables.
+
+        Args:
+            cpu_players: A sequence of CPUPlayers.
+            input_source: Optional. A callable that is passed the
+                BattleSimulation and returns the input bitmasks for
+                every player. The bitmasks of players controlled by the
+                CPU are replaced. By default, the other players hold no
+                buttons.
+        """
+        self.cpu_players = list(cpu_players)
+        self.input_source = input_source
+
+    def __call__(self, simulation):
+        """Return a tuple of the bitmask each player holds during the
+        next update cycle.
+
+        Args:
+            simulation: The BattleSimulation being played.
+        """
+        if self.input_source is None:
+            input_masks = [0] * simulation.num_of_players
+        else:
+            input_masks = list(self.input_source(simulation))
+
+        for cpu_player in self.cpu_players:
+            input_masks[cpu_player.player] = cpu_player.get_input_mask(
+                simulation)
+
+        return tuple(input_masks)
+
+
+def get_position_hash(simulation):
+    """Return an integer checksum of the parts of a battle's state that
+    a CPU's decision depends on.
+
+    Unlike BattleSimulation.get_state_hash(), this leaves out the frame
+    count and running totals such as damage dealt, and rounds positions
+    and speeds to whole pixels, so that the same position can come up
+    more than once in a battle.
+
+    Args:
+        simulation: The BattleSimulation being played.
+    """
+    values = array('i')
+
+    entities = simulation.entities.table
+    for slot in xrange(0, entities.capacity):
+        if entities.is_active[slot]:
+            values.extend((slot, entities.model[slot], entities.action[slot],
+                           entities.frame[slot], int(entities.x[slot]),
+                           int(entities.y[slot]),
+                           int(round(entities.x_speed[slot])),
+                           int(round(entities.y_speed[slot])),
+                           entities.is_facing_left[slot],
+                           entities.timer[slot],
+                           entities.last_hit_frame[slot]))
+
+    projectiles = simulation.projectiles.table
+    for slot in xrange(0, projectiles.capacity):
+        if projectiles.is_active[slot]:
+            values.extend((projectiles.definition[slot],
+                           projectiles.owner[slot],
+                           projectiles.frame[slot],
+                           int(projectiles.x[slot]),
+                           int(projectiles.y[slot])))
+
+    players = simulation.players
+    for player in xrange(0, simulation.num_of_players):
+        values.extend((players.mode[player], players.pose[player],
+                       players.condition[player],
+                       players.held_inputs[player], players.meter[player]))
+
+    return zlib.crc32(values.tostring()) & 0xffffffff
+
+
+def get_action_plan(candidate):
+    """Return a Plan that performs an Action by entering its inputs.
+
+    Each input step is held for one update cycle. Buttons are briefly
+    released between two identical steps, so that both are recorded.
+
+    Args:
+        candidate: The ActionCandidate for the Action.
+    """
+    input_masks = []
+    for step_inputs in candidate.input_sequence:
+        input_mask = get_action_input_mask(step_inputs)
+        if len(input_masks) > 0 and input_masks[-1] == input_mask:
+            input_masks.append(0)
+        input_masks.append(input_mask)
+
+    return Plan(tuple(input_masks), False)
+
+
+def get_plan_input(plan, position):
+    """Return the input bitmask a Plan holds during one of its update
+    cycles.
+
+    Args:
+        plan: The Plan.
+        position: An integer for the number of update cycles since the
+            Plan began.
+    """
+    if position < len(plan.input_masks):
+        return plan.input_masks[position]
+    elif plan.is_held:
+        return plan.input_masks[-1]
+    else:
+        return 0
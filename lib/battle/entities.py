@@ -0,0 +1,547 @@
+"""This module contains the EntityStore, which keeps every fighter and
+visual effect on the field during a battle.
+
+Rather than one object per entity, the position, speed, current Action,
+animation progress, timers, and facing of every entity are stored in
+parallel typed arrays, with each entity identified by its slot within
+them. Each update cycle runs a handful of systems that sweep over every
+slot at once: one moves entities according to their current Frame's
+move_x and move_y, one advances their animations along each Action's
+FrameTimeline, and one checks Hitboxes against Hurtboxes. Copying the
+entire store for a snapshot only copies those arrays.
+
+Collision boxes are compiled ahead of time into tuples of plain
+integers for every Frame of every Action, along with the bounds
+enclosing each Frame's boxes. Hit detection first sorts entities by the
+left edge of those bounds and only compares the boxes of entities whose
+bounds overlap, so entities on opposite sides of the stage are never
+compared box-by-box.
+
+Projectiles are kept separately, in a ProjectilePool.
+
+Module Constants:
+    MAX_ENTITIES (int): The default number of entities that can be on
+        the field at once.
+    FIGHTER (int): The kind of entity controlled by a player. Fighters
+        can strike and be struck by each other.
+    EFFECT (int): The kind of entity that is only displayed, such as a
+        hit spark. Effects never collide, and are removed once their
+        animation finishes.
+    ENTITY_COLUMNS (list of tuple): The name and array typecode of each
+        field stored for every entity.
+"""
+from collections import namedtuple
+from lib.battle.array_table import ArrayTable
+from lib.custom_data.character_data import load_frame_timeline
+
+
+MAX_ENTITIES = 16
+FIGHTER = 0
+EFFECT = 1
+ENTITY_COLUMNS = [('kind', 'B'), ('owner', 'b'), ('model', 'i'),
+                  ('action', 'i'), ('tick', 'i'), ('frame', 'i'),
+                  ('is_looping', 'B'), ('has_finished', 'B'),
+                  ('x', 'd'), ('y', 'd'), ('x_speed', 'd'),
+                  ('y_speed', 'd'), ('is_facing_left', 'B'),
+                  ('timer', 'i'), ('last_hit_frame', 'i')]
+
+
+# A Hitbox from one entity overlapping a Hurtbox of another, found
+# during a single update cycle. attacker and defender are entity slots,
+# and hitbox is the Hitbox that landed.
+Hit = namedtuple('Hit', ['attacker', 'defender', 'hitbox'])
+
+
+class EntityModel(object):
+    """The read-only data shared by every entity that performs the same
+    set of Actions, such as a character, compiled into a form the
+    EntityStore's systems can read quickly.
+
+    Every table below is a tuple with one entry per Action, and each
+    entry is a tuple with one value per Frame of that Action.
+
+    Attributes:
+        actions: A list of the Actions.
+        timelines: A tuple of the FrameTimeline for each Action.
+        is_multi_hit: A tuple of Booleans indicating whether each
+            Action may land a hit on every one of its Frames, rather
+            than only once.
+        steps_x: The horizontal distance, in pixels, that each Frame
+            moves its entity per update cycle.
+        steps_y: The vertical distance, in pixels, that each Frame moves
+            its entity per update cycle.
+        hurtboxes: A tuple of (x_offset, y_offset, width, height) tuples
+            for the Hurtboxes on each Frame.
+        hitboxes: A tuple of (x_offset, y_offset, width, height, Hitbox)
+            tuples for the Hitboxes on each Frame.
+        hurt_bounds: The (left, top, right, bottom) bounds enclosing
+            every Hurtbox on each Frame, or None if there are none.
+        hit_bounds: The (left, top, right, bottom) bounds enclosing
+            every Hitbox on each Frame, or None if there are none.
+    """
+    def __init__(self, actions):
+        """Compile the Actions.
+
+        Args:
+            actions: A list of Actions, such as those of a
+                CharacterData object.
+        """
+        self.actions = actions
+
+        timelines = []
+        is_multi_hit = []
+        steps_x = []
+        steps_y = []
+        hurtboxes = []
+        hitboxes = []
+        hurt_bounds = []
+        hit_bounds = []
+
+        for action in actions:
+            if hasattr(action, 'timeline'):
+                timelines.append(action.timeline)
+            else:
+                timelines.append(load_frame_timeline(action))
+            is_multi_hit.append(bool(action.is_multi_hit))
+
+            steps_x.append(tuple(get_step(frame.move_x, frame.duration)
+                                 for frame in action.frames))
+            steps_y.append(tuple(get_step(frame.move_y, frame.duration)
+                                 for frame in action.frames))
+
+            action_hurtboxes = tuple(
+                tuple((box.x_offset, box.y_offset, box.width, box.height)
+                      for box in frame.hurtboxes)
+                for frame in action.frames)
+            action_hitboxes = tuple(
+                tuple((box.x_offset, box.y_offset, box.width, box.height,
+                       box) for box in frame.hitboxes)
+                for frame in action.frames)
+            hurtboxes.append(action_hurtboxes)
+            hitboxes.append(action_hitboxes)
+            hurt_bounds.append(tuple(get_bounds(boxes)
+                                     for boxes in action_hurtboxes))
+            hit_bounds.append(tuple(get_bounds(boxes)
+                                    for boxes in action_hitboxes))
+
+        self.timelines = tuple(timelines)
+        self.is_multi_hit = tuple(is_multi_hit)
+        self.steps_x = tuple(steps_x)
+        self.steps_y = tuple(steps_y)
+        self.hurtboxes = tuple(hurtboxes)
+        self.hitboxes = tuple(hitboxes)
+        self.hurt_bounds = tuple(hurt_bounds)
+        self.hit_bounds = tuple(hit_bounds)
+
+
+class EntityStore(object):
+    """Every fighter and effect on the field, kept in a fixed number of
+    preallocated slots.
+
+    An entity's position is the point its Frames' box offsets are
+    measured from. When an entity faces left, its boxes are mirrored
+    horizontally about that point, and its x_speed is measured in the
+    direction it faces.
+
+    Attributes:
+        table: The ArrayTable holding every entity's fields. See
+            ENTITY_COLUMNS for the names of its columns.
+        models: A list of the EntityModels that have been added. An
+            entity's model column holds an index into this list.
+        stage_width: An integer for the width of the stage, in pixels.
+            Fighters are kept between its edges.
+    """
+    def __init__(self, stage_width, capacity=MAX_ENTITIES):
+        """Allocate the store.
+
+        Args:
+            stage_width: An integer for the width of the stage, in
+                pixels.
+            capacity: Optional. An integer for the number of entities
+                that can be on the field at once. The default is
+                MAX_ENTITIES.
+        """
+        self.table = ArrayTable(capacity, ENTITY_COLUMNS)
+        self.models = []
+        self.stage_width = stage_width
+
+    def add_model(self, actions):
+        """Compile a set of Actions so that entities can perform them.
+
+        Args:
+            actions: A list of Actions, such as those of a
+                CharacterData object.
+
+        Returns:
+            An integer for the index of the new EntityModel within
+            models.
+        """
+        self.models.append(EntityModel(actions))
+        return len(self.models) - 1
+
+    def spawn(self, kind, owner, model_id, action_index, x, y,
+              is_facing_left, is_looping=False):
+        """Place a new entity on the field.
+
+        Args:
+            kind: An integer for the kind of entity. This can be either
+                FIGHTER or EFFECT.
+            owner: An integer for the index of the player the entity
+                belongs to.
+            model_id: An integer for the index of the entity's
+                EntityModel within models.
+            action_index: An integer for the index of the Action the
+                entity starts with.
+            x: A number for the entity's starting x-position.
+            y: A number for the entity's starting y-position.
+            is_facing_left: A Boolean indicating whether the entity
+                faces to the left.
+            is_looping: Optional. A Boolean indicating whether the
+                starting Action repeats once it finishes. The default
+                is False.
+
+        Returns:
+            An integer for the entity's slot, or -1 if the store is
+            full.
+        """
+        slot = self.table.allocate()
+        if slot < 0:
+            return -1
+
+        table = self.table
+        table.kind[slot] = kind
+        table.owner[slot] = owner
+        table.model[slot] = model_id
+        table.x[slot] = x
+        table.y[slot] = y
+        table.x_speed[slot] = 0
+        table.y_speed[slot] = 0
+        table.is_facing_left[slot] = is_facing_left
+        table.timer[slot] = 0
+        self.set_action(slot, action_index, is_looping)
+
+        return slot
+
+    def despawn(self, slot):
+        """Remove an entity from the field.
+
+        Args:
+            slot: An integer for the entity's slot.
+        """
+        self.table.release(slot)
+
+    def set_action(self, slot, action_index, is_looping=False):
+        """Start an entity performing an Action from its first Frame.
+
+        Args:
+            slot: An integer for the entity's slot.
+            action_index: An integer for the index of the Action.
+            is_looping: Optional. A Boolean indicating whether the
+                Action repeats once it finishes. The default is False.
+        """
+        table = self.table
+        table.action[slot] = action_index
+        table.tick[slot] = 0
+        table.frame[slot] = 0
+        table.is_looping[slot] = is_looping
+        table.has_finished[slot] = 0
+        table.last_hit_frame[slot] = -1
+
+    def get_frame(self, slot):
+        """Return the Frame an entity is currently showing.
+
+        Args:
+            slot: An integer for the entity's slot.
+        """
+        table = self.table
+        action = self.models[table.model[slot]].actions[table.action[slot]]
+        return action.frames[table.frame[slot]]
+
+    def update(self):
+        """Run every system over all entities for one update cycle."""
+        self.update_movement()
+        self.update_animation()
+        self.update_timers()
+
+    def update_movement(self):
+        """Move every entity by its current Frame's movement plus its
+        own speed, then keep fighters within the stage.
+        """
+        table = self.table
+        is_active = table.is_active
+        models = self.models
+        stage_width = self.stage_width
+
+        for slot in xrange(0, table.capacity):
+            if not is_active[slot]:
+                continue
+
+            model = models[table.model[slot]]
+            action_index = table.action[slot]
+            frame_index = table.frame[slot]
+
+            step_x = model.steps_x[action_index][frame_index]
+            if table.is_facing_left[slot]:
+                step_x = -step_x - table.x_speed[slot]
+            else:
+                step_x += table.x_speed[slot]
+            x = table.x[slot] + step_x
+
+            if table.kind[slot] == FIGHTER:
+                x = max(0, min(x, stage_width))
+            table.x[slot] = x
+            table.y[slot] += (model.steps_y[action_index][frame_index] +
+                              table.y_speed[slot])
+
+    def update_animation(self):
+        """Advance every entity's Action by one update cycle.
+
+        Entities whose Action ends without looping hold its final Frame
+        and are marked as finished. Effects are removed instead.
+        """
+        table = self.table
+        is_active = table.is_active
+        models = self.models
+
+        for slot in xrange(0, table.capacity):
+            if not is_active[slot] or table.has_finished[slot]:
+                continue
+
+            timeline = models[table.model[slot]].timelines[table.action[slot]]
+            tick = table.tick[slot] + 1
+
+            if tick >= timeline.total_duration:
+                if table.is_looping[slot]:
+                    tick = timeline.wrap_tick(tick)
+                elif table.kind[slot] == EFFECT:
+                    table.release(slot)
+                    continue
+                else:
+                    table.has_finished[slot] = 1
+                    tick = timeline.wrap_tick(tick, False)
+
+            table.tick[slot] = tick
+            table.frame[slot] = timeline.get_frame_index(tick, False)
+
+    def update_timers(self):
+        """Count down every entity's timer, such as one for hitstun,
+        until it reaches 0.
+        """
+        table = self.table
+        is_active = table.is_active
+        timer = table.timer
+
+        for slot in xrange(0, table.capacity):
+            if is_active[slot] and timer[slot] > 0:
+                timer[slot] -= 1
+
+    def get_world_bounds(self, slot, bounds):
+        """Return a Frame's box bounds moved to an entity's position on
+        the stage.
+
+        Args:
+            slot: An integer for the entity's slot.
+            bounds: A (left, top, right, bottom) tuple relative to the
+                entity, from one of an EntityModel's bounds tables.
+
+        Returns:
+            A (left, top, right, bottom) tuple of stage coordinates.
+        """
+        table = self.table
+        x = table.x[slot]
+        y = table.y[slot]
+        left, top, right, bottom = bounds
+
+        if table.is_facing_left[slot]:
+            return (x - right, y + top, x - left, y + bottom)
+        else:
+            return (x + left, y + top, x + right, y + bottom)
+
+    def find_hits(self):
+        """Find every Hitbox that lands on another player's fighter
+        during this update cycle.
+
+        Each Action lands at most one hit, unless it is multi-hit, in
+        which case each of its Frames may land one. Every hit found is
+        recorded so that the same Frame won't land it again.
+
+        Returns:
+            A list of Hit tuples.
+        """
+        table = self.table
+        is_active = table.is_active
+        models = self.models
+        attackers = []
+        defenders = []
+
+        for slot in xrange(0, table.capacity):
+            if not is_active[slot] or table.kind[slot] != FIGHTER:
+                continue
+
+            model = models[table.model[slot]]
+            action_index = table.action[slot]
+            frame_index = table.frame[slot]
+
+            hurt_bounds = model.hurt_bounds[action_index][frame_index]
+            if hurt_bounds is not None:
+                defenders.append(self.get_world_bounds(slot, hurt_bounds) +
+                                 (slot,))
+
+            hit_bounds = model.hit_bounds[action_index][frame_index]
+            last_hit_frame = table.last_hit_frame[slot]
+            if hit_bounds is None or last_hit_frame == frame_index:
+                continue
+            if last_hit_frame >= 0 and not model.is_multi_hit[action_index]:
+                continue
+            attackers.append(self.get_world_bounds(slot, hit_bounds) +
+                             (slot,))
+
+        hits = []
+        if len(attackers) <= 0 or len(defenders) <= 0:
+            return hits
+
+        # Sweep across the stage from left to right, only comparing
+        # pairs whose bounds overlap horizontally.
+        defenders.sort()
+        for left, top, right, bottom, attacker in sorted(attackers):
+            for defender_bounds in defenders:
+                if defender_bounds[0] >= right:
+                    break
+
+                defender = defender_bounds[4]
+                if (defender_bounds[2] <= left or
+                        table.owner[defender] == table.owner[attacker] or
+                        defender_bounds[1] >= bottom or
+                        defender_bounds[3] <= top):
+                    continue
+
+                hitbox = self.find_landed_hitbox(attacker, defender)
+                if hitbox is not None:
+                    table.last_hit_frame[attacker] = table.frame[attacker]
+                    hits.append(Hit(attacker, defender, hitbox))
+                    break
+
+        return hits
+
+    def find_landed_hitbox(self, attacker, defender):
+        """Return the first of an entity's current Hitboxes that
+        overlaps any of another entity's current Hurtboxes.
+
+        Args:
+            attacker: An integer for the slot of the striking entity.
+            defender: An integer for the slot of the struck entity.
+
+        Returns:
+            The Hitbox that landed, or None if none of them did.
+        """
+        hurt_rects = [self.get_box_rect(defender, box)
+                      for box in self.get_compiled_boxes(defender, False)]
+
+        for box in self.get_compiled_boxes(attacker, True):
+            left, top, right, bottom = self.get_box_rect(attacker, box)
+            for hurt_left, hurt_top, hurt_right, hurt_bottom in hurt_rects:
+                if (left < hurt_right and right > hurt_left and
+                        top < hurt_bottom and bottom > hurt_top):
+                    return box[4]
+
+        return None
+
+    def get_compiled_boxes(self, slot, is_hitboxes):
+        """Return the compiled boxes on an entity's current Frame.
+
+        Args:
+            slot: An integer for the entity's slot.
+            is_hitboxes: A Boolean indicating whether to return the
+                Frame's Hitboxes. If False, its Hurtboxes are returned.
+        """
+        table = self.table
+        model = self.models[table.model[slot]]
+        if is_hitboxes:
+            boxes = model.hitboxes
+        else:
+            boxes = model.hurtboxes
+
+        return boxes[table.action[slot]][table.frame[slot]]
+
+    def get_box_rect(self, slot, box):
+        """Return the stage coordinates of a compiled box on an entity.
+
+        Args:
+            slot: An integer for the entity's slot.
+            box: A compiled box tuple, beginning with its x_offset,
+                y_offset, width, and height.
+
+        Returns:
+            A (left, top, right, bottom) tuple.
+        """
+        table = self.table
+        x = table.x[slot]
+        top = table.y[slot] + box[1]
+
+        if table.is_facing_left[slot]:
+            left = x - box[0] - box[2]
+        else:
+            left = x + box[0]
+
+        return (left, top, left + box[2], top + box[3])
+
+    def snapshot(self):
+        """Return a copy of the state of every entity, which can be
+        passed to restore() later.
+        """
+        return self.table.snapshot()
+
+    def restore(self, snapshot):
+        """Return every entity to the state it had when a snapshot was
+        taken.
+
+        Args:
+            snapshot: A value returned by snapshot() on this store.
+        """
+        self.table.restore(snapshot)
+
+    def clone(self):
+        """Return a new EntityStore holding a copy of every entity.
+
+        The clone shares this store's EntityModels, so snapshots taken
+        from either store can be restored into the other.
+        """
+        store_clone = EntityStore(self.stage_width, self.table.capacity)
+        store_clone.table = self.table.clone()
+        store_clone.models = self.models
+        return store_clone
+
+
+def get_step(distance, duration):
+    """Return the distance to move during each update cycle of a Frame.
+
+    Args:
+        distance: An integer for the distance moved over the whole
+            Frame.
+        duration: An integer for the Frame's duration, in update cycles.
+    """
+    if duration <= 0:
+        return 0.0
+    else:
+        return float(distance) / duration
+
+
+def get_bounds(boxes):
+    """Return the smallest rectangle enclosing a set of compiled boxes,
+    relative to the entity they're on.
+
+    Args:
+        boxes: A tuple of compiled box tuples, each beginning with its
+            x_offset, y_offset, width, and height.
+
+    Returns:
+        A (left, top, right, bottom) tuple, or None if there are no
+        boxes.
+    """
+    if len(boxes) <= 0:
+        return None
+
+    return (min(box[0] for box in boxes),
+            min(box[1] for box in boxes),
+            max(box[0] + box[2] for box in boxes),
+            max(box[1] + box[3] for box in boxes))
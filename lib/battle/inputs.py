@@ -0,0 +1,177 @@
+"""This module encodes the buttons a player holds during one update
+cycle as a single integer bitmask, and provides sources of inputs for
+battles that aren't controlled from the keyboard.
+
+Each of the buttons in INPUT_NAMES is given one bit, in the order they
+are listed there. Bitmasks are small enough to be stored in typed
+arrays and sent over the network, and are converted back into the
+button names used by character files only when an Action's inputs need
+to be compared.
+
+Module Constants:
+    INPUT_BITS (dict of String: int): Maps the name of each button in
+        INPUT_NAMES to its bit within an input bitmask.
+    ACTION_INPUT_NAMES (tuple of String): The name of each button as it
+        is written in the input steps of character files, in the same
+        order as INPUT_NAMES. e.g. 'light_punch' => 'Light Punch'
+    BATTLE_BUTTONS (tuple of String): The buttons that can be pressed
+        during battle, as opposed to those that only navigate menus.
+"""
+from random import Random
+from customize.globals import INPUT_NAMES
+
+
+INPUT_BITS = dict((name, 1 << bit) for bit, name in enumerate(INPUT_NAMES))
+ACTION_INPUT_NAMES = tuple(name.replace('_', ' ').title()
+                           for name in INPUT_NAMES)
+BATTLE_BUTTONS = ('up', 'back', 'down', 'forward', 'light_punch',
+                  'medium_punch', 'heavy_punch', 'light_kick',
+                  'medium_kick', 'heavy_kick')
+
+_action_input_sets = {}
+
+
+def get_input_mask(input_names):
+    """Return the bitmask for a set of held buttons.
+
+    Args:
+        input_names: An iterable of Strings for the names of the held
+            buttons, as listed in INPUT_NAMES.
+    """
+    input_mask = 0
+    for name in input_names:
+        input_mask |= INPUT_BITS[name]
+
+    return input_mask
+
+
+def is_held(input_mask, input_name):
+    """Return a Boolean indicating whether a button is held within a
+    bitmask.
+
+    Args:
+        input_mask: An integer bitmask of held buttons.
+        input_name: A String for the name of the button, as listed in
+            INPUT_NAMES.
+    """
+    return input_mask & INPUT_BITS[input_name] != 0
+
+
+def get_action_input_mask(action_inputs):
+    """Return the bitmask for a set of buttons named as they are in
+    the input steps of character files.
+
+    Args:
+        action_inputs: An iterable of Strings for the names of the
+            buttons, such as 'Light Punch'. Unknown names are ignored.
+    """
+    input_mask = 0
+    for bit, name in enumerate(ACTION_INPUT_NAMES):
+        if name in action_inputs:
+            input_mask |= 1 << bit
+
+    return input_mask
+
+
+def get_action_inputs(input_mask):
+    """Return a frozenset of the names of the buttons within a bitmask,
+    as they are written in the input steps of character files.
+
+    The same frozenset is returned every time for the same bitmask.
+
+    Args:
+        input_mask: An integer bitmask of held buttons.
+    """
+    if input_mask not in _action_input_sets:
+        _action_input_sets[input_mask] = frozenset(
+            name for bit, name in enumerate(ACTION_INPUT_NAMES)
+            if input_mask & (1 << bit))
+
+    return _action_input_sets[input_mask]
+
+
+class RandomInputs(object):
+    """Produces random inputs for every player in a battle.
+
+    Each player holds their buttons for several update cycles before
+    switching to new ones, much like a person mashing buttons would.
+    The inputs depend only on the seed, so a battle can be replayed
+    exactly.
+
+    Attributes:
+        random: The Random number generator.
+        change_chance: A float between 0 and 1 for the chance, on each
+            update cycle, that a player switches to new buttons.
+        held_masks: A list of the bitmask each player is holding.
+        button_masks: A tuple of the bitmask for each of the
+            BATTLE_BUTTONS.
+    """
+    def __init__(self, seed, num_of_players=2, change_chance=0.15):
+        """Declare and initialize instance variables.
+
+        Args:
+            seed: A hashable value for seeding the number generator.
+            num_of_players: Optional. An integer for the number of
+                players to produce inputs for. The default is 2.
+            change_chance: Optional. A float between 0 and 1 for the
+                chance, on each update cycle, that a player switches to
+                new buttons. The default is 0.15.
+        """
+        self.random = Random(seed)
+        self.change_chance = change_chance
+        self.held_masks = [0] * num_of_players
+        self.button_masks = tuple(INPUT_BITS[name] for name in BATTLE_BUTTONS)
+
+    def __call__(self, simulation):
+        """Return a tuple of the bitmask each player holds during the
+        next update cycle.
+
+        Args:
+            simulation: The BattleSimulation the inputs are for. It
+                isn't read; any battle can be given.
+        """
+        for player in xrange(0, len(self.held_masks)):
+            if self.random.random() < self.change_chance:
+                new_mask = 0
+                for button_mask in self.random.sample(
+                        self.button_masks, self.random.randint(0, 2)):
+                    new_mask |= button_mask
+                self.held_masks[player] = new_mask
+
+        return tuple(self.held_masks)
+
+
+class ScriptedInputs(object):
+    """Produces inputs for every player from a predetermined script.
+
+    Attributes:
+        script: A list of tuples, each containing the bitmask held by
+            every player during one update cycle.
+        position: An integer for the index of the next entry in script.
+    """
+    def __init__(self, script):
+        """Declare and initialize instance variables.
+
+        Args:
+            script: A sequence of tuples, each containing the bitmask
+                held by every player during one update cycle. Once the
+                script runs out, its last entry is held indefinitely.
+        """
+        self.script = list(script)
+        self.position = 0
+
+    def __call__(self, simulation):
+        """Return a tuple of the bitmask each player holds during the
+        next update cycle.
+
+        Args:
+            simulation: The BattleSimulation the inputs are for. The
+                neutral inputs for its players are returned if the
+                script is empty.
+        """
+        if len(self.script) <= 0:
+            return (0,) * simulation.num_of_players
+
+        input_masks = self.script[min(self.position, len(self.script) - 1)]
+        self.position += 1
+        return input_masks
@@ -0,0 +1,292 @@
+"""This module plays large numbers of headless battles in parallel, for
+balancing characters and for benchmarking the battle engine.
+
+Every pairing of characters in the roster, including mirror matches,
+is played the requested number of times with random inputs. Each pair
+of different characters is played in both seat orders and kept as two
+separate matchups, so that any advantage of starting on one side shows
+up in the statistics rather than being mixed into them. Battles are
+spread across a pool of worker processes, one per processor core by
+default, and each worker loads every character and stage it needs only
+once. The results are gathered into per-matchup statistics.
+
+To play 100 battles of every pairing on the first stage, run:
+
+    python -m lib.battle.match_runner --matches 100
+
+Module Constants:
+    MATCHES_PER_PAIRING (int): The default number of battles played for
+        each pairing of characters.
+"""
+import sys
+import json
+import time
+import argparse
+from itertools import product
+from multiprocessing import Pool, cpu_count
+from lib.battle.inputs import RandomInputs
+from lib.battle.simulation import BattleSimulation, TIME_LIMIT
+from lib.custom_data.character_loader import (load_character,
+                                              CHARACTER_LIST_PATH)
+from lib.custom_data.stage_loader import load_stage
+from lib.custom_data.text_ops import num_of_lines_in_txt
+
+
+MATCHES_PER_PAIRING = 100
+
+# The data loaded so far by this process, keyed by line index.
+_characters = {}
+_stages = {}
+
+
+def get_character(line_index):
+    """Return a character's data, loading it only the first time it is
+    requested by this process.
+
+    Args:
+        line_index: An integer for the line index of the character's
+            file path within the character list text file.
+    """
+    if line_index not in _characters:
+        _characters[line_index] = load_character(line_index)
+    return _characters[line_index]
+
+
+def get_stage(line_index):
+    """Return a stage's data, loading it only the first time it is
+    requested by this process.
+
+    Args:
+        line_index: An integer for the line index of the stage's file
+            path within the stage list text file.
+    """
+    if line_index not in _stages:
+        _stages[line_index] = load_stage(line_index)
+    return _stages[line_index]
+
+
+def run_match(match):
+    """Play a single battle with random inputs.
+
+    Args:
+        match: A tuple containing the line indexes of the first and
+            second characters, the line index of the stage, the seed
+            for the random inputs, and the battle's time limit in
+            update cycles.
+
+    Returns:
+        A tuple containing the line indexes of both characters and the
+        battle's MatchResult.
+    """
+    first_index, second_index, stage_index, seed, time_limit = match
+    simulation = BattleSimulation((get_character(first_index),
+                                   get_character(second_index)),
+                                  get_stage(stage_index),
+                                  time_limit=time_limit)
+    result = simulation.run(RandomInputs(seed))
+    return (first_index, second_index, result)
+
+
+class MatchupStats(object):
+    """The combined results of every battle played between two
+    characters.
+
+    Attributes:
+        first_name: A String for the name of the character who played
+            as player 0.
+        second_name: A String for the name of the character who played
+            as player 1.
+        num_of_matches: An integer for the number of battles played.
+        wins: An integer for the number of battles won by the first
+            character.
+        losses: An integer for the number of battles won by the second
+            character.
+        draws: An integer for the number of battles that were draws.
+        total_frames: An integer for the number of update cycles played
+            across every battle.
+        total_hits: A list of the number of hits landed by each
+            character across every battle.
+        total_damage: A list of the damage dealt by each character
+            across every battle.
+    """
+    def __init__(self, first_name, second_name):
+        """Declare and initialize instance variables.
+
+        Args:
+            first_name: A String for the name of the first character.
+            second_name: A String for the name of the second character.
+        """
+        self.first_name = first_name
+        self.second_name = second_name
+        self.num_of_matches = 0
+        self.wins = 0
+        self.losses = 0
+        self.draws = 0
+        self.total_frames = 0
+        self.total_hits = [0, 0]
+        self.total_damage = [0, 0]
+
+    def add_result(self, result):
+        """Count the result of another battle.
+
+        Args:
+            result: A MatchResult for the battle.
+        """
+        self.num_of_matches += 1
+        if result.winner == 0:
+            self.wins += 1
+        elif result.winner == 1:
+            self.losses += 1
+        else:
+            self.draws += 1
+
+        self.total_frames += result.num_of_frames
+        for player in (0, 1):
+            self.total_hits[player] += result.hits_landed[player]
+            self.total_damage[player] += result.damage_dealt[player]
+
+    def get_win_rate(self):
+        """Return a float for the fraction of battles won by the first
+        character, counting each draw as half of a win.
+        """
+        if self.num_of_matches <= 0:
+            return 0.0
+        return (self.wins + 0.5 * self.draws) / self.num_of_matches
+
+    def get_average_frames(self):
+        """Return a float for the average length of a battle, in update
+        cycles.
+        """
+        if self.num_of_matches <= 0:
+            return 0.0
+        return float(self.total_frames) / self.num_of_matches
+
+    def to_dict(self):
+        """Return a dict of these statistics that can be written as
+        JSON.
+        """
+        return {'first': self.first_name, 'second': self.second_name,
+                'matches': self.num_of_matches, 'wins': self.wins,
+                'losses': self.losses, 'draws': self.draws,
+                'win_rate': self.get_win_rate(),
+                'average_frames': self.get_average_frames(),
+                'hits': self.total_hits, 'damage': self.total_damage}
+
+
+def run_matches(character_indexes, stage_index, matches_per_pairing,
+                num_of_processes=None, seed=0, time_limit=TIME_LIMIT):
+    """Play every pairing of a set of characters many times over,
+    spread across several processes. Each pair of different characters
+    is played in both seat orders.
+
+    Args:
+        character_indexes: A list of the line indexes of the characters
+            to play, within the character list text file.
+        stage_index: An integer for the line index of the stage to
+            play on, within the stage list text file.
+        matches_per_pairing: An integer for the number of battles to
+            play for each pairing.
+        num_of_processes: Optional. An integer for the number of worker
+            processes. The default is the number of processor cores.
+        seed: Optional. An integer added to every battle's seed, so
+            that different runs can play different battles. The default
+            is 0.
+        time_limit: Optional. An integer for each battle's time limit,
+            in update cycles. The default is TIME_LIMIT.
+
+    Returns:
+        A dict mapping a tuple of the line indexes of each pairing's
+        characters, with player 0's first, to its MatchupStats.
+    """
+    matches = []
+    for first_index, second_index in product(character_indexes,
+                                             repeat=2):
+        for match_num in xrange(0, matches_per_pairing):
+            matches.append((first_index, second_index, stage_index,
+                            seed + len(matches), time_limit))
+
+    matchup_stats = {}
+    for first_index, second_index in product(character_indexes,
+                                             repeat=2):
+        matchup_stats[(first_index, second_index)] = MatchupStats(
+            get_character(first_index).name,
+            get_character(second_index).name)
+
+    if num_of_processes is None:
+        num_of_processes = cpu_count()
+    chunk_size = max(1, len(matches) // (num_of_processes * 4))
+
+    pool = Pool(num_of_processes)
+    try:
+        for first_index, second_index, result in pool.imap_unordered(
+                run_match, matches, chunk_size):
+            matchup_stats[(first_index, second_index)].add_result(result)
+    finally:
+        pool.close()
+        pool.join()
+
+    return matchup_stats
+
+
+def main(argv):
+    """Play every pairing in the roster from the command line, and
+    print each matchup's statistics.
+
+    Args:
+        argv: A list of Strings for the command-line arguments, not
+            including the program name.
+    """
+    parser = argparse.ArgumentParser(
+        description='Play headless battles between every pairing of '
+                    'characters with random inputs.')
+    parser.add_argument('--matches', type=int, default=MATCHES_PER_PAIRING,
+                        help='The number of battles for each pairing.')
+    parser.add_argument('--processes', type=int, default=None,
+                        help='The number of worker processes.')
+    parser.add_argument('--stage', type=int, default=0,
+                        help='The line index of the stage to play on.')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='The seed for the random inputs.')
+    parser.add_argument('--time-limit', type=int, default=TIME_LIMIT,
+                        help='The length of each battle, in frames.')
+    parser.add_argument('--json', dest='json_path', default=None,
+                        help='A file path to write the statistics to as '
+                             'JSON.')
+    args = parser.parse_args(argv)
+
+    if get_stage(args.stage) is None:
+        print 'Could not load stage %d.' % args.stage
+        return
+    character_indexes = [line_index for line_index
+                         in xrange(0, num_of_lines_in_txt(CHARACTER_LIST_PATH))
+                         if get_character(line_index) is not None]
+    if len(character_indexes) <= 0:
+        print 'No characters could be loaded.'
+        return
+
+    start_time = time.time()
+    matchup_stats = run_matches(character_indexes, args.stage, args.matches,
+                                args.processes, args.seed, args.time_limit)
+    elapsed_time = time.time() - start_time
+
+    total_frames = 0
+    for matchup in sorted(matchup_stats):
+        stats = matchup_stats[matchup]
+        total_frames += stats.total_frames
+        print '%-20s vs %-20s  %5.1f%% (%d-%d-%d)  %7.1f frames' % (
+            stats.first_name, stats.second_name,
+            stats.get_win_rate() * 100, stats.wins, stats.losses,
+            stats.draws, stats.get_average_frames())
+
+    print 'Played %d frames in %.2f seconds (%.0f frames/second).' % (
+        total_frames, elapsed_time, total_frames / max(elapsed_time, 0.001))
+
+    if args.json_path is not None:
+        with open(args.json_path, 'w') as json_file:
+            json.dump([matchup_stats[matchup].to_dict()
+                       for matchup in sorted(matchup_stats)],
+                      json_file, indent=2)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,669 @@
+"""This module plays a battle between two machines over the network with
+rollback netcode.
+
+Each machine runs its own BattleSimulation and only sends its player's
+input bitmasks to the other, over UDP. Rather than waiting for the
+remote player's inputs to arrive, a RollbackSession predicts that they
+are still holding whatever they held last, and keeps playing. When the
+real inputs arrive and turn out to differ from the prediction, the
+battle is restored to a snapshot taken just before the first wrong
+frame and is quickly simulated forward again with the correct inputs,
+all within a single display frame.
+
+Every packet repeats all of the inputs the other side hasn't confirmed
+receiving yet, so lost packets are made up for by the ones that follow.
+Packets also carry the checksum of the last frame whose inputs are
+known to both sides. If the two machines' checksums for the same frame
+ever differ, their battles have desynchronized, which is recorded in
+the session's NetplayMetrics.
+
+A LoopbackTransport can be used in place of a UDPTransport to run both
+sides on one machine, with simulated latency, jitter, and packet loss.
+To play a battle between two sessions on this machine with random
+inputs, run:
+
+    python -m lib.battle.netplay --latency 0.06 --jitter 0.02 --loss 0.05
+
+Module Constants:
+    MAX_ROLLBACK_FRAMES (int): The default number of frames a session
+        may run ahead of the last remote inputs it received before it
+        waits for them.
+    INPUT_DELAY (int): The default number of frames between a local
+        input and the frame it applies to.
+    HISTORY_SIZE (int): The number of recent frames whose inputs,
+        snapshots, and checksums are kept.
+    MAX_INPUTS_PER_PACKET (int): The most inputs sent in one packet.
+    PACKET_HEADER (Struct): The layout of the start of every packet. It
+        contains the frame of the first input in the packet, the last
+        remote frame the sender has received every input up to, the
+        frame of the sender's latest confirmed checksum, that checksum,
+        and the number of inputs that follow.
+"""
+import sys
+import heapq
+import socket
+import struct
+import argparse
+from array import array
+from random import Random
+from timeit import default_timer
+from customize.globals import FRAME_RATE
+
+
+MAX_ROLLBACK_FRAMES = 8
+INPUT_DELAY = 2
+HISTORY_SIZE = 64
+MAX_INPUTS_PER_PACKET = 32
+PACKET_HEADER = struct.Struct('!iiiIB')
+
+
+class UDPTransport(object):
+    """Sends and receives packets over UDP without blocking.
+
+    Attributes:
+        sock: The UDP socket.
+        remote_address: A tuple containing the host and port of the
+            other machine.
+    """
+    def __init__(self, local_address, remote_address):
+        """Open the socket.
+
+        Args:
+            local_address: A tuple containing the host and port to
+                receive packets on.
+            remote_address: A tuple containing the host and port of the
+                other machine.
+        """
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind(local_address)
+        self.sock.setblocking(False)
+        self.remote_address = remote_address
+
+    def send(self, packet):
+        """Send a packet to the other machine.
+
+        Args:
+            packet: A String of the packet's bytes.
+        """
+        try:
+            self.sock.sendto(packet, self.remote_address)
+        except socket.error:
+            # UDP makes no promises anyway; the next packet will repeat
+            # this one's inputs.
+            pass
+
+    def receive(self):
+        """Return a list of every packet that has arrived since the last
+        call, as Strings.
+        """
+        packets = []
+        while True:
+            try:
+                packet, address = self.sock.recvfrom(4096)
+            except socket.error:
+                break
+            if address == self.remote_address:
+                packets.append(packet)
+
+        return packets
+
+    def close(self):
+        """Close the socket."""
+        self.sock.close()
+
+
+class LoopbackTransport(object):
+    """One end of a simulated network link between two sessions on the
+    same machine.
+
+    Packets sent from one end arrive at the other after a delay of
+    latency, plus or minus a random amount up to jitter, so they may
+    arrive out of order. Each packet may also be lost altogether.
+
+    Attributes:
+        peer: The LoopbackTransport at the other end of the link.
+        latency: A float for the average delay of a packet, in seconds.
+        jitter: A float for the most a packet's delay can differ from
+            latency, in seconds.
+        loss: A float between 0 and 1 for the chance that a packet is
+            lost.
+        random: The Random number generator for jitter and loss.
+        clock: A callable returning the current time, in seconds.
+        in_flight: A heap of tuples, each containing the arrival time,
+            a sequence number, and the bytes of a packet on its way to
+            this end.
+        num_sent: An integer for the number of packets sent from this
+            end.
+        num_lost: An integer for the number of those packets that were
+            lost.
+    """
+    def __init__(self, latency, jitter, loss, random, clock):
+        """Declare and initialize instance variables.
+
+        Args:
+            latency: A float for the average delay of a packet, in
+                seconds.
+            jitter: A float for the most a packet's delay can differ
+                from latency, in seconds.
+            loss: A float between 0 and 1 for the chance that a packet
+                is lost.
+            random: The Random number generator for jitter and loss.
+            clock: A callable returning the current time, in seconds.
+        """
+        self.peer = None
+        self.latency = latency
+        self.jitter = jitter
+        self.loss = loss
+        self.random = random
+        self.clock = clock
+        self.in_flight = []
+        self.num_sent = 0
+        self.num_lost = 0
+
+    def send(self, packet):
+        """Send a packet to the other end of the link.
+
+        Args:
+            packet: A String of the packet's bytes.
+        """
+        self.num_sent += 1
+        if self.random.random() < self.loss:
+            self.num_lost += 1
+            return
+
+        delay = max(0.0, self.latency + self.random.uniform(-self.jitter,
+                                                            self.jitter))
+        heapq.heappush(self.peer.in_flight, (self.clock() + delay,
+                                             self.num_sent, packet))
+
+    def receive(self):
+        """Return a list of every packet that has arrived at this end
+        since the last call, as Strings.
+        """
+        packets = []
+        current_time = self.clock()
+        while len(self.in_flight) > 0 and self.in_flight[0][0] <= current_time:
+            packets.append(heapq.heappop(self.in_flight)[2])
+
+        return packets
+
+    def close(self):
+        """Discard every packet still on its way to this end."""
+        del self.in_flight[:]
+
+
+def create_loopback_pair(latency=0.0, jitter=0.0, loss=0.0, seed=0,
+                         clock=default_timer):
+    """Return both ends of a simulated network link.
+
+    Args:
+        latency: Optional. A float for the average delay of a packet, in
+            seconds. The default is 0.
+        jitter: Optional. A float for the most a packet's delay can
+            differ from latency, in seconds. The default is 0.
+        loss: Optional. A float between 0 and 1 for the chance that a
+            packet is lost. The default is 0.
+        seed: Optional. A hashable value for seeding the number
+            generator used for jitter and loss. The default is 0.
+        clock: Optional. A callable returning the current time, in
+            seconds. The default is the system's timer; a ManualClock
+            makes the link's behaviour fully repeatable.
+
+    Returns:
+        A tuple containing two LoopbackTransports connected to each
+        other.
+    """
+    random = Random(seed)
+    first_end = LoopbackTransport(latency, jitter, loss, random, clock)
+    second_end = LoopbackTransport(latency, jitter, loss, random, clock)
+    first_end.peer = second_end
+    second_end.peer = first_end
+    return (first_end, second_end)
+
+
+class ManualClock(object):
+    """A clock that only moves forward when told to.
+
+    Attributes:
+        time: A float for the current time, in seconds.
+    """
+    def __init__(self):
+        """Declare and initialize instance variables."""
+        self.time = 0.0
+
+    def __call__(self):
+        """Return the current time, in seconds."""
+        return self.time
+
+    def advance(self, seconds):
+        """Move the clock forward.
+
+        Args:
+            seconds: A float for the amount of time to move forward.
+        """
+        self.time += seconds
+
+
+class NetplayMetrics(object):
+    """Measurements of how a RollbackSession has performed.
+
+    Attributes:
+        frames_advanced: An integer for the number of frames played.
+        frames_stalled: An integer for the number of display frames the
+            session waited for remote inputs instead of playing.
+        num_of_rollbacks: An integer for the number of times a wrong
+            prediction was rolled back.
+        total_rollback_frames: An integer for the number of frames
+            simulated again across every rollback.
+        max_rollback_depth: An integer for the most frames simulated
+            again in a single rollback.
+        total_resimulation_time: A float for the time, in seconds,
+            spent simulating frames again across every rollback.
+        max_resimulation_time: A float for the longest time, in seconds,
+            spent on a single rollback.
+        packets_sent: An integer for the number of packets sent.
+        packets_received: An integer for the number of packets received.
+        num_of_desyncs: An integer for the number of confirmed frames
+            whose checksum differed between the two machines.
+        first_desync_frame: An integer for the first frame found to have
+            desynchronized, or -1 if none have.
+        last_checked_frame: An integer for the latest frame whose
+            checksum was compared with the other machine's, or -1.
+    """
+    def __init__(self):
+        """Declare and initialize instance variables."""
+        self.frames_advanced = 0
+        self.frames_stalled = 0
+        self.num_of_rollbacks = 0
+        self.total_rollback_frames = 0
+        self.max_rollback_depth = 0
+        self.total_resimulation_time = 0.0
+        self.max_resimulation_time = 0.0
+        self.packets_sent = 0
+        self.packets_received = 0
+        self.num_of_desyncs = 0
+        self.first_desync_frame = -1
+        self.last_checked_frame = -1
+
+    def get_average_rollback_depth(self):
+        """Return a float for the average number of frames simulated
+        again per rollback.
+        """
+        if self.num_of_rollbacks <= 0:
+            return 0.0
+        return float(self.total_rollback_frames) / self.num_of_rollbacks
+
+
+class RollbackSession(object):
+    """One machine's side of a battle played over the network.
+
+    The frame numbers used here are the same as the simulation's
+    frame_count: frame f is the update cycle that takes the battle from
+    frame_count f to f + 1.
+
+    Attributes:
+        simulation: The BattleSimulation being played.
+        local_player: An integer for the index of the player controlled
+            on this machine.
+        remote_player: An integer for the index of the player controlled
+            on the other machine.
+        transport: The UDPTransport or LoopbackTransport used to reach
+            the other machine.
+        max_rollback: An integer for the most frames the session may run
+            ahead of the last remote input received.
+        input_delay: An integer for the number of frames between a local
+            input and the frame it applies to. Both machines must use
+            the same value.
+        local_inputs: An array of the local player's input for each
+            recent frame, indexed by frame modulo HISTORY_SIZE.
+        remote_inputs: An array of the input used for the remote player
+            on each recent frame, whether received or predicted.
+        snapshots: A list of the simulation's snapshot at the start of
+            each recent frame.
+        state_hashes: An array of the simulation's checksum at the end
+            of each recent frame.
+        remote_hashes: A dict mapping frames to the checksums the other
+            machine reported for them, until they can be compared.
+        last_remote_frame: An integer for the last frame that every
+            remote input up to has been received for.
+        remote_ack: An integer for the last frame that the other machine
+            has received every local input up to.
+        rollback_frame: An integer for the earliest frame whose remote
+            input was predicted wrongly and hasn't been corrected yet,
+            or -1.
+        metrics: The session's NetplayMetrics.
+    """
+    def __init__(self, simulation, local_player, transport,
+                 max_rollback=MAX_ROLLBACK_FRAMES, input_delay=INPUT_DELAY):
+        """Prepare to play.
+
+        Args:
+            simulation: The BattleSimulation to play, at its start.
+            local_player: An integer for the index of the player
+                controlled on this machine.
+            transport: The UDPTransport or LoopbackTransport used to
+                reach the other machine.
+            max_rollback: Optional. An integer for the most frames the
+                session may run ahead of the last remote input
+                received. The default is MAX_ROLLBACK_FRAMES.
+            input_delay: Optional. An integer for the number of frames
+                between a local input and the frame it applies to. The
+                default is INPUT_DELAY.
+        """
+        self.simulation = simulation
+        self.local_player = local_player
+        self.remote_player = simulation.get_opponent(local_player)
+        self.transport = transport
+        self.max_rollback = min(max_rollback,
+                                HISTORY_SIZE - input_delay - 1)
+        self.input_delay = input_delay
+
+        self.local_inputs = array('H', [0] * HISTORY_SIZE)
+        self.remote_inputs = array('H', [0] * HISTORY_SIZE)
+        self.snapshots = [None] * HISTORY_SIZE
+        self.state_hashes = array('L', [0] * HISTORY_SIZE)
+        self.remote_hashes = {}
+
+        # Nobody can enter inputs for the frames covered by the delay,
+        # so both sides already know they're empty.
+        self.last_remote_frame = input_delay - 1
+        self.remote_ack = input_delay - 1
+        self.rollback_frame = -1
+        self.metrics = NetplayMetrics()
+
+    def get_current_frame(self):
+        """Return an integer for the next frame to be played."""
+        return self.simulation.frame_count
+
+    def get_confirmed_frame(self):
+        """Return an integer for the last frame whose inputs from both
+        players are known and have been played, or -1 if there are none.
+        """
+        return min(self.last_remote_frame, self.get_current_frame() - 1)
+
+    def advance_frame(self, local_input):
+        """Play one display frame: receive remote inputs, roll back if
+        any predictions were wrong, and play the next frame with the
+        local player's latest input.
+
+        Args:
+            local_input: An integer bitmask of the buttons the local
+                player is holding.
+
+        Returns:
+            A Boolean indicating whether a frame was played. If the
+            session has run too far ahead of the remote player, it waits
+            for their inputs instead, and False is returned.
+        """
+        self.receive_packets()
+        if self.rollback_frame >= 0:
+            self.roll_back()
+
+        current_frame = self.get_current_frame()
+        if (current_frame - self.last_remote_frame > self.max_rollback or
+                self.simulation.is_over()):
+            self.metrics.frames_stalled += 1
+            self.send_inputs()
+            return False
+
+        delayed_frame = current_frame + self.input_delay
+        self.local_inputs[delayed_frame % HISTORY_SIZE] = local_input
+        if current_frame > self.last_remote_frame:
+            self.remote_inputs[current_frame % HISTORY_SIZE] = \
+                self.remote_inputs[self.last_remote_frame % HISTORY_SIZE]
+
+        self.simulate_frame(current_frame)
+        self.metrics.frames_advanced += 1
+        self.check_remote_hashes()
+        self.send_inputs()
+        return True
+
+    def simulate_frame(self, frame):
+        """Save a snapshot, then play a single frame with the inputs
+        recorded for it.
+
+        Args:
+            frame: An integer for the frame, which must be the next one
+                to be played.
+        """
+        history_index = frame % HISTORY_SIZE
+        input_masks = [0, 0]
+        input_masks[self.local_player] = self.local_inputs[history_index]
+        input_masks[self.remote_player] = self.remote_inputs[history_index]
+
+        self.snapshots[history_index] = self.simulation.snapshot()
+        self.simulation.step(input_masks)
+        self.state_hashes[history_index] = self.simulation.get_state_hash()
+
+    def roll_back(self):
+        """Restore the battle to the first wrongly predicted frame, and
+        play every frame since then again with the corrected inputs.
+        """
+        start_time = default_timer()
+        current_frame = self.get_current_frame()
+        rollback_frame = self.rollback_frame
+        self.rollback_frame = -1
+
+        self.simulation.restore(self.snapshots[rollback_frame % HISTORY_SIZE])
+        for frame in xrange(rollback_frame, current_frame):
+            if frame > self.last_remote_frame:
+                self.remote_inputs[frame % HISTORY_SIZE] = \
+                    self.remote_inputs[self.last_remote_frame % HISTORY_SIZE]
+            self.simulate_frame(frame)
+
+        resimulation_time = default_timer() - start_time
+        depth = current_frame - rollback_frame
+        metrics = self.metrics
+        metrics.num_of_rollbacks += 1
+        metrics.total_rollback_frames += depth
+        metrics.max_rollback_depth = max(metrics.max_rollback_depth, depth)
+        metrics.total_resimulation_time += resimulation_time
+        metrics.max_resimulation_time = max(metrics.max_resimulation_time,
+                                            resimulation_time)
+
+    def receive_packets(self):
+        """Read every packet that has arrived from the other machine."""
+        for packet in self.transport.receive():
+            self.metrics.packets_received += 1
+            self.read_packet(packet)
+
+    def read_packet(self, packet):
+        """Record the inputs and checksum within a packet, and note the
+        earliest frame that was predicted wrongly.
+
+        Args:
+            packet: A String of the packet's bytes.
+        """
+        if len(packet) < PACKET_HEADER.size:
+            return
+        start_frame, ack_frame, hash_frame, state_hash, num_of_inputs = \
+            PACKET_HEADER.unpack_from(packet)
+        if len(packet) != PACKET_HEADER.size + num_of_inputs * 2:
+            return
+        inputs = struct.unpack_from('!%dH' % num_of_inputs, packet,
+                                    PACKET_HEADER.size)
+
+        self.remote_ack = max(self.remote_ack, ack_frame)
+        if hash_frame >= 0:
+            self.remote_hashes[hash_frame] = state_hash
+
+        current_frame = self.get_current_frame()
+        for input_num, remote_input in enumerate(inputs):
+            frame = start_frame + input_num
+            # Inputs must be recorded in order, so that everything up
+            # to last_remote_frame is known.
+            if frame != self.last_remote_frame + 1:
+                continue
+
+            history_index = frame % HISTORY_SIZE
+            if (frame < current_frame and
+                    self.remote_inputs[history_index] != remote_input and
+                    (self.rollback_frame < 0 or frame < self.rollback_frame)):
+                self.rollback_frame = frame
+            self.remote_inputs[history_index] = remote_input
+            self.last_remote_frame = frame
+
+    def send_inputs(self):
+        """Send every local input the other machine hasn't confirmed
+        receiving yet, along with the latest confirmed checksum.
+        """
+        first_frame = self.remote_ack + 1
+        last_frame = min(self.get_current_frame() + self.input_delay,
+                         first_frame + MAX_INPUTS_PER_PACKET) - 1
+        inputs = [self.local_inputs[frame % HISTORY_SIZE]
+                  for frame in xrange(first_frame, last_frame + 1)]
+
+        hash_frame = self.get_confirmed_frame()
+        if hash_frame >= 0:
+            state_hash = self.state_hashes[hash_frame % HISTORY_SIZE]
+        else:
+            state_hash = 0
+
+        packet = (PACKET_HEADER.pack(first_frame, self.last_remote_frame,
+                                     hash_frame, state_hash, len(inputs)) +
+                  struct.pack('!%dH' % len(inputs), *inputs))
+        self.transport.send(packet)
+        self.metrics.packets_sent += 1
+
+    def check_remote_hashes(self):
+        """Compare the checksums reported by the other machine with this
+        machine's own, for every frame confirmed on both.
+        """
+        confirmed_frame = self.get_confirmed_frame()
+        oldest_frame = self.get_current_frame() - HISTORY_SIZE
+        metrics = self.metrics
+
+        for hash_frame in self.remote_hashes.keys():
+            if hash_frame > confirmed_frame:
+                continue
+
+            remote_hash = self.remote_hashes.pop(hash_frame)
+            if hash_frame <= oldest_frame:
+                continue
+            if self.state_hashes[hash_frame % HISTORY_SIZE] != remote_hash:
+                metrics.num_of_desyncs += 1
+                if metrics.first_desync_frame < 0:
+                    metrics.first_desync_frame = hash_frame
+            metrics.last_checked_frame = max(metrics.last_checked_frame,
+                                             hash_frame)
+
+
+def run_loopback_match(characters, stage, num_of_frames, latency=0.0,
+                       jitter=0.0, loss=0.0, seed=0,
+                       max_rollback=MAX_ROLLBACK_FRAMES,
+                       input_delay=INPUT_DELAY):
+    """Play a battle between two RollbackSessions on this machine, over
+    a simulated network link, with random inputs on both sides.
+
+    Time is simulated as well, so the same arguments always produce the
+    same results.
+
+    Args:
+        characters: A sequence of the CharacterData for each player.
+        stage: The StageData for the stage being fought on.
+        num_of_frames: An integer for the number of display frames to
+            play.
+        latency: Optional. A float for the average delay of a packet,
+            in seconds. The default is 0.
+        jitter: Optional. A float for the most a packet's delay can
+            differ from latency, in seconds. The default is 0.
+        loss: Optional. A float between 0 and 1 for the chance that a
+            packet is lost. The default is 0.
+        seed: Optional. A hashable value for seeding the random inputs
+            and the network link. The default is 0.
+        max_rollback: Optional. An integer for the most frames either
+            session may run ahead. The default is MAX_ROLLBACK_FRAMES.
+        input_delay: Optional. An integer for the input delay of both
+            sessions, in frames. The default is INPUT_DELAY.
+
+    Returns:
+        A tuple containing both RollbackSessions.
+    """
+    # Imported here so that the session itself doesn't depend on the
+    # simulation module.
+    from lib.battle.simulation import BattleSimulation
+    from lib.battle.inputs import RandomInputs
+
+    clock = ManualClock()
+    transports = create_loopback_pair(latency, jitter, loss, seed, clock)
+    sessions = []
+    for player in (0, 1):
+        simulation = BattleSimulation(characters, stage)
+        sessions.append(RollbackSession(simulation, player,
+                                        transports[player], max_rollback,
+                                        input_delay))
+
+    random_inputs = RandomInputs(seed)
+    for frame_num in xrange(0, num_of_frames):
+        input_masks = random_inputs(None)
+        for player, session in enumerate(sessions):
+            session.advance_frame(input_masks[player])
+        clock.advance(1.0 / FRAME_RATE)
+
+    return tuple(sessions)
+
+
+def main(argv):
+    """Play a battle between two sessions over a simulated network link
+    from the command line, and print how each one performed.
+
+    Args:
+        argv: A list of Strings for the command-line arguments, not
+            including the program name.
+    """
+    from lib.battle.match_runner import get_character, get_stage
+
+    parser = argparse.ArgumentParser(
+        description='Play a rollback netplay battle over a simulated '
+                    'network link.')
+    parser.add_argument('--characters', type=int, nargs=2, default=[0, 0],
+                        help='The line indexes of both characters.')
+    parser.add_argument('--stage', type=int, default=0,
+                        help='The line index of the stage to play on.')
+    parser.add_argument('--frames', type=int, default=3600,
+                        help='The number of frames to play.')
+    parser.add_argument('--latency', type=float, default=0.05,
+                        help='The average one-way delay, in seconds.')
+    parser.add_argument('--jitter', type=float, default=0.01,
+                        help='The most the delay can vary, in seconds.')
+    parser.add_argument('--loss', type=float, default=0.0,
+                        help='The chance of losing each packet.')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='The seed for the inputs and the link.')
+    parser.add_argument('--max-rollback', type=int,
+                        default=MAX_ROLLBACK_FRAMES,
+                        help='The most frames a session may run ahead.')
+    parser.add_argument('--input-delay', type=int, default=INPUT_DELAY,
+                        help='The input delay, in frames.')
+    args = parser.parse_args(argv)
+
+    characters = [get_character(line_index)
+                  for line_index in args.characters]
+    stage = get_stage(args.stage)
+    if None in characters or stage is None:
+        print 'Could not load the characters or the stage.'
+        return
+
+    sessions = run_loopback_match(characters, stage, args.frames,
+                                  args.latency, args.jitter, args.loss,
+                                  args.seed, args.max_rollback,
+                                  args.input_delay)
+    for session in sessions:
+        metrics = session.metrics
+        print 'Player %d:' % session.local_player
+        print '  frames played: %d, stalled: %d' % (metrics.frames_advanced,
+                                                    metrics.frames_stalled)
+        print '  rollbacks: %d, average depth: %.2f, max depth: %d' % (
+            metrics.num_of_rollbacks, metrics.get_average_rollback_depth(),
+            metrics.max_rollback_depth)
+        print '  resimulation time: %.2f ms max, %.2f ms total' % (
+            metrics.max_resimulation_time * 1000,
+            metrics.total_resimulation_time * 1000)
+        print '  packets sent: %d, received: %d' % (metrics.packets_sent,
+                                                    metrics.packets_received)
+        print '  desyncs: %d (frames checked up to %d)' % (
+            metrics.num_of_desyncs, metrics.last_checked_frame)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,446 @@
+"""This module runs every Projectile on the field during a battle.
+
+All live Projectiles are kept in a ProjectilePool, a fixed number of
+slots whose position, speed, animation, and stamina fields are stored in
+typed arrays rather than in one object per Projectile. Spawning a
+Projectile claims a free slot, and despawning it hands the slot back,
+so firing Projectiles never creates objects for the garbage collector
+to clean up. The read-only parts of a Projectile, such as its Frames
+and Hitboxes, are compiled once into a ProjectileDefinition that every
+Projectile fired from the same file shares.
+
+Module Constants:
+    POOL_SIZE (int): The default number of Projectiles that can be on
+        the field at once.
+    PROJECTILE_COLUMNS (list of tuple): The name and array typecode of
+        each field stored for every Projectile.
+"""
+from customize.globals import SCREEN_SIZE, FRAME_RATE
+from lib.frame_timeline import FrameTimeline
+from lib.battle.array_table import ArrayTable
+from lib.custom_data.character_data import load_frame_durations
+from lib.custom_data.projectile_loader import load_projectile
+
+
+POOL_SIZE = 64
+PROJECTILE_COLUMNS = [('definition', 'i'), ('owner', 'b'),
+                      ('x', 'd'), ('y', 'd'), ('x_speed', 'd'),
+                      ('y_speed', 'd'), ('is_facing_left', 'B'),
+                      ('tick', 'i'), ('frame', 'i'), ('stamina', 'i'),
+                      ('has_collided', 'B')]
+
+
+class ProjectileDefinition(object):
+    """The read-only data shared by every Projectile fired from the same
+    Projectile file.
+
+    Attributes:
+        filepath: A String for the file path to the Projectile file.
+        data: The ProjectileData loaded from the file.
+        width: An integer for the width, in pixels, of each frame.
+        height: An integer for the height, in pixels, of each frame.
+        stamina: An integer for the Projectile's starting stamina.
+        timeline: A FrameTimeline for the Projectile's animation.
+        loop_start_tick: An integer for the tick at which the looping
+            part of the animation begins.
+        collision_tick: An integer for the tick at which the collision
+            part of the animation begins. Until the Projectile collides,
+            its animation loops back to loop_start_tick here.
+        frame_hitboxes: A tuple containing the tuple of Hitboxes for
+            each Frame of the animation.
+    """
+    def __init__(self, filepath, projectile_data):
+        """Compile a Projectile's data.
+
+        Args:
+            filepath: A String for the file path to the Projectile
+                file.
+            projectile_data: The ProjectileData loaded from the file.
+        """
+        self.filepath = filepath
+        self.data = projectile_data
+        self.width = projectile_data.rect.width
+        self.height = projectile_data.rect.height
+        self.stamina = projectile_data.stamina
+        self.timeline = FrameTimeline(load_frame_durations(projectile_data))
+        self.frame_hitboxes = tuple(tuple(frame.hitboxes)
+                                    for frame in projectile_data.frames)
+
+        num_of_frames = self.timeline.get_num_of_frames()
+        if projectile_data.first_collision_frame < num_of_frames:
+            self.collision_tick = self.timeline.get_start_tick(
+                projectile_data.first_collision_frame)
+        else:
+            self.collision_tick = self.timeline.total_duration
+
+        if projectile_data.first_loop_frame < num_of_frames:
+            self.loop_start_tick = min(self.timeline.get_start_tick(
+                projectile_data.first_loop_frame), self.collision_tick)
+        else:
+            self.loop_start_tick = 0
+
+
+class ProjectilePool(object):
+    """All of the Projectiles on the field, kept in a fixed number of
+    preallocated slots.
+
+    Attributes:
+        table: The ArrayTable holding every Projectile's fields. See
+            PROJECTILE_COLUMNS for the names of its columns.
+        definitions: A list of the ProjectileDefinitions that have been
+            loaded. A Projectile's definition column holds an index
+            into this list.
+        definition_ids: A dict mapping the file path of every loaded
+            Projectile file to its index within definitions.
+        stage_width: An integer for the width of the stage, in pixels.
+            Projectiles that travel entirely past either edge are
+            despawned.
+        stage_height: An integer for the height of the stage, in
+            pixels.
+    """
+    def __init__(self, capacity=POOL_SIZE, stage_width=SCREEN_SIZE[0],
+                 stage_height=SCREEN_SIZE[1]):
+        """Allocate the pool.
+
+        Args:
+            capacity: Optional. An integer for the number of Projectiles
+                that can be on the field at once. The default is
+                POOL_SIZE.
+            stage_width: Optional. An integer for the width of the
+                stage, in pixels. The default is the screen width.
+            stage_height: Optional. An integer for the height of the
+                stage, in pixels. The default is the screen height.
+        """
+        self.table = ArrayTable(capacity, PROJECTILE_COLUMNS)
+        self.definitions = []
+        self.definition_ids = {}
+        self.stage_width = stage_width
+        self.stage_height = stage_height
+
+    def get_definition_id(self, filepath):
+        """Return the index of a Projectile file's definition, loading
+        and compiling the file the first time it is requested.
+
+        Args:
+            filepath: A String for the file path to the Projectile file.
+
+        Returns:
+            An integer index within definitions, or -1 if the file
+            couldn't be loaded or has no frames.
+        """
+        if filepath not in self.definition_ids:
+            projectile_data = load_projectile(filepath)
+            if projectile_data is None or len(projectile_data.frames) <= 0:
+                self.definition_ids[filepath] = -1
+            else:
+                self.definitions.append(ProjectileDefinition(filepath,
+                                                             projectile_data))
+                self.definition_ids[filepath] = len(self.definitions) - 1
+
+        return self.definition_ids[filepath]
+
+    def spawn(self, projectile, owner, x, y, is_facing_left):
+        """Fire a Projectile from a character's Frame.
+
+        Args:
+            projectile: The Projectile from the Frame, which gives the
+                Projectile file along with its starting offset and
+                speed.
+            owner: An integer for the index of the player who fired the
+                Projectile.
+            x: A number for the x-position of the firing character.
+            y: A number for the y-position of the firing character.
+            is_facing_left: A Boolean indicating whether the firing
+                character is facing to the left.
+
+        Returns:
+            An integer for the slot of the new Projectile. If there are
+            no free slots or the Projectile file couldn't be loaded, -1
+            is returned and nothing is fired.
+        """
+        definition_id = self.get_definition_id(projectile.filepath)
+        if definition_id < 0:
+            return -1
+
+        slot = self.table.allocate()
+        if slot < 0:
+            return -1
+
+        table = self.table
+        definition = self.definitions[definition_id]
+        x_speed = projectile.x_speed / FRAME_RATE
+        if is_facing_left:
+            x -= projectile.x_offset + definition.width
+            x_speed = -x_speed
+        else:
+            x += projectile.x_offset
+
+        table.definition[slot] = definition_id
+        table.owner[slot] = owner
+        table.x[slot] = x
+        table.y[slot] = y + projectile.y_offset
+        table.x_speed[slot] = x_speed
+        table.y_speed[slot] = projectile.y_speed / FRAME_RATE
+        table.is_facing_left[slot] = is_facing_left
+        table.tick[slot] = 0
+        table.frame[slot] = 0
+        table.stamina[slot] = definition.stamina
+        table.has_collided[slot] = 0
+
+        return slot
+
+    def despawn(self, slot):
+        """Remove a Projectile from the field.
+
+        Args:
+            slot: An integer for the slot of the Projectile.
+        """
+        self.table.release(slot)
+
+    def clear(self):
+        """Remove every Projectile from the field."""
+        self.table.clear()
+
+    def update(self):
+        """Move and animate every Projectile by one update cycle.
+
+        Projectiles that have finished their collision animation, or
+        have left the stage, are despawned.
+        """
+        table = self.table
+        is_active = table.is_active
+        definitions = self.definitions
+
+        for slot in xrange(0, table.capacity):
+            if not is_active[slot]:
+                continue
+
+            definition = definitions[table.definition[slot]]
+            tick = table.tick[slot] + 1
+
+            if table.has_collided[slot]:
+                if tick >= definition.timeline.total_duration:
+                    table.release(slot)
+                    continue
+            else:
+                if tick >= definition.collision_tick:
+                    tick = definition.loop_start_tick
+
+                x = table.x[slot] + table.x_speed[slot]
+                y = table.y[slot] + table.y_speed[slot]
+                if (x + definition.width < 0 or x > self.stage_width or
+                        y + definition.height < 0 or y > self.stage_height):
+                    table.release(slot)
+                    continue
+                table.x[slot] = x
+                table.y[slot] = y
+
+            table.tick[slot] = tick
+            table.frame[slot] = definition.timeline.get_frame_index(tick,
+                                                                    False)
+
+    def start_collision(self, slot):
+        """Stop a Projectile and play its collision animation.
+
+        Args:
+            slot: An integer for the slot of the Projectile.
+        """
+        table = self.table
+        if table.has_collided[slot]:
+            return
+
+        definition = self.definitions[table.definition[slot]]
+        table.has_collided[slot] = 1
+        table.stamina[slot] = 0
+        table.tick[slot] = definition.collision_tick
+        table.frame[slot] = definition.timeline.get_frame_index(
+            definition.collision_tick, False)
+
+    def get_hitboxes(self, slot):
+        """Return a tuple of the Hitboxes on a Projectile's current
+        frame. Projectiles that have collided have no Hitboxes.
+
+        Args:
+            slot: An integer for the slot of the Projectile.
+        """
+        table = self.table
+        if table.has_collided[slot]:
+            return ()
+
+        definition = self.definitions[table.definition[slot]]
+        return definition.frame_hitboxes[table.frame[slot]]
+
+    def is_box_hit(self, slot, left, top, right, bottom):
+        """Return a Boolean indicating whether any of a Projectile's
+        current Hitboxes overlap an area of the stage.
+
+        Args:
+            slot: An integer for the slot of the Projectile.
+            left: A number for the x-position of the area's left edge.
+            top: A number for the y-position of the area's top edge.
+            right: A number for the x-position of the area's right edge.
+            bottom: A number for the y-position of the area's bottom
+                edge.
+        """
+        return self.find_landed_hitbox(slot, left, top, right,
+                                       bottom) is not None
+
+    def find_landed_hitbox(self, slot, left, top, right, bottom):
+        """Return the first of a Projectile's current Hitboxes that
+        overlaps an area of the stage.
+
+        Args:
+            slot: An integer for the slot of the Projectile.
+            left: A number for the x-position of the area's left edge.
+            top: A number for the y-position of the area's top edge.
+            right: A number for the x-position of the area's right edge.
+            bottom: A number for the y-position of the area's bottom
+                edge.
+
+        Returns:
+            The Hitbox that landed, or None if none of them did.
+        """
+        table = self.table
+        definition = self.definitions[table.definition[slot]]
+        x = table.x[slot]
+        y = table.y[slot]
+        is_facing_left = table.is_facing_left[slot]
+
+        for hitbox in self.get_hitboxes(slot):
+            if is_facing_left:
+                box_left = x + definition.width - hitbox.x_offset - \
+                    hitbox.width
+            else:
+                box_left = x + hitbox.x_offset
+            box_top = y + hitbox.y_offset
+
+            if (box_left < right and box_left + hitbox.width > left and
+                    box_top < bottom and box_top + hitbox.height > top):
+                return hitbox
+
+        return None
+
+    def find_hit(self, target, left, top, right, bottom):
+        """Return the first Projectile fired by another player that
+        overlaps an area, such as one of a character's Hurtboxes, along
+        with the Hitbox of it that landed.
+
+        Args:
+            target: An integer for the index of the player who owns the
+                area. Their own Projectiles are ignored.
+            left: A number for the x-position of the area's left edge.
+            top: A number for the y-position of the area's top edge.
+            right: A number for the x-position of the area's right edge.
+            bottom: A number for the y-position of the area's bottom
+                edge.
+
+        Returns:
+            A tuple containing an integer for the slot of the Projectile
+            and the Hitbox that landed. If none of them overlap the
+            area, (-1, None) is returned instead.
+        """
+        table = self.table
+        is_active = table.is_active
+
+        for slot in xrange(0, table.capacity):
+            if not is_active[slot] or table.owner[slot] == target:
+                continue
+
+            hitbox = self.find_landed_hitbox(slot, left, top, right, bottom)
+            if hitbox is not None:
+                return (slot, hitbox)
+
+        return (-1, None)
+
+    def collide_projectiles(self):
+        """Have opposing Projectiles that overlap wear each other down.
+
+        When two Projectiles fired by different players touch, each
+        loses stamina equal to the other's stamina. Any Projectile whose
+        stamina drops to 0 starts its collision animation.
+        """
+        table = self.table
+        is_active = table.is_active
+
+        for slot in xrange(0, table.capacity):
+            if not is_active[slot] or table.has_collided[slot]:
+                continue
+
+            for other_slot in xrange(slot + 1, table.capacity):
+                if (not is_active[other_slot] or
+                        table.has_collided[other_slot] or
+                        table.owner[other_slot] == table.owner[slot]):
+                    continue
+                if not self.are_projectiles_touching(slot, other_slot):
+                    continue
+
+                stamina = table.stamina[slot]
+                other_stamina = table.stamina[other_slot]
+                table.stamina[slot] = stamina - other_stamina
+                table.stamina[other_slot] = other_stamina - stamina
+
+                if table.stamina[other_slot] <= 0:
+                    self.start_collision(other_slot)
+                if table.stamina[slot] <= 0:
+                    self.start_collision(slot)
+                    break
+
+    def are_projectiles_touching(self, slot, other_slot):
+        """Return a Boolean indicating whether any Hitbox of one
+        Projectile overlaps any Hitbox of another.
+
+        Args:
+            slot: An integer for the slot of the first Projectile.
+            other_slot: An integer for the slot of the second
+                Projectile.
+        """
+        table = self.table
+        definition = self.definitions[table.definition[other_slot]]
+        x = table.x[other_slot]
+        y = table.y[other_slot]
+        is_facing_left = table.is_facing_left[other_slot]
+
+        for hitbox in self.get_hitboxes(other_slot):
+            if is_facing_left:
+                box_left = x + definition.width - hitbox.x_offset - \
+                    hitbox.width
+            else:
+                box_left = x + hitbox.x_offset
+            box_top = y + hitbox.y_offset
+
+            if self.is_box_hit(slot, box_left, box_top,
+                               box_left + hitbox.width,
+                               box_top + hitbox.height):
+                return True
+
+        return False
+
+    def snapshot(self):
+        """Return a copy of the state of every Projectile, which can be
+        passed to restore() later.
+        """
+        return self.table.snapshot()
+
+    def restore(self, snapshot):
+        """Return every Projectile to the state it had when a snapshot
+        was taken.
+
+        Args:
+            snapshot: A value returned by snapshot() on this pool.
+        """
+        self.table.restore(snapshot)
+
+    def clone(self):
+        """Return a new ProjectilePool holding a copy of every
+        Projectile.
+
+        The clone shares this pool's ProjectileDefinitions, so
+        snapshots taken from either pool can be restored into the
+        other.
+        """
+        pool_clone = ProjectilePool(self.table.capacity, self.stage_width,
+                                    self.stage_height)
+        pool_clone.table = self.table.clone()
+        pool_clone.definitions = self.definitions
+        pool_clone.definition_ids = self.definition_ids
+        return pool_clone
@@ -0,0 +1,726 @@
+"""This module runs the rules of a battle between two characters without
+drawing, playing audio, or reading the keyboard.
+
+A BattleSimulation advances by one fixed update cycle at a time, given
+the input bitmask that each player holds during it. Since it doesn't
+depend on the display or on wall-clock time, it can be run as fast as
+the processor allows, and the same inputs always produce the same
+battle. All of its state lives in a few typed-array tables, so it can
+be saved and restored with snapshot() and restore(), and compared
+between machines with get_state_hash().
+
+Module Constants:
+    NUM_OF_PLAYERS (int): The number of players in a battle.
+    TIME_LIMIT (int): The number of update cycles a battle lasts before
+        time runs out.
+    START_DISTANCE (int): The distance, in pixels, between the fighters
+        when the battle begins.
+    JUMP_SPEED (float): The upward speed, in pixels per update cycle, of
+        a fighter when they jump.
+    LAUNCH_SPEED (float): The upward speed, in pixels per update cycle,
+        of a fighter who is launched by a Hitbox.
+    GRAVITY (float): The amount added to an airborne fighter's downward
+        speed every update cycle.
+    MAX_METER (int): The most points a Special Gauge can hold.
+    CHIP_DAMAGE_DIVISOR (int): Blocked attacks deal their damage divided
+        by this amount.
+    DIZZY_DURATION (int): The number of update cycles that a fighter
+        stays dizzy.
+    INPUT_HISTORY_LENGTH (int): The number of recent input steps kept
+        for each player.
+    INPUT_TIMEOUT (int): The number of update cycles without a new input
+        step before a player's input history is cleared.
+    PLAYER_COLUMNS (list of tuple): The name and array typecode of each
+        field stored for every player.
+    NEUTRAL, ACTING, RECOILING, KNOCKED_OUT (int): The modes a player
+        can be in. Players in NEUTRAL can move freely, players who are
+        ACTING are performing an Action started by their inputs, and
+        RECOILING players are stuck in hitstun or blockstun.
+    STANDING_POSE, WALKING_POSE, CROUCHING_POSE, JUMPING_POSE (int): The
+        poses a player in NEUTRAL can be in. NO_POSE means that they're
+        in some other mode.
+"""
+import zlib
+from copy import copy
+from array import array
+from collections import namedtuple
+from customize.globals import SCREEN_SIZE, FRAME_RATE
+from lib.battle.array_table import ArrayTable
+from lib.battle.entities import EntityStore, FIGHTER
+from lib.battle.projectiles import ProjectilePool
+from lib.battle.inputs import is_held, get_action_inputs
+from lib.custom_data.action_index import ActionCondition
+
+
+NUM_OF_PLAYERS = 2
+TIME_LIMIT = 99 * int(FRAME_RATE)
+START_DISTANCE = 120
+JUMP_SPEED = 7.0
+LAUNCH_SPEED = 5.0
+GRAVITY = 0.4
+MAX_METER = 100
+CHIP_DAMAGE_DIVISOR = 4
+DIZZY_DURATION = 3 * int(FRAME_RATE)
+INPUT_HISTORY_LENGTH = 8
+INPUT_TIMEOUT = 15
+PLAYER_COLUMNS = [('stamina', 'i'), ('meter', 'i'), ('dizzy_stun', 'i'),
+                  ('mode', 'B'), ('pose', 'b'), ('condition', 'B'),
+                  ('held_inputs', 'H'), ('num_of_steps', 'i'),
+                  ('idle_frames', 'i'), ('has_new_step', 'B'),
+                  ('combo', 'i'), ('hits_landed', 'i'),
+                  ('damage_dealt', 'i')]
+NEUTRAL = 0
+ACTING = 1
+RECOILING = 2
+KNOCKED_OUT = 3
+NO_POSE = -1
+STANDING_POSE = 0
+WALKING_POSE = 1
+CROUCHING_POSE = 2
+JUMPING_POSE = 3
+
+
+# The outcome of a battle. winner is the index of the winning player, or
+# -1 for a draw. stamina, hits_landed, and damage_dealt are tuples with
+# one value per player.
+MatchResult = namedtuple('MatchResult', ['winner', 'num_of_frames',
+                                         'stamina', 'hits_landed',
+                                         'damage_dealt'])
+
+
+class BattleSimulation(object):
+    """The complete state and rules of a battle between two characters.
+
+    Player 0 starts on the left side of the stage and player 1 on the
+    right. Each fighter's entity slot within the EntityStore is the
+    same as their player index.
+
+    Attributes:
+        characters: A tuple of the CharacterData for each player.
+        stage: The StageData for the stage being fought on.
+        num_of_players: An integer for the number of players.
+        entities: The EntityStore holding both fighters.
+        projectiles: The ProjectilePool holding every Projectile.
+        players: An ArrayTable with one slot per player, holding the
+            fields listed in PLAYER_COLUMNS.
+        input_steps: An array holding each player's recent input steps
+            as bitmasks. Player p's steps occupy the
+            INPUT_HISTORY_LENGTH entries starting at
+            p * INPUT_HISTORY_LENGTH, as a ring buffer.
+        frame_count: An integer for the number of update cycles that
+            have been run.
+        time_limit: An integer for the number of update cycles the
+            battle lasts before time runs out.
+        ground_level: An integer for the y-position of the ground.
+    """
+    def __init__(self, characters, stage, stage_width=SCREEN_SIZE[0],
+                 time_limit=TIME_LIMIT):
+        """Set up the start of the battle.
+
+        Args:
+            characters: A sequence of the CharacterData for each player.
+            stage: The StageData for the stage being fought on.
+            stage_width: Optional. An integer for the width of the
+                stage, in pixels. The default is the screen width.
+            time_limit: Optional. An integer for the number of update
+                cycles the battle lasts. The default is TIME_LIMIT.
+        """
+        self.characters = tuple(characters)
+        self.stage = stage
+        self.num_of_players = NUM_OF_PLAYERS
+        self.time_limit = time_limit
+        self.ground_level = stage.ground_level
+
+        self.entities = EntityStore(stage_width)
+        self.projectiles = ProjectilePool(stage_width=stage_width,
+                                          stage_height=self.ground_level)
+        self.players = ArrayTable(self.num_of_players, PLAYER_COLUMNS)
+        self.input_steps = array('H', [0] * (self.num_of_players *
+                                             INPUT_HISTORY_LENGTH))
+        self.frame_count = 0
+
+        center = stage_width // 2
+        start_positions = (center - START_DISTANCE // 2,
+                           center + START_DISTANCE // 2)
+        for player, character in enumerate(self.characters):
+            model_id = self.entities.add_model(character.actions)
+            self.entities.spawn(FIGHTER, player, model_id,
+                                self.get_default_action(player, 'stand'),
+                                start_positions[player], self.ground_level,
+                                player == 1, True)
+            self.players.allocate()
+            self.players.stamina[player] = character.stamina
+            self.players.pose[player] = STANDING_POSE
+
+    def get_default_action(self, player, action_name):
+        """Return the index of one of a player's Default Actions.
+
+        Args:
+            player: An integer for the player's index.
+            action_name: A String for the name of the Default Action, as
+                listed in DEFAULT_ACTIONS.
+        """
+        return self.characters[player].default_actions.get(action_name, 0)
+
+    def get_opponent(self, player):
+        """Return an integer for the index of a player's opponent.
+
+        Args:
+            player: An integer for the player's index.
+        """
+        return 1 - player
+
+    def step(self, input_masks):
+        """Run the battle for one update cycle.
+
+        Args:
+            input_masks: A sequence containing the input bitmask held by
+                each player during this update cycle.
+
+        Returns:
+            A Boolean indicating whether the battle is over.
+        """
+        if self.is_over():
+            return True
+
+        for player in xrange(0, self.num_of_players):
+            self.record_inputs(player, input_masks[player])
+        for player in xrange(0, self.num_of_players):
+            self.update_control(player)
+
+        self.entities.update()
+        self.update_airborne()
+        self.projectiles.update()
+        for player in xrange(0, self.num_of_players):
+            self.spawn_frame_projectiles(player)
+
+        self.projectiles.collide_projectiles()
+        self.resolve_hits()
+        self.update_recoil()
+
+        self.frame_count += 1
+        return self.is_over()
+
+    def run(self, input_source, max_frames=None):
+        """Run the battle until it ends.
+
+        Args:
+            input_source: A callable that is passed this simulation and
+                returns the input bitmasks for the next update cycle,
+                such as a RandomInputs or ScriptedInputs object.
+            max_frames: Optional. An integer for the most update cycles
+                to run. By default, the battle runs until a knockout or
+                until time runs out.
+
+        Returns:
+            A MatchResult for the battle.
+        """
+        num_of_frames = 0
+        while not self.is_over():
+            if max_frames is not None and num_of_frames >= max_frames:
+                break
+            self.step(input_source(self))
+            num_of_frames += 1
+
+        return self.get_result()
+
+    def record_inputs(self, player, input_mask):
+        """Add a player's inputs to their input history.
+
+        A new input step is recorded whenever the held buttons change to
+        anything other than nothing at all.
+
+        Args:
+            player: An integer for the player's index.
+            input_mask: An integer bitmask of the buttons held.
+        """
+        players = self.players
+        players.has_new_step[player] = 0
+
+        if input_mask != players.held_inputs[player] and input_mask != 0:
+            position = (player * INPUT_HISTORY_LENGTH +
+                        players.num_of_steps[player] % INPUT_HISTORY_LENGTH)
+            self.input_steps[position] = input_mask
+            players.num_of_steps[player] += 1
+            players.idle_frames[player] = 0
+            players.has_new_step[player] = 1
+        else:
+            players.idle_frames[player] += 1
+            if players.idle_frames[player] > INPUT_TIMEOUT:
+                players.num_of_steps[player] = 0
+
+        players.held_inputs[player] = input_mask
+
+    def get_input_history(self, player):
+        """Return a list of frozensets containing the names of the
+        buttons in each of a player's recent input steps, from the
+        oldest to the most recent.
+
+        Args:
+            player: An integer for the player's index.
+        """
+        num_of_steps = self.players.num_of_steps[player]
+        first_step = max(0, num_of_steps - INPUT_HISTORY_LENGTH)
+        offset = player * INPUT_HISTORY_LENGTH
+
+        return [get_action_inputs(
+                    self.input_steps[offset + step % INPUT_HISTORY_LENGTH])
+                for step in xrange(first_step, num_of_steps)]
+
+    def get_distance(self, player):
+        """Return the horizontal distance, in pixels, between the
+        Hurtboxes of a player's fighter and those of their opponent.
+
+        Args:
+            player: An integer for the player's index.
+        """
+        entities = self.entities
+        opponent = self.get_opponent(player)
+        bounds = []
+
+        for slot in (player, opponent):
+            model = entities.models[entities.table.model[slot]]
+            hurt_bounds = model.hurt_bounds[entities.table.action[slot]][
+                entities.table.frame[slot]]
+            if hurt_bounds is None:
+                x = entities.table.x[slot]
+                bounds.append((x, 0, x, 0))
+            else:
+                bounds.append(entities.get_world_bounds(slot, hurt_bounds))
+
+        return max(0, bounds[1][0] - bounds[0][2], bounds[0][0] - bounds[1][2])
+
+    def update_control(self, player):
+        """Have a player's fighter respond to their inputs.
+
+        Args:
+            player: An integer for the player's index.
+        """
+        players = self.players
+        entities = self.entities.table
+        mode = players.mode[player]
+
+        if mode == ACTING:
+            if entities.has_finished[player]:
+                self.return_to_neutral(player)
+            elif players.has_new_step[player]:
+                cancel_mask = self.characters[player].cancel_graph.\
+                    get_cancel_mask(entities.action[player],
+                                    entities.frame[player],
+                                    entities.last_hit_frame[player] >= 0)
+                if cancel_mask != 0:
+                    self.try_start_action(player, cancel_mask)
+            return
+        elif mode != NEUTRAL:
+            return
+
+        if players.has_new_step[player] and self.try_start_action(player):
+            return
+        if players.condition[player] == ActionCondition.JUMPING:
+            return
+
+        self.face_opponent(player)
+        held_inputs = players.held_inputs[player]
+        walk_speed = self.characters[player].speed / FRAME_RATE
+
+        if is_held(held_inputs, 'up'):
+            if is_held(held_inputs, 'forward'):
+                self.jump(player, 'jump_forward', walk_speed)
+            elif is_held(held_inputs, 'back'):
+                self.jump(player, 'jump_back', -walk_speed)
+            else:
+                self.jump(player, 'jump_up', 0)
+        elif is_held(held_inputs, 'down'):
+            if players.pose[player] != CROUCHING_POSE:
+                self.set_pose(player, CROUCHING_POSE, 'crouching_idle')
+            entities.x_speed[player] = 0
+        elif is_held(held_inputs, 'forward'):
+            self.set_pose(player, WALKING_POSE, 'walk')
+            entities.x_speed[player] = walk_speed
+        elif is_held(held_inputs, 'back'):
+            self.set_pose(player, WALKING_POSE, 'walk')
+            entities.x_speed[player] = -walk_speed
+        else:
+            self.set_pose(player, STANDING_POSE, 'stand')
+            entities.x_speed[player] = 0
+
+    def try_start_action(self, player, allowed_actions=None):
+        """Start the highest-priority Action that a player's recent
+        inputs match, if there is one.
+
+        Args:
+            player: An integer for the player's index.
+            allowed_actions: Optional. An integer bitset of the Actions
+                that may be started. By default, any Action may be.
+
+        Returns:
+            A Boolean indicating whether an Action was started.
+        """
+        players = self.players
+        character = self.characters[player]
+        candidate = character.action_index.find_action(
+            players.condition[player], self.get_input_history(player),
+            players.meter[player], self.get_distance(player),
+            allowed_actions)
+        if candidate is None:
+            return False
+
+        self.start_action(player, candidate.action_index)
+        return True
+
+    def start_action(self, player, action_index):
+        """Have a player's fighter begin performing an Action, spending
+        and gaining Special Gauge points as required.
+
+        Args:
+            player: An integer for the player's index.
+            action_index: An integer for the index of the Action.
+        """
+        players = self.players
+        action = self.characters[player].actions[action_index]
+
+        players.meter[player] = min(MAX_METER, players.meter[player] -
+                                    action.meter_needed + action.meter_gain)
+        players.mode[player] = ACTING
+        players.pose[player] = NO_POSE
+        if players.condition[player] != ActionCondition.JUMPING:
+            self.entities.table.x_speed[player] = 0
+
+        self.entities.set_action(player, action_index)
+        self.spawn_frame_projectiles(player)
+
+    def set_pose(self, player, pose, action_name):
+        """Put a player in NEUTRAL into one of the poses, unless they
+        are in it already.
+
+        Args:
+            player: An integer for the player's index.
+            pose: An integer for the pose.
+            action_name: A String for the name of the Default Action
+                shown during the pose.
+        """
+        players = self.players
+        if pose == CROUCHING_POSE:
+            players.condition[player] = ActionCondition.CROUCHING
+        elif pose == JUMPING_POSE:
+            players.condition[player] = ActionCondition.JUMPING
+        else:
+            players.condition[player] = ActionCondition.STANDING
+
+        if players.pose[player] != pose:
+            players.pose[player] = pose
+            self.entities.set_action(player, self.get_default_action(
+                player, action_name), pose != JUMPING_POSE)
+
+    def jump(self, player, action_name, x_speed):
+        """Launch a player's fighter into the air.
+
+        Args:
+            player: An integer for the player's index.
+            action_name: A String for the name of the Default Action for
+                the jump.
+            x_speed: A float for the fighter's forward speed during the
+                jump, in pixels per update cycle.
+        """
+        self.set_pose(player, JUMPING_POSE, action_name)
+        self.entities.table.x_speed[player] = x_speed
+        self.entities.table.y_speed[player] = -JUMP_SPEED
+
+    def return_to_neutral(self, player):
+        """Have a player's fighter stand idle, or fall if they're in the
+        air.
+
+        Args:
+            player: An integer for the player's index.
+        """
+        players = self.players
+        players.mode[player] = NEUTRAL
+        players.pose[player] = NO_POSE
+
+        if players.condition[player] == ActionCondition.JUMPING:
+            self.set_pose(player, JUMPING_POSE, 'falling')
+        else:
+            self.set_pose(player, STANDING_POSE, 'stand')
+            self.entities.table.x_speed[player] = 0
+
+    def face_opponent(self, player):
+        """Turn a player's fighter to face their opponent.
+
+        Args:
+            player: An integer for the player's index.
+        """
+        entities = self.entities.table
+        opponent = self.get_opponent(player)
+        if entities.x[player] != entities.x[opponent]:
+            entities.is_facing_left[player] = (entities.x[player] >
+                                               entities.x[opponent])
+
+    def update_airborne(self):
+        """Apply gravity to every fighter in the air, and land those who
+        reach the ground.
+        """
+        players = self.players
+        entities = self.entities.table
+
+        for player in xrange(0, self.num_of_players):
+            if players.condition[player] != ActionCondition.JUMPING:
+                continue
+
+            entities.y_speed[player] += GRAVITY
+            if entities.y[player] < self.ground_level:
+                continue
+
+            entities.y[player] = self.ground_level
+            entities.y_speed[player] = 0
+            players.condition[player] = ActionCondition.STANDING
+            if players.mode[player] == NEUTRAL:
+                self.return_to_neutral(player)
+            elif players.mode[player] == ACTING:
+                entities.x_speed[player] = 0
+
+    def spawn_frame_projectiles(self, player):
+        """Fire the Projectiles of a fighter's current Frame, if the
+        fighter has just reached it.
+
+        Args:
+            player: An integer for the player's index.
+        """
+        entity_store = self.entities
+        entities = entity_store.table
+        if (self.players.mode[player] != ACTING or
+                entities.has_finished[player]):
+            return
+
+        model = entity_store.models[entities.model[player]]
+        timeline = model.timelines[entities.action[player]]
+        frame_index = entities.frame[player]
+        if entities.tick[player] != timeline.get_start_tick(frame_index):
+            return
+
+        for projectile in entity_store.get_frame(player).projectiles:
+            self.projectiles.spawn(projectile, player, entities.x[player],
+                                   entities.y[player],
+                                   entities.is_facing_left[player])
+
+    def resolve_hits(self):
+        """Apply every Hitbox from a fighter or Projectile that lands on
+        a fighter during this update cycle.
+        """
+        entity_store = self.entities
+        entities = entity_store.table
+
+        for hit in entity_store.find_hits():
+            self.apply_hit(hit.attacker, hit.defender, hit.hitbox,
+                           entities.x[hit.attacker])
+
+        projectiles = self.projectiles
+        for player in xrange(0, self.num_of_players):
+            for box in entity_store.get_compiled_boxes(player, False):
+                left, top, right, bottom = entity_store.get_box_rect(player,
+                                                                     box)
+                slot, hitbox = projectiles.find_hit(player, left, top, right,
+                                                    bottom)
+                if slot < 0:
+                    continue
+
+                source_x = projectiles.table.x[slot]
+                self.apply_hit(projectiles.table.owner[slot], player, hitbox,
+                               source_x)
+                projectiles.start_collision(slot)
+                break
+
+    def apply_hit(self, attacker, defender, hitbox, source_x):
+        """Have a Hitbox strike a player's fighter.
+
+        Args:
+            attacker: An integer for the index of the player who owns
+                the Hitbox.
+            defender: An integer for the index of the player struck.
+            hitbox: The Hitbox that landed.
+            source_x: A number for the x-position the attack came from.
+                The defender is knocked back away from it.
+        """
+        players = self.players
+        entities = self.entities.table
+        if players.mode[defender] == KNOCKED_OUT:
+            return
+
+        condition = players.condition[defender]
+        is_blocking = (players.mode[defender] == NEUTRAL and
+                       is_held(players.held_inputs[defender], 'back') and
+                       ((condition == ActionCondition.CROUCHING and
+                         hitbox.can_block_low) or
+                        (condition != ActionCondition.CROUCHING and
+                         hitbox.can_block_high)))
+
+        if is_blocking:
+            damage = hitbox.damage // CHIP_DAMAGE_DIVISOR
+            entities.timer[defender] = hitbox.blockstun
+            if condition == ActionCondition.CROUCHING:
+                recoil_name = 'block_low'
+            else:
+                recoil_name = 'block_standing'
+        else:
+            damage = hitbox.damage
+            entities.timer[defender] = hitbox.hitstun
+            recoil_name = self.apply_hit_effect(defender, hitbox)
+
+            if players.mode[defender] == RECOILING:
+                players.combo[attacker] += 1
+            else:
+                players.combo[attacker] = 1
+            players.hits_landed[attacker] += 1
+
+        players.stamina[defender] = max(0, players.stamina[defender] - damage)
+        players.damage_dealt[attacker] += damage
+        players.mode[defender] = RECOILING
+        players.pose[defender] = NO_POSE
+        entities.x_speed[defender] = 0
+
+        if players.stamina[defender] <= 0:
+            players.mode[defender] = KNOCKED_OUT
+            if is_blocking:
+                recoil_name = 'chip_ko'
+            else:
+                recoil_name = 'knockdown'
+        self.entities.set_action(defender, self.get_default_action(
+            defender, recoil_name))
+
+        if entities.x[defender] >= source_x:
+            knockback = hitbox.knockback
+        else:
+            knockback = -hitbox.knockback
+        entities.x[defender] = max(0, min(entities.x[defender] + knockback,
+                                          self.entities.stage_width))
+
+    def apply_hit_effect(self, defender, hitbox):
+        """Apply the Dizzy Stun and additional effect of an unblocked
+        Hitbox to a player.
+
+        Args:
+            defender: An integer for the index of the player struck.
+            hitbox: The Hitbox that landed.
+
+        Returns:
+            A String for the name of the Default Action the player
+            should recoil with.
+        """
+        players = self.players
+        entities = self.entities.table
+        condition = players.condition[defender]
+
+        stun_threshold = self.characters[defender].stun_threshold
+        players.dizzy_stun[defender] += hitbox.dizzy_stun
+        if stun_threshold > 0 and players.dizzy_stun[defender] >= \
+                stun_threshold:
+            players.dizzy_stun[defender] = 0
+            entities.timer[defender] = DIZZY_DURATION
+            return 'dizzy'
+        elif hitbox.effect == 1:
+            return 'tripped'
+        elif hitbox.effect == 2:
+            players.condition[defender] = ActionCondition.JUMPING
+            entities.y_speed[defender] = -LAUNCH_SPEED
+            return 'launched'
+        elif condition == ActionCondition.CROUCHING:
+            return 'crouching_recoil'
+        elif condition == ActionCondition.JUMPING:
+            return 'jumping_recoil'
+        else:
+            return 'standing_recoil'
+
+    def update_recoil(self):
+        """Return players whose hitstun or blockstun has run out to
+        NEUTRAL, once they're back on the ground.
+        """
+        players = self.players
+        entities = self.entities.table
+
+        for player in xrange(0, self.num_of_players):
+            if (players.mode[player] == RECOILING and
+                    entities.timer[player] <= 0 and
+                    players.condition[player] != ActionCondition.JUMPING):
+                players.combo[self.get_opponent(player)] = 0
+                self.return_to_neutral(player)
+
+    def is_over(self):
+        """Return a Boolean indicating whether the battle has ended by
+        knockout or by running out of time.
+        """
+        if self.frame_count >= self.time_limit:
+            return True
+
+        for player in xrange(0, self.num_of_players):
+            if self.players.mode[player] == KNOCKED_OUT:
+                return True
+
+        return False
+
+    def get_winner(self):
+        """Return an integer for the index of the player currently
+        winning the battle, or -1 if it is a draw.
+        """
+        stamina = self.players.stamina
+        if stamina[0] > stamina[1]:
+            return 0
+        elif stamina[1] > stamina[0]:
+            return 1
+        else:
+            return -1
+
+    def get_result(self):
+        """Return a MatchResult describing the battle so far."""
+        players = self.players
+        return MatchResult(self.get_winner(), self.frame_count,
+                           tuple(players.stamina),
+                           tuple(players.hits_landed),
+                           tuple(players.damage_dealt))
+
+    def snapshot(self):
+        """Return a copy of the entire state of the battle, which can be
+        passed to restore() later.
+        """
+        return (self.entities.snapshot(), self.projectiles.snapshot(),
+                self.players.snapshot(), self.input_steps.__copy__(),
+                self.frame_count)
+
+    def restore(self, snapshot):
+        """Return the battle to the state it had when a snapshot was
+        taken.
+
+        Args:
+            snapshot: A value returned by snapshot() on this simulation.
+        """
+        (entity_snapshot, projectile_snapshot, player_snapshot, input_steps,
+         frame_count) = snapshot
+        self.entities.restore(entity_snapshot)
+        self.projectiles.restore(projectile_snapshot)
+        self.players.restore(player_snapshot)
+        self.input_steps[:] = input_steps
+        self.frame_count = frame_count
+
+    def clone(self):
+        """Return a new BattleSimulation in the same state as this one.
+
+        The clone shares this simulation's read-only character and
+        stage data, so snapshots taken from either simulation can be
+        restored into the other.
+        """
+        simulation_clone = copy(self)
+        simulation_clone.entities = self.entities.clone()
+        simulation_clone.projectiles = self.projectiles.clone()
+        simulation_clone.players = self.players.clone()
+        simulation_clone.input_steps = self.input_steps.__copy__()
+        return simulation_clone
+
+    def get_state_hash(self):
+        """Return an integer checksum of the entire state of the
+        battle. Two simulations that have been given the same inputs
+        will have the same checksum.
+        """
+        state_hash = zlib.crc32(self.entities.table.to_bytes())
+        state_hash = zlib.crc32(self.projectiles.table.to_bytes(), state_hash)
+        state_hash = zlib.crc32(self.players.to_bytes(), state_hash)
+        state_hash = zlib.crc32(self.input_steps.tostring(), state_hash)
+        state_hash = zlib.crc32(str(self.frame_count), state_hash)
+        return state_hash & 0xffffffff
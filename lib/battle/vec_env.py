@@ -0,0 +1,373 @@
+"""This module runs many headless battles side by side as a single
+vectorized environment, for training and evaluating CPU opponents.
+
+Like the vectorized environments of reinforcement learning libraries,
+one call to step() advances every battle by one update cycle and
+returns the observations, rewards, and end flags of all of them at
+once. Battles that end are reset automatically.
+
+The battles are divided between several worker processes. Inputs and
+results are passed through arrays in shared memory rather than being
+pickled, so each step only sends a short message to every worker. If
+NumPy is installed, the results are returned as NumPy arrays with one
+row per battle; otherwise they are returned as lists.
+
+Each observation holds, for both players in turn, the fields listed in
+OBSERVATION_FIELDS. Rewards are from player 0's point of view: the
+stamina their opponent lost during the update cycle, minus the stamina
+they lost themselves.
+
+Module Constants:
+    OBSERVATION_FIELDS (tuple of String): The names of the values
+        observed for each player, in the order they appear within an
+        observation.
+    OBSERVATION_SIZE (int): The number of values in one battle's
+        observation.
+"""
+from collections import namedtuple
+from multiprocessing import Process, Pipe, cpu_count
+from multiprocessing.sharedctypes import RawArray
+from lib.battle.simulation import BattleSimulation, NUM_OF_PLAYERS, TIME_LIMIT
+from lib.battle.match_runner import get_character, get_stage
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+OBSERVATION_FIELDS = ('x', 'y', 'action', 'frame', 'is_facing_left',
+                      'timer', 'stamina', 'meter', 'mode', 'condition')
+OBSERVATION_SIZE = len(OBSERVATION_FIELDS) * NUM_OF_PLAYERS
+
+
+# The arrays in shared memory through which every battle's inputs and
+# results are passed. observations holds OBSERVATION_SIZE values per
+# battle, actions holds one input bitmask per player per battle, and
+# rewards and dones hold one value per battle.
+SharedBuffers = namedtuple('SharedBuffers', ['observations', 'actions',
+                                             'rewards', 'dones'])
+
+
+class BattleGroup(object):
+    """A contiguous range of the battles in a vectorized environment,
+    all run by the same process.
+
+    Attributes:
+        first_env: An integer for the index of the first battle in the
+            group, within the whole environment.
+        simulations: A list of the BattleSimulation for each battle.
+        start_snapshots: A list of a snapshot of each battle as it was
+            at the start, used to reset it.
+        buffers: The SharedBuffers of the whole environment.
+    """
+    def __init__(self, first_env, matchups, stage_index, time_limit,
+                 buffers):
+        """Set up every battle in the group.
+
+        Args:
+            first_env: An integer for the index of the first battle in
+                the group, within the whole environment.
+            matchups: A list of tuples, each containing the line indexes
+                of the two characters fighting in one of the group's
+                battles.
+            stage_index: An integer for the line index of the stage.
+            time_limit: An integer for each battle's time limit, in
+                update cycles.
+            buffers: The SharedBuffers of the whole environment.
+        """
+        self.first_env = first_env
+        self.buffers = buffers
+        self.simulations = [BattleSimulation((get_character(first_index),
+                                              get_character(second_index)),
+                                             get_stage(stage_index),
+                                             time_limit=time_limit)
+                            for first_index, second_index in matchups]
+        self.start_snapshots = [simulation.snapshot()
+                                for simulation in self.simulations]
+
+    def reset(self):
+        """Return every battle in the group to its start, and write
+        their observations.
+        """
+        for group_index, simulation in enumerate(self.simulations):
+            simulation.restore(self.start_snapshots[group_index])
+            self.write_observation(group_index)
+
+    def step(self):
+        """Advance every battle in the group by one update cycle, using
+        the inputs in the shared actions buffer, and write their
+        results. Battles that end are reset.
+        """
+        actions = self.buffers.actions
+        rewards = self.buffers.rewards
+        dones = self.buffers.dones
+
+        for group_index, simulation in enumerate(self.simulations):
+            env_index = self.first_env + group_index
+            stamina = simulation.players.stamina
+            old_stamina = (stamina[0], stamina[1])
+            action_offset = env_index * NUM_OF_PLAYERS
+
+            is_done = simulation.step(
+                actions[action_offset:action_offset + NUM_OF_PLAYERS])
+            rewards[env_index] = ((old_stamina[1] - stamina[1]) -
+                                  (old_stamina[0] - stamina[0]))
+            dones[env_index] = is_done
+
+            if is_done:
+                simulation.restore(self.start_snapshots[group_index])
+            self.write_observation(group_index)
+
+    def write_observation(self, group_index):
+        """Write the current observation of one of the group's battles
+        into the shared observations buffer.
+
+        Args:
+            group_index: An integer for the index of the battle within
+                the group.
+        """
+        simulation = self.simulations[group_index]
+        entities = simulation.entities.table
+        players = simulation.players
+        observations = self.buffers.observations
+        position = (self.first_env + group_index) * OBSERVATION_SIZE
+
+        for player in xrange(0, NUM_OF_PLAYERS):
+            observations[position:position + len(OBSERVATION_FIELDS)] = [
+                entities.x[player], entities.y[player],
+                entities.action[player], entities.frame[player],
+                entities.is_facing_left[player], entities.timer[player],
+                players.stamina[player], players.meter[player],
+                players.mode[player], players.condition[player]]
+            position += len(OBSERVATION_FIELDS)
+
+
+def run_worker(connection, first_env, matchups, stage_index, time_limit,
+               buffers):
+    """Run a BattleGroup within a worker process, carrying out commands
+    received through a pipe until told to close.
+
+    Every command is a String: 'reset', 'step', or 'close'. Each one is
+    answered with None once it has been carried out.
+
+    Args:
+        connection: The worker's end of a Pipe.
+        first_env: An integer for the index of the first battle in the
+            worker's group.
+        matchups: A list of tuples, each containing the line indexes of
+            the two characters fighting in one of the group's battles.
+        stage_index: An integer for the line index of the stage.
+        time_limit: An integer for each battle's time limit, in update
+            cycles.
+        buffers: The SharedBuffers of the whole environment.
+    """
+    group = BattleGroup(first_env, matchups, stage_index, time_limit,
+                        buffers)
+
+    while True:
+        command = connection.recv()
+        if command == 'reset':
+            group.reset()
+        elif command == 'step':
+            group.step()
+        elif command == 'close':
+            connection.send(None)
+            break
+        connection.send(None)
+
+    connection.close()
+
+
+class VecBattleEnv(object):
+    """Many headless battles stepped together in lockstep.
+
+    Attributes:
+        num_of_envs: An integer for the number of battles.
+        buffers: The SharedBuffers through which every battle's inputs
+            and results are passed.
+        connections: A list of the parent's end of the Pipe to each
+            worker process.
+        workers: A list of the worker Processes.
+        local_group: If there are no worker processes, the BattleGroup
+            holding every battle within this process. Otherwise, None.
+        is_waiting: A Boolean indicating whether step_async() has been
+            called without a matching step_wait().
+    """
+    def __init__(self, matchups, stage_index=0, num_of_workers=None,
+                 time_limit=TIME_LIMIT):
+        """Start every battle.
+
+        Args:
+            matchups: A list of tuples, each containing the line indexes
+                of the two characters fighting in one battle.
+            stage_index: Optional. An integer for the line index of the
+                stage that every battle is fought on. The default is 0.
+            num_of_workers: Optional. An integer for the number of
+                worker processes to divide the battles between. If this
+                is 0, every battle is run within this process instead.
+                The default is the number of processor cores.
+            time_limit: Optional. An integer for each battle's time
+                limit, in update cycles. The default is TIME_LIMIT.
+        """
+        self.num_of_envs = len(matchups)
+        self.buffers = SharedBuffers(
+            RawArray('d', self.num_of_envs * OBSERVATION_SIZE),
+            RawArray('H', self.num_of_envs * NUM_OF_PLAYERS),
+            RawArray('d', self.num_of_envs),
+            RawArray('b', self.num_of_envs))
+        self.connections = []
+        self.workers = []
+        self.local_group = None
+        self.is_waiting = False
+
+        if num_of_workers is None:
+            num_of_workers = cpu_count()
+        num_of_workers = min(num_of_workers, self.num_of_envs)
+
+        if num_of_workers <= 0:
+            self.local_group = BattleGroup(0, matchups, stage_index,
+                                           time_limit, self.buffers)
+            return
+
+        first_env = 0
+        for worker_num in xrange(0, num_of_workers):
+            group_size = ((self.num_of_envs - first_env) //
+                          (num_of_workers - worker_num))
+            parent_connection, child_connection = Pipe()
+            worker = Process(target=run_worker,
+                             args=(child_connection, first_env,
+                                   matchups[first_env:first_env + group_size],
+                                   stage_index, time_limit, self.buffers))
+            worker.daemon = True
+            worker.start()
+            child_connection.close()
+
+            self.connections.append(parent_connection)
+            self.workers.append(worker)
+            first_env += group_size
+
+    def send_command(self, command):
+        """Send a command to every worker without waiting for them to
+        carry it out. If there are no workers, the command is carried
+        out immediately.
+
+        Args:
+            command: A String for the command. See run_worker() for the
+                possible values.
+        """
+        if self.local_group is not None:
+            if command == 'reset':
+                self.local_group.reset()
+            elif command == 'step':
+                self.local_group.step()
+            return
+
+        for connection in self.connections:
+            connection.send(command)
+
+    def wait_for_workers(self):
+        """Wait until every worker has carried out its last command."""
+        for connection in self.connections:
+            connection.recv()
+
+    def reset(self):
+        """Return every battle to its start.
+
+        Returns:
+            The observations of every battle.
+        """
+        self.send_command('reset')
+        self.wait_for_workers()
+        return self.get_observations()
+
+    def step_async(self, actions):
+        """Start advancing every battle by one update cycle, without
+        waiting for them to finish.
+
+        Args:
+            actions: A sequence with one entry per battle, each a
+                sequence containing the input bitmask held by every
+                player during the update cycle. A NumPy array of shape
+                (num_of_envs, NUM_OF_PLAYERS) may be given instead.
+        """
+        if numpy is not None:
+            shared_actions = numpy.ctypeslib.as_array(self.buffers.actions)
+            shared_actions[:] = numpy.asarray(actions,
+                                              dtype=numpy.uint16).ravel()
+        else:
+            position = 0
+            for env_actions in actions:
+                for input_mask in env_actions:
+                    self.buffers.actions[position] = input_mask
+                    position += 1
+
+        self.send_command('step')
+        self.is_waiting = True
+
+    def step_wait(self):
+        """Wait for the battles started by step_async() to finish their
+        update cycle.
+
+        Returns:
+            A tuple containing the observations, rewards, and end flags
+            of every battle. Battles that ended have already been reset,
+            so their observations are of the start of the next battle.
+        """
+        self.wait_for_workers()
+        self.is_waiting = False
+
+        if numpy is not None:
+            rewards = numpy.ctypeslib.as_array(self.buffers.rewards).copy()
+            dones = numpy.ctypeslib.as_array(self.buffers.dones).astype(bool)
+        else:
+            rewards = list(self.buffers.rewards)
+            dones = [done != 0 for done in self.buffers.dones]
+
+        return (self.get_observations(), rewards, dones)
+
+    def step(self, actions):
+        """Advance every battle by one update cycle.
+
+        Args:
+            actions: A sequence with one entry per battle, each a
+                sequence containing the input bitmask held by every
+                player during the update cycle.
+
+        Returns:
+            A tuple containing the observations, rewards, and end flags
+            of every battle. See step_wait() for details.
+        """
+        self.step_async(actions)
+        return self.step_wait()
+
+    def get_observations(self):
+        """Return a copy of the current observation of every battle.
+
+        Returns:
+            A NumPy array of shape (num_of_envs, OBSERVATION_SIZE) if
+            NumPy is installed. Otherwise, a list containing a list of
+            values for each battle.
+        """
+        observations = self.buffers.observations
+        if numpy is not None:
+            return numpy.ctypeslib.as_array(observations).reshape(
+                self.num_of_envs, OBSERVATION_SIZE).copy()
+        else:
+            return [observations[position:position + OBSERVATION_SIZE]
+                    for position in xrange(0, len(observations),
+                                           OBSERVATION_SIZE)]
+
+    def close(self):
+        """Shut down every worker process."""
+        if self.is_waiting:
+            self.wait_for_workers()
+            self.is_waiting = False
+
+        self.send_command('close')
+        self.wait_for_workers()
+        for worker in self.workers:
+            worker.join()
+
+        self.connections = []
+        self.workers = []
@@ -0,0 +1,184 @@
+"""This module builds an index of a character's Actions, so that the
+battle engine can choose which Action to start without scanning every
+one of them each update.
+
+Actions are grouped by the condition the character must be in to
+perform them, and each group is sorted so that the first matching
+Action is always the one that should win: Actions with a higher
+input_priority come first, followed by Actions with a proximity limit,
+and then the order they were listed in the character's file.
+Meter and proximity requirements are stored alongside each Action, so
+that unaffordable or out-of-range Actions can be skipped before their
+inputs are compared.
+"""
+from collections import namedtuple
+from enum import IntEnum
+
+
+class ActionCondition(IntEnum):
+    """An enum containing the conditions that a character can be in,
+    as stored in an Action's condition attribute.
+
+    Values:
+        STANDING: Standing or walking on the ground.
+        CROUCHING: Crouching on the ground.
+        JUMPING: Jumping or otherwise in the air.
+    """
+    STANDING = 0
+    CROUCHING = 1
+    JUMPING = 2
+
+
+# An Action that may be started by the player's inputs.
+# action_index is the Action's index within the character's actions.
+# input_sequence is a tuple of frozensets, each containing the names of
+# the buttons that must be held during one step of the input.
+ActionCandidate = namedtuple('ActionCandidate', ['action_index', 'action',
+                                                 'input_sequence',
+                                                 'proximity',
+                                                 'meter_needed'])
+
+
+class ActionIndex(object):
+    """The Actions of a character that can be started by inputs,
+    grouped by condition and sorted by priority.
+
+    Attributes:
+        candidates: A dict mapping each condition to a tuple of
+            ActionCandidates that can be performed in it, from the
+            highest priority to the lowest.
+    """
+    def __init__(self, actions):
+        """Build the index.
+
+        Args:
+            actions: A list of the character's Actions. Actions without
+                any input steps are left out, as they are only started
+                by the game engine itself.
+        """
+        groups = {}
+
+        for action_index, action in enumerate(actions):
+            if len(action.input_list) <= 0:
+                continue
+
+            input_sequence = tuple(frozenset(input_step.inputs)
+                                   for input_step in action.input_list)
+            new_candidate = ActionCandidate(action_index, action,
+                                            input_sequence, action.proximity,
+                                            action.meter_needed)
+            groups.setdefault(action.condition, []).append(new_candidate)
+
+        self.candidates = {}
+        for condition, group in groups.items():
+            group.sort(key=get_candidate_rank)
+            self.candidates[condition] = tuple(group)
+
+    def get_candidates(self, condition):
+        """Return a tuple of the ActionCandidates that can be performed
+        in a certain condition, from the highest priority to the lowest.
+
+        Args:
+            condition: An integer for the character's condition. See
+                the ActionCondition enum for possible values.
+        """
+        return self.candidates.get(condition, ())
+
+    def find_action(self, condition, input_history, meter, distance,
+                    allowed_actions=None):
+        """Return the highest-priority Action that the player's recent
+        inputs can start.
+
+        Args:
+            condition: An integer for the character's condition. See
+                the ActionCondition enum for possible values.
+            input_history: A sequence of sets, each containing the names
+                of the buttons held during one input step, from the
+                oldest to the most recent.
+            meter: An integer for the amount of points in the player's
+                Special Gauge.
+            distance: An integer for the distance, in pixels, between
+                the character's closest Hurtbox and the opponent's.
+            allowed_actions: Optional. An integer bitset with a bit set
+                at the index of every Action that may be started, such
+                as one returned by CancelGraph.get_cancel_mask(). If
+                this is None, any Action may be started.
+
+        Returns:
+            The ActionCandidate for the chosen Action, or None if no
+            Action matches.
+        """
+        for candidate in self.get_candidates(condition):
+            if (allowed_actions is not None and
+                    not (allowed_actions >> candidate.action_index) & 1):
+                continue
+            if candidate.meter_needed > meter:
+                continue
+            if candidate.proximity > 0 and distance > candidate.proximity:
+                continue
+            if is_input_match(candidate.input_sequence, input_history):
+                return candidate
+
+        return None
+
+    def get_matched_actions(self, condition, input_history, meter,
+                            distance):
+        """Return an integer bitset with a bit set at the index of every
+        Action that the player's recent inputs can start.
+
+        Args:
+            condition: An integer for the character's condition. See
+                the ActionCondition enum for possible values.
+            input_history: A sequence of sets, each containing the names
+                of the buttons held during one input step, from the
+                oldest to the most recent.
+            meter: An integer for the amount of points in the player's
+                Special Gauge.
+            distance: An integer for the distance, in pixels, between
+                the character's closest Hurtbox and the opponent's.
+        """
+        matched_actions = 0
+
+        for candidate in self.get_candidates(condition):
+            if candidate.meter_needed > meter:
+                continue
+            if candidate.proximity > 0 and distance > candidate.proximity:
+                continue
+            if is_input_match(candidate.input_sequence, input_history):
+                matched_actions |= 1 << candidate.action_index
+
+        return matched_actions
+
+
+def get_candidate_rank(candidate):
+    """Return a tuple used for sorting ActionCandidates from the highest
+    priority to the lowest.
+
+    Args:
+        candidate: An ActionCandidate.
+    """
+    has_proximity = candidate.proximity > 0
+    return (-candidate.action.input_priority, not has_proximity,
+            candidate.action_index)
+
+
+def is_input_match(input_sequence, input_history):
+    """Return a Boolean indicating whether the most recent input steps
+    contain all of the buttons required by an input sequence.
+
+    Args:
+        input_sequence: A tuple of frozensets, each containing the names
+            of the buttons required during one step of the input.
+        input_history: A sequence of sets, each containing the names of
+            the buttons held during one input step, from the oldest to
+            the most recent.
+    """
+    if len(input_sequence) > len(input_history):
+        return False
+
+    recent_steps = input_history[len(input_history) - len(input_sequence):]
+    for required_inputs, held_inputs in zip(input_sequence, recent_steps):
+        if not required_inputs.issubset(held_inputs):
+            return False
+
+    return True
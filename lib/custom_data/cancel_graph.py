@@ -0,0 +1,155 @@
+"""This module compiles the cancelable values of a character's Frames
+into a graph of which Actions each Frame may be cancelled into.
+
+Each Action is given one bit within an integer bitset, at the position
+of its index within the character's actions. For every Frame of every
+Action, the graph stores the bitset of Actions that Frame may cancel
+into. During battle, checking which cancels are possible is then a
+single bitwise AND between that bitset and the bitset of Actions whose
+inputs were just matched.
+
+Module Constants:
+    NOT_CANCELABLE (int): The cancelable value of Frames that can't be
+        interrupted.
+    CANCELABLE (int): The cancelable value of Frames that can always be
+        interrupted by another Action.
+    CANCELABLE_ON_HIT (int): The cancelable value of Frames that can
+        only be interrupted if one of their Hitboxes struck the
+        opponent.
+"""
+from collections import namedtuple
+
+
+NOT_CANCELABLE = 0
+CANCELABLE = 1
+CANCELABLE_ON_HIT = 2
+
+
+# One row of a cancel table, describing which Actions a single Frame may
+# be cancelled into. target_names is a tuple of the Actions' names.
+CancelRow = namedtuple('CancelRow', ['action_index', 'action_name',
+                                     'frame_index', 'cancelable',
+                                     'target_names'])
+
+
+class CancelGraph(object):
+    """The Actions that each of a character's Frames may be cancelled
+    into.
+
+    A Frame may be cancelled into any Action that can be started by
+    inputs in the same condition as the Frame's own Action.
+
+    Attributes:
+        actions: A list of the character's Actions.
+        cancel_masks: A tuple containing, for each Action, a tuple of
+            integer bitsets. Each bitset has a bit set for every Action
+            that the corresponding Frame may cancel into, provided that
+            its cancel requirement is met.
+        requires_hit: A tuple containing, for each Action, a tuple of
+            Booleans indicating whether each Frame can only be cancelled
+            after it lands a hit.
+    """
+    def __init__(self, actions, action_index):
+        """Compile the graph.
+
+        Args:
+            actions: A list of the character's Actions.
+            action_index: The character's ActionIndex, which lists the
+                Actions that can be started by inputs in each condition.
+        """
+        self.actions = actions
+        condition_masks = {}
+        for condition, candidates in action_index.candidates.items():
+            condition_masks[condition] = get_bitset(
+                candidate.action_index for candidate in candidates)
+
+        cancel_masks = []
+        requires_hit = []
+        for action in actions:
+            targets = condition_masks.get(action.condition, 0)
+            action_masks = []
+            action_requires_hit = []
+
+            for frame in action.frames:
+                if frame.cancelable == NOT_CANCELABLE:
+                    action_masks.append(0)
+                else:
+                    action_masks.append(targets)
+                action_requires_hit.append(
+                    frame.cancelable == CANCELABLE_ON_HIT)
+
+            cancel_masks.append(tuple(action_masks))
+            requires_hit.append(tuple(action_requires_hit))
+
+        self.cancel_masks = tuple(cancel_masks)
+        self.requires_hit = tuple(requires_hit)
+
+    def get_cancel_mask(self, action_index, frame_index, has_hit=False):
+        """Return an integer bitset of the Actions that a Frame can be
+        cancelled into right now.
+
+        Args:
+            action_index: An integer for the index of the Action being
+                performed.
+            frame_index: An integer for the index of the Frame currently
+                shown within that Action.
+            has_hit: Optional. A Boolean indicating whether the Action
+                has struck the opponent. The default is False.
+        """
+        if self.requires_hit[action_index][frame_index] and not has_hit:
+            return 0
+        else:
+            return self.cancel_masks[action_index][frame_index]
+
+    def get_cancel_table(self):
+        """Return a list of CancelRows describing every cancelable Frame
+        of every Action, for use by frame data tools.
+        """
+        cancel_table = []
+
+        for action_index, action in enumerate(self.actions):
+            for frame_index, frame in enumerate(action.frames):
+                cancel_mask = self.cancel_masks[action_index][frame_index]
+                if cancel_mask == 0:
+                    continue
+
+                target_names = tuple(self.actions[target].name
+                                     for target in get_bit_indexes(
+                                         cancel_mask))
+                cancel_table.append(CancelRow(action_index, action.name,
+                                              frame_index, frame.cancelable,
+                                              target_names))
+
+        return cancel_table
+
+
+def get_bitset(indexes):
+    """Return an integer bitset with a bit set at each index.
+
+    Args:
+        indexes: An iterable of non-negative integers.
+    """
+    bitset = 0
+    for index in indexes:
+        bitset |= 1 << index
+
+    return bitset
+
+
+def get_bit_indexes(bitset):
+    """Return a list of the indexes of the bits set within a bitset,
+    in ascending order.
+
+    Args:
+        bitset: A non-negative integer bitset.
+    """
+    indexes = []
+    index = 0
+
+    while bitset:
+        if bitset & 1:
+            indexes.append(index)
+        bitset >>= 1
+        index += 1
+
+    return indexes
@@ -6,6 +6,7 @@ classes.
 """
 import pygame
 from pygame.locals import Rect
+from lib.frame_timeline import FrameTimeline
 
 
 def load_frame_durations(action):
@@ -23,6 +24,16 @@ def load_frame_durations(action):
     return tuple(frame_durations)
 
 
+def load_frame_timeline(action):
+    """Return a FrameTimeline for finding which Frame of an Action is
+    shown at any tick.
+
+    Args:
+        action: The Action that will be read.
+    """
+    return FrameTimeline(load_frame_durations(action))
+
+
 class CharacterData(object):
     """A data class that stores all of the required information for a
     playable character.
@@ -57,6 +68,14 @@ class CharacterData(object):
                             e.g. walk => 0 (The first Action listed in
                                             the character's XML file.)
                                  stand => 2 (The third Action listed.)
+        action_index        An ActionIndex for choosing which Action
+                            the player's inputs start. This isn't read
+                            from the XML file; it is built once by the
+                            character loader.
+        cancel_graph        A CancelGraph of the Actions that each
+                            Frame can be cancelled into. Like
+                            action_index, this is built by the
+                            character loader.
         """
     def __init__(self):
         self.name = ""
@@ -157,6 +176,11 @@ class Action(object):
                                 this Action.
         input_list              A List detailing the required button
                                 sequence needed to perform this Action.
+        timeline                A FrameTimeline for finding the Frame
+                                shown at any tick of this Action.
+                                This isn't read from the XML file; it
+                                is compiled once by the character
+                                loader.
     """
     def __init__(self):
         self.name = ""
@@ -304,6 +328,35 @@ class Hitbox(CollisionBox):
         self.can_block_low = False
 
 
+class Projectile(object):
+    """A Projectile fired from a Frame. The Projectile's animation and
+    Hitboxes are kept in a separate file, which is shared by every
+    Frame that fires it.
+
+    Attributes:
+        filepath            The filepath for the Projectile's XML
+                            file, which is loaded into a ProjectileData
+                            object. All Projectile files are kept in
+                            the characters folder, so 'characters/' is
+                            omitted from this String.
+        x_offset            The horizontal distance, in pixels, from
+                            the character's position to the position
+                            where the Projectile appears.
+        y_offset            The vertical distance from the character's
+                            position to the Projectile's starting
+                            position.
+        x_speed             The speed, in pixels/second, at which the
+                            Projectile travels forward.
+        y_speed             The Projectile's vertical speed.
+    """
+    def __init__(self):
+        self.filepath = ""
+        self.x_offset = 0
+        self.y_offset = 0
+        self.x_speed = 0
+        self.y_speed = 0
+
+
 class ProjectileData(object):
     """A damaging weapon that can be thrown by the character. It can be
     anything, from fireballs to bullets to stone bricks.
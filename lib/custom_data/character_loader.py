@@ -12,6 +12,10 @@ Attributes:
 """
 import os
 from lib.custom_data.xml_ops import load_xml_doc_as_object
+from lib.custom_data.flyweights import intern_character
+from lib.custom_data.character_data import load_frame_timeline
+from lib.custom_data.action_index import ActionIndex
+from lib.custom_data.cancel_graph import CancelGraph
 from lib.custom_data.text_ops import get_prefixed_lines_from_txt
 from lib.custom_data.text_ops import num_of_lines_in_txt
 
@@ -70,6 +74,12 @@ def load_character(line_index):
         return None
     else:
         prepend_prefix_to_filepaths(char_data)
+        intern_character(char_data)
+        for action in char_data.actions:
+            action.timeline = load_frame_timeline(action)
+        char_data.action_index = ActionIndex(char_data.actions)
+        char_data.cancel_graph = CancelGraph(char_data.actions,
+                                             char_data.action_index)
         return char_data
 
 
@@ -83,6 +93,9 @@ def prepend_prefix_to_filepaths(character):
     character.mugshot_path = prepend_prefix(character.mugshot_path)
     for action in character.actions:
         action.spritesheet_path = prepend_prefix(action.spritesheet_path)
+        for frame in action.frames:
+            for projectile in frame.projectiles:
+                projectile.filepath = prepend_prefix(projectile.filepath)
 
 
 def prepend_prefix(filepath):
@@ -0,0 +1,316 @@
+"""This module reads character and stage files out of a single content
+pack, rather than from hundreds of loose files.
+
+A content pack begins with a small header, followed by the contents of
+every packed file one after another, and finally an index of where each
+file lies within the pack. The pack is memory-mapped when it is opened,
+so reading a file from it doesn't require any further opens.
+
+Loose files always take priority, so characters and stages can still be
+modded by editing their files as usual. A file is only read from the
+pack if it doesn't exist on disk, which lets a release ship the pack on
+its own. Index files that the game generates while running are never
+packed, as they would go out of date as soon as the roster changed.
+
+To build a content pack from the current directory layout, run:
+
+    python -m lib.custom_data.content_pack [pack_path]
+
+Module Constants:
+    CONTENT_PACK_PATH (String): The file path to the content pack.
+    PACKED_DIRECTORIES (tuple of String): The directories whose files
+        are added to the content pack by the packer.
+    GENERATED_FILENAMES (tuple of String): The names of files that the
+        game generates within PACKED_DIRECTORIES, which are left out of
+        the content pack.
+    MAGIC (String): The four bytes that every content pack begins with.
+    PACK_VERSION (int): The version of the content pack format. Packs
+        of any other version are ignored.
+    HEADER (Struct): The layout of the pack's header. It contains
+        MAGIC, PACK_VERSION, and the byte offset and size of the index.
+"""
+import os
+import sys
+import json
+import mmap
+import struct
+import argparse
+from threading import Lock
+from cStringIO import StringIO
+
+
+CONTENT_PACK_PATH = 'content.pack'
+PACKED_DIRECTORIES = ('characters', 'stages')
+GENERATED_FILENAMES = ('roster_index.json', 'stage_index.json')
+MAGIC = 'SCPK'
+PACK_VERSION = 1
+HEADER = struct.Struct('<4sHQQ')
+
+_pack = None
+_pack_is_loaded = False
+_pack_lock = Lock()
+
+
+class ContentPack(object):
+    """A read-only, memory-mapped archive of game content files.
+
+    Attributes:
+        pack_path: A String for the file path to the content pack.
+        mapped_file: An mmap of the entire content pack.
+        index: A dict mapping the normalized file path of every packed
+            file to a tuple of two integers: the file's byte offset
+            within the pack, and its size in bytes.
+    """
+    def __init__(self, pack_path):
+        """Open the content pack and read its index.
+
+        Args:
+            pack_path: A String for the file path to the content pack.
+
+        Raises:
+            IOError: The file couldn't be opened or isn't a valid
+                content pack.
+        """
+        self.pack_path = pack_path
+        with open(pack_path, 'rb') as pack_file:
+            self.mapped_file = mmap.mmap(pack_file.fileno(), 0,
+                                         access=mmap.ACCESS_READ)
+
+        if len(self.mapped_file) < HEADER.size:
+            self.close()
+            raise IOError('%s is not a content pack.' % pack_path)
+
+        magic, version, index_offset, index_size = HEADER.unpack_from(
+            self.mapped_file, 0)
+        if magic != MAGIC or version != PACK_VERSION:
+            self.close()
+            raise IOError('%s is not a supported content pack.' % pack_path)
+
+        index_json = self.mapped_file[index_offset:index_offset + index_size]
+        self.index = {path: tuple(location) for path, location
+                      in json.loads(index_json).items()}
+
+    def has_file(self, filepath):
+        """Return a Boolean indicating whether a file is in the pack.
+
+        Args:
+            filepath: A String for the file's path, relative to the
+                game's root directory.
+        """
+        return normalize_path(filepath) in self.index
+
+    def read_file(self, filepath):
+        """Return a String containing the entire contents of a packed
+        file.
+
+        Args:
+            filepath: A String for the file's path, relative to the
+                game's root directory.
+
+        Raises:
+            KeyError: The file isn't in the pack.
+        """
+        offset, size = self.index[normalize_path(filepath)]
+        return self.mapped_file[offset:offset + size]
+
+    def close(self):
+        """Release the content pack's memory map."""
+        self.mapped_file.close()
+
+
+def normalize_path(filepath):
+    """Return a file path in the form used by content pack indexes:
+    relative, without redundant separators, and with forward slashes.
+
+    Args:
+        filepath: A String for a file path.
+    """
+    return os.path.normpath(filepath).replace(os.sep, '/')
+
+
+def get_content_pack():
+    """Return the game's ContentPack, opening it the first time this is
+    called. If there is no valid content pack, None is returned.
+    """
+    global _pack, _pack_is_loaded
+
+    with _pack_lock:
+        if not _pack_is_loaded:
+            _pack_is_loaded = True
+            if os.path.isfile(CONTENT_PACK_PATH):
+                try:
+                    _pack = ContentPack(CONTENT_PACK_PATH)
+                except (IOError, ValueError, struct.error):
+                    _pack = None
+
+    return _pack
+
+
+def content_exists(filepath):
+    """Return a Boolean indicating whether a content file exists,
+    either as a loose file or within the content pack.
+
+    Args:
+        filepath: A String for the file's path, relative to the game's
+            root directory.
+    """
+    if os.path.isfile(filepath):
+        return True
+
+    pack = get_content_pack()
+    return pack is not None and pack.has_file(filepath)
+
+
+def get_content_signature(filepath):
+    """Return a list of two integers that changes whenever a content
+    file is modified: the file's size in bytes and its modification
+    time. Files that are only found in the content pack use the pack's
+    modification time.
+
+    If the file doesn't exist, None is returned instead.
+
+    Args:
+        filepath: A String for the file's path, relative to the game's
+            root directory.
+    """
+    try:
+        file_stats = os.stat(filepath)
+        return [file_stats.st_size, int(file_stats.st_mtime)]
+    except OSError:
+        pass
+
+    pack = get_content_pack()
+    if pack is not None and pack.has_file(filepath):
+        size = pack.index[normalize_path(filepath)][1]
+        return [size, int(os.path.getmtime(pack.pack_path))]
+    return None
+
+
+def read_content(filepath):
+    """Return a String containing the entire contents of a content
+    file, read from the content pack if it doesn't exist on disk.
+
+    Args:
+        filepath: A String for the file's path, relative to the game's
+            root directory.
+
+    Raises:
+        IOError: The file doesn't exist on disk and isn't packed.
+    """
+    try:
+        with open(filepath, 'rb') as loose_file:
+            return loose_file.read()
+    except IOError:
+        pack = get_content_pack()
+        if pack is None or not pack.has_file(filepath):
+            raise
+
+    return pack.read_file(filepath)
+
+
+def open_content(filepath):
+    """Return a read-only file-like object for a content file, read
+    from the content pack if it doesn't exist on disk.
+
+    This can be passed to functions that accept open files, such as
+    pygame.image.load() and lxml's etree.parse().
+
+    Args:
+        filepath: A String for the file's path, relative to the game's
+            root directory.
+
+    Raises:
+        IOError: The file isn't packed and doesn't exist on disk.
+    """
+    return StringIO(read_content(filepath))
+
+
+# ============================================================================
+# Packing
+# ============================================================================
+def list_content_files(directories):
+    """Return a sorted list of normalized file paths for every file
+    within some directories and their subdirectories, apart from those
+    named in GENERATED_FILENAMES.
+
+    Args:
+        directories: A tuple of Strings for the directory paths.
+    """
+    filepaths = []
+
+    for directory in directories:
+        for dir_path, dir_names, filenames in os.walk(directory):
+            for filename in filenames:
+                if filename in GENERATED_FILENAMES:
+                    continue
+                filepaths.append(normalize_path(os.path.join(dir_path,
+                                                             filename)))
+
+    return sorted(filepaths)
+
+
+def build_pack(pack_path, directories=PACKED_DIRECTORIES):
+    """Write every file within some directories into a new content
+    pack.
+
+    Args:
+        pack_path: A String for the file path of the new content pack.
+            An existing pack at this path will be replaced.
+        directories: Optional. A tuple of Strings for the paths of the
+            directories to pack. The default is PACKED_DIRECTORIES.
+
+    Returns:
+        An integer for the number of files that were packed.
+    """
+    index = {}
+    temp_path = pack_path + '.tmp'
+
+    with open(temp_path, 'wb') as pack_file:
+        # The header is rewritten once the index's location is known.
+        pack_file.write(HEADER.pack(MAGIC, PACK_VERSION, 0, 0))
+
+        for filepath in list_content_files(directories):
+            with open(filepath, 'rb') as content_file:
+                contents = content_file.read()
+            index[filepath] = (pack_file.tell(), len(contents))
+            pack_file.write(contents)
+
+        index_offset = pack_file.tell()
+        index_json = json.dumps(index, sort_keys=True)
+        pack_file.write(index_json)
+
+        pack_file.seek(0)
+        pack_file.write(HEADER.pack(MAGIC, PACK_VERSION, index_offset,
+                                    len(index_json)))
+
+    # Windows won't rename a file over an existing one.
+    if os.path.exists(pack_path):
+        os.remove(pack_path)
+    os.rename(temp_path, pack_path)
+
+    return len(index)
+
+
+def main(argv):
+    """Build a content pack from the command line.
+
+    Args:
+        argv: A list of Strings for the command-line arguments, not
+            including the program name.
+    """
+    parser = argparse.ArgumentParser(
+        description='Pack all character and stage files into a single '
+                    'content pack.')
+    parser.add_argument('pack_path', nargs='?', default=CONTENT_PACK_PATH,
+                        help='The file path of the new content pack.')
+    parser.add_argument('directories', nargs='*',
+                        default=list(PACKED_DIRECTORIES),
+                        help='The directories to pack.')
+    args = parser.parse_args(argv)
+
+    file_amount = build_pack(args.pack_path, tuple(args.directories))
+    print 'Packed %d files into %s.' % (file_amount, args.pack_path)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,230 @@
+"""This module shares identical pieces of character data between every
+place they appear, rather than keeping a separate copy of each one.
+
+Character files repeat themselves heavily: consecutive Frames of an
+Action often have the same Hurtboxes, and an attack's Hitbox usually
+appears unchanged on every one of its active Frames. When a character
+is loaded, each of these becomes its own object. Interning replaces
+every copy with a single shared instance, so that the roster's
+collision data only holds one of each distinct box, box list, Frame,
+and String.
+
+Since all character data is read-only once loaded, sharing instances
+is safe. It also means that two interned boxes or box lists are equal
+if and only if they are the same object, so they can be compared with
+'is' instead of comparing every attribute.
+
+Interned box lists are stored as tuples, so that they can't be
+modified by accident.
+"""
+import sys
+from collections import namedtuple
+from threading import Lock
+
+
+# Counts of the items passed through a FlyweightPool, along with an
+# estimate of the memory that interning them saved, in bytes.
+InternStats = namedtuple('InternStats', ['boxes_loaded', 'unique_boxes',
+                                         'box_lists_loaded',
+                                         'unique_box_lists',
+                                         'frames_loaded', 'unique_frames',
+                                         'strings_loaded', 'unique_strings',
+                                         'bytes_saved'])
+
+
+class FlyweightPool(object):
+    """Keeps one shared instance of each distinct collision box, box
+    list, Frame, and String that has been interned.
+
+    Attributes:
+        boxes: A dict mapping the contents of each distinct box to its
+            shared instance.
+        box_lists: A dict mapping each distinct tuple of shared boxes
+            to itself.
+        frames: A dict mapping the contents of each distinct Frame to
+            its shared instance.
+        strings: A dict mapping each distinct String to its shared
+            instance.
+        counts: A dict mapping the name of each kind of item to the
+            number of them that have been interned, including
+            duplicates.
+        bytes_saved: An integer estimate of the memory, in bytes, freed
+            by replacing duplicates with shared instances.
+        lock: A Lock that guards the pool, since characters may be
+            loaded on a separate thread.
+    """
+    def __init__(self):
+        """Declare and initialize instance variables."""
+        self.boxes = {}
+        self.box_lists = {}
+        self.frames = {}
+        self.strings = {}
+        self.counts = {'boxes': 0, 'box_lists': 0, 'frames': 0,
+                       'strings': 0}
+        self.bytes_saved = 0
+        self.lock = Lock()
+
+    def intern_character(self, character):
+        """Replace all of the boxes, box lists, Frames, and Strings
+        within a character with shared instances.
+
+        Args:
+            character: A CharacterData object.
+        """
+        with self.lock:
+            character.name = self.intern_string(character.name)
+            for action in character.actions:
+                self.intern_action(action)
+
+    def intern_projectile(self, projectile_data):
+        """Replace all of the boxes, box lists, Frames, and Strings
+        within a Projectile's data with shared instances.
+
+        Args:
+            projectile_data: A ProjectileData object.
+        """
+        with self.lock:
+            projectile_data.name = self.intern_string(projectile_data.name)
+            projectile_data.spritesheet_path = self.intern_string(
+                projectile_data.spritesheet_path)
+            projectile_data.frames = [self.intern_frame(frame)
+                                      for frame in projectile_data.frames]
+
+    def intern_action(self, action):
+        """Replace all of the boxes, box lists, Frames, and Strings
+        within an Action with shared instances.
+
+        Args:
+            action: An Action object.
+        """
+        action.name = self.intern_string(action.name)
+        action.spritesheet_path = self.intern_string(action.spritesheet_path)
+
+        for input_step in action.input_list:
+            input_step.inputs = [self.intern_string(input_name)
+                                 for input_name in input_step.inputs]
+
+        action.frames = [self.intern_frame(frame) for frame in action.frames]
+
+    def intern_frame(self, frame):
+        """Return the shared instance of a Frame, interning its box
+        lists first.
+
+        Frames that create Projectiles are never shared, though their
+        box lists still are.
+
+        Args:
+            frame: A Frame object.
+        """
+        frame.hurtboxes = self.intern_box_list(frame.hurtboxes)
+        frame.hitboxes = self.intern_box_list(frame.hitboxes)
+
+        self.counts['frames'] += 1
+        if len(frame.projectiles) > 0:
+            return frame
+
+        key = (frame.duration, frame.cancelable, frame.move_x, frame.move_y,
+               frame.hurtboxes, frame.hitboxes)
+        return self.intern_object(self.frames, key, frame)
+
+    def intern_box_list(self, boxes):
+        """Return the shared tuple for a list of collision boxes.
+
+        Args:
+            boxes: A list of Hurtboxes or Hitboxes.
+        """
+        self.counts['box_lists'] += 1
+        shared_boxes = tuple(self.intern_box(box) for box in boxes)
+
+        if shared_boxes in self.box_lists:
+            self.bytes_saved += sys.getsizeof(shared_boxes)
+        else:
+            self.box_lists[shared_boxes] = shared_boxes
+
+        return self.box_lists[shared_boxes]
+
+    def intern_box(self, box):
+        """Return the shared instance of a collision box.
+
+        Args:
+            box: A Hurtbox or Hitbox.
+        """
+        self.counts['boxes'] += 1
+        key = (type(box), tuple(sorted(vars(box).items())))
+        return self.intern_object(self.boxes, key, box)
+
+    def intern_object(self, pool, key, obj):
+        """Return the shared instance of an object from one of the
+        pools, adding the object as the shared instance if its contents
+        haven't been seen before.
+
+        Args:
+            pool: The dict that shared instances of this kind of object
+                are kept in.
+            key: A hashable value describing the object's contents.
+            obj: The object to intern.
+        """
+        if key in pool:
+            self.bytes_saved += sys.getsizeof(obj) + sys.getsizeof(vars(obj))
+        else:
+            pool[key] = obj
+
+        return pool[key]
+
+    def intern_string(self, text):
+        """Return the shared instance of a String.
+
+        Args:
+            text: A String.
+        """
+        self.counts['strings'] += 1
+
+        if text in self.strings:
+            if self.strings[text] is not text:
+                self.bytes_saved += sys.getsizeof(text)
+        else:
+            self.strings[text] = text
+
+        return self.strings[text]
+
+    def get_stats(self):
+        """Return an InternStats tuple describing everything that has
+        been interned so far.
+        """
+        with self.lock:
+            return InternStats(self.counts['boxes'], len(self.boxes),
+                               self.counts['box_lists'],
+                               len(self.box_lists),
+                               self.counts['frames'], len(self.frames),
+                               self.counts['strings'], len(self.strings),
+                               self.bytes_saved)
+
+
+_pool = FlyweightPool()
+
+
+def intern_character(character):
+    """Replace all of the boxes, box lists, Frames, and Strings within
+    a character with instances shared by the entire roster.
+
+    Args:
+        character: A CharacterData object.
+    """
+    _pool.intern_character(character)
+
+
+def intern_projectile(projectile_data):
+    """Replace all of the boxes, box lists, Frames, and Strings within
+    a Projectile's data with instances shared by the entire roster.
+
+    Args:
+        projectile_data: A ProjectileData object.
+    """
+    _pool.intern_projectile(projectile_data)
+
+
+def get_intern_stats():
+    """Return an InternStats tuple describing every character interned
+    so far.
+    """
+    return _pool.get_stats()
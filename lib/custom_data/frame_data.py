@@ -0,0 +1,358 @@
+"""This module measures the frame data of every Action in the roster,
+for balancing characters.
+
+For each Action, it finds the startup, active, and recovery frames,
+the total duration, the damage dealt, the frame advantage on hit and on
+block, the reach and coverage of its Hitboxes, and the Actions it can
+be cancelled into. All times are given in update cycles. Startup counts
+up to and including the first update cycle with an active Hitbox, and
+advantage assumes the hit lands on that first active update cycle.
+
+Every Hitbox of a character is first copied into one table of typed
+arrays, with each Action's Hitboxes stored contiguously. Each Action is
+then measured by scanning its slice of the table in plain Python; the
+measurements are not vectorized. This stays quick because results are
+cached by a hash of each character file's contents, so only characters
+that have changed since the last run are loaded and scanned again.
+
+To write the frame data of the whole roster as CSV, run:
+
+    python -m lib.custom_data.frame_data [--format json] [--output path]
+
+Module Constants:
+    FRAME_DATA_CACHE_PATH (String): The file path to the cache.
+    ANALYZER_VERSION (int): The version of the measurements. Cached
+        results from any other version are measured again.
+    HITBOX_COLUMNS (list of String): The names of the columns in a
+        HitboxTable.
+"""
+import os
+import sys
+import csv
+import json
+import hashlib
+import argparse
+from array import array
+from collections import namedtuple
+from lib.custom_data.character_loader import (load_character,
+                                              CHARACTER_LIST_PATH,
+                                              FILEPATH_PREFIX)
+from lib.custom_data.cancel_graph import get_bit_indexes
+from lib.custom_data.content_pack import read_content
+from lib.custom_data.text_ops import get_prefixed_lines_from_txt
+
+
+FRAME_DATA_CACHE_PATH = 'cache/frame_data.json'
+ANALYZER_VERSION = 1
+HITBOX_COLUMNS = ['frame', 'x_offset', 'y_offset', 'width', 'height',
+                  'damage', 'hitstun', 'blockstun']
+
+
+# The frame data of a single Action. on_hit, on_block, and the reach
+# and coverage fields are None for Actions without any Hitboxes.
+# cancels is a tuple of the names of the Actions it can be cancelled
+# into from any of its Frames.
+FrameDataRow = namedtuple('FrameDataRow', ['character', 'action_index',
+                                           'action', 'startup', 'active',
+                                           'recovery', 'total', 'damage',
+                                           'hitstun', 'blockstun', 'on_hit',
+                                           'on_block', 'reach', 'reach_top',
+                                           'reach_bottom', 'coverage',
+                                           'cancels'])
+
+
+class HitboxTable(object):
+    """Every Hitbox of a character, with each attribute kept in its own
+    typed array.
+
+    The Hitboxes of each Action are stored one after another, in the
+    order of the Actions and then of their Frames, so that an Action's
+    Hitboxes can be scanned as one slice of each column.
+
+    Attributes:
+        action_starts: An array of the position within the columns where
+            each Action's Hitboxes begin. It has one more entry than
+            there are Actions, so Action a's Hitboxes lie between
+            action_starts[a] and action_starts[a + 1].
+        frame: An array of the index of the Frame each Hitbox is on.
+        x_offset: An array of each Hitbox's x_offset.
+        y_offset: An array of each Hitbox's y_offset.
+        width: An array of each Hitbox's width.
+        height: An array of each Hitbox's height.
+        damage: An array of each Hitbox's damage.
+        hitstun: An array of each Hitbox's hitstun.
+        blockstun: An array of each Hitbox's blockstun.
+    """
+    def __init__(self, actions):
+        """Compile the Hitboxes of a list of Actions.
+
+        Args:
+            actions: A list of Actions.
+        """
+        for column in HITBOX_COLUMNS:
+            setattr(self, column, array('i'))
+        self.action_starts = array('i', [0])
+
+        for action in actions:
+            for frame_index, frame in enumerate(action.frames):
+                for hitbox in frame.hitboxes:
+                    self.frame.append(frame_index)
+                    for column in HITBOX_COLUMNS[1:]:
+                        getattr(self, column).append(getattr(hitbox, column))
+            self.action_starts.append(len(self.frame))
+
+    def get_slice(self, column, action_index):
+        """Return an array of the values in a column for every Hitbox
+        of one Action.
+
+        Args:
+            column: A String for the name of the column.
+            action_index: An integer for the index of the Action.
+        """
+        start = self.action_starts[action_index]
+        end = self.action_starts[action_index + 1]
+        return getattr(self, column)[start:end]
+
+
+def analyze_character(character):
+    """Return a list of FrameDataRows for every Action of a character.
+
+    Args:
+        character: A CharacterData object, as loaded by the character
+            loader.
+    """
+    hitbox_table = HitboxTable(character.actions)
+    cancel_graph = character.cancel_graph
+    rows = []
+
+    for action_index, action in enumerate(character.actions):
+        cancel_mask = 0
+        for frame_mask in cancel_graph.cancel_masks[action_index]:
+            cancel_mask |= frame_mask
+        cancels = tuple(character.actions[target].name
+                        for target in get_bit_indexes(cancel_mask))
+
+        rows.append(analyze_action(character.name, action_index, action,
+                                   hitbox_table, cancels))
+
+    return rows
+
+
+def analyze_action(character_name, action_index, action, hitbox_table,
+                   cancels):
+    """Return a FrameDataRow for a single Action, by scanning its
+    slice of the HitboxTable.
+
+    Args:
+        character_name: A String for the name of the Action's character.
+        action_index: An integer for the index of the Action.
+        action: The Action.
+        hitbox_table: The HitboxTable of the Action's character.
+        cancels: A tuple of the names of the Actions this one can be
+            cancelled into.
+    """
+    timeline = action.timeline
+    total = timeline.total_duration
+    frames = hitbox_table.get_slice('frame', action_index)
+    if len(frames) <= 0:
+        return FrameDataRow(character_name, action_index, action.name, 0, 0,
+                            total, total, 0, 0, 0, None, None, None, None,
+                            None, None, cancels)
+
+    first_active_tick = timeline.get_start_tick(min(frames))
+    last_active_end = timeline.frame_ends[max(frames)]
+    startup = first_active_tick + 1
+    active = last_active_end - first_active_tick
+    recovery = total - last_active_end
+
+    damage = hitbox_table.get_slice('damage', action_index)
+    if action.is_multi_hit:
+        # Each Frame may land one hit, with its strongest Hitbox.
+        frame_damage = {}
+        for frame_index, hitbox_damage in zip(frames, damage):
+            frame_damage[frame_index] = max(hitbox_damage,
+                                            frame_damage.get(frame_index, 0))
+        total_damage = sum(frame_damage.values())
+    else:
+        total_damage = max(damage)
+
+    hitstun = max(hitbox_table.get_slice('hitstun', action_index))
+    blockstun = max(hitbox_table.get_slice('blockstun', action_index))
+    remaining_ticks = total - startup
+
+    x_offsets = hitbox_table.get_slice('x_offset', action_index)
+    y_offsets = hitbox_table.get_slice('y_offset', action_index)
+    widths = hitbox_table.get_slice('width', action_index)
+    heights = hitbox_table.get_slice('height', action_index)
+    reach = max(x + width for x, width in zip(x_offsets, widths))
+    reach_top = min(y_offsets)
+    reach_bottom = max(y + height for y, height in zip(y_offsets, heights))
+    coverage = (reach - min(x_offsets)) * (reach_bottom - reach_top)
+
+    return FrameDataRow(character_name, action_index, action.name, startup,
+                        active, recovery, total, total_damage, hitstun,
+                        blockstun, hitstun - remaining_ticks,
+                        blockstun - remaining_ticks, reach, reach_top,
+                        reach_bottom, coverage, cancels)
+
+
+def analyze_roster(use_cache=True):
+    """Return a list of FrameDataRows for every Action of every
+    character in the character list.
+
+    Args:
+        use_cache: Optional. A Boolean indicating whether to reuse the
+            cached results of characters that haven't changed, and to
+            save the new results afterwards. The default is True.
+    """
+    character_paths = get_prefixed_lines_from_txt(CHARACTER_LIST_PATH,
+                                                  FILEPATH_PREFIX)
+    if use_cache:
+        cache = load_cache()
+    else:
+        cache = {}
+    new_cache = {}
+    rows = []
+
+    for line_index, character_path in enumerate(character_paths):
+        try:
+            content_hash = hashlib.sha1(
+                read_content(character_path)).hexdigest()
+        except IOError:
+            continue
+
+        cached_entry = cache.get(character_path)
+        if cached_entry is not None and cached_entry['hash'] == content_hash:
+            character_rows = [FrameDataRow(*values)
+                              for values in cached_entry['rows']]
+        else:
+            character = load_character(line_index)
+            if character is None:
+                continue
+            character_rows = analyze_character(character)
+
+        new_cache[character_path] = {'hash': content_hash,
+                                     'rows': character_rows}
+        rows.extend(character_rows)
+
+    if use_cache and new_cache != cache:
+        save_cache(new_cache)
+
+    return rows
+
+
+def load_cache():
+    """Return a dict mapping the file path of every cached character to
+    a dict containing its content 'hash' and its frame data 'rows'.
+
+    An empty dict is returned if the cache is missing or out of date.
+    """
+    try:
+        with open(FRAME_DATA_CACHE_PATH, 'r') as cache_file:
+            cache = json.load(cache_file)
+        if cache['version'] == ANALYZER_VERSION:
+            characters = cache['characters']
+            for entry in characters.values():
+                entry['rows'] = [FrameDataRow(*to_row_values(values))
+                                 for values in entry['rows']]
+            return characters
+    except (IOError, ValueError, KeyError, TypeError):
+        pass
+
+    return {}
+
+
+def save_cache(characters):
+    """Write the frame data of every character to the cache. If it can't
+    be written, the roster will simply be measured again next time.
+
+    Args:
+        characters: A dict mapping the file path of every character to a
+            dict containing its content 'hash' and its frame data
+            'rows'.
+    """
+    cache = {'version': ANALYZER_VERSION, 'characters': characters}
+    try:
+        cache_directory = os.path.dirname(FRAME_DATA_CACHE_PATH)
+        if not os.path.isdir(cache_directory):
+            os.makedirs(cache_directory)
+
+        with open(FRAME_DATA_CACHE_PATH, 'w') as cache_file:
+            json.dump(cache, cache_file, sort_keys=True)
+    except (IOError, OSError):
+        pass
+
+
+def to_row_values(values):
+    """Return a list of FrameDataRow values read from JSON, with the
+    cancels list converted back into a tuple.
+
+    Args:
+        values: A list of the values of a FrameDataRow.
+    """
+    values = list(values)
+    values[-1] = tuple(values[-1])
+    return values
+
+
+def write_csv(rows, output_file):
+    """Write frame data as CSV, with one line per Action.
+
+    Args:
+        rows: A list of FrameDataRows.
+        output_file: A file object opened for writing.
+    """
+    writer = csv.writer(output_file)
+    writer.writerow(FrameDataRow._fields)
+    for row in rows:
+        values = ['' if value is None else value for value in row]
+        values[-1] = ';'.join(row.cancels)
+        writer.writerow(values)
+
+
+def write_json(rows, output_file):
+    """Write frame data as a JSON list, with one object per Action.
+
+    Args:
+        rows: A list of FrameDataRows.
+        output_file: A file object opened for writing.
+    """
+    json.dump([row._asdict() for row in rows], output_file, indent=2)
+
+
+def main(argv):
+    """Write the frame data of the whole roster from the command line.
+
+    Args:
+        argv: A list of Strings for the command-line arguments, not
+            including the program name.
+    """
+    parser = argparse.ArgumentParser(
+        description='Measure the frame data of every Action in the '
+                    'roster.')
+    parser.add_argument('--format', choices=['csv', 'json'], default='csv',
+                        help='The format to write the frame data in.')
+    parser.add_argument('--output', default=None,
+                        help='A file path to write to, instead of the '
+                             'standard output.')
+    parser.add_argument('--no-cache', dest='use_cache',
+                        action='store_false',
+                        help='Measure every character again, ignoring '
+                             'the cache.')
+    args = parser.parse_args(argv)
+
+    rows = analyze_roster(args.use_cache)
+    if args.format == 'csv':
+        write_frame_data = write_csv
+    else:
+        write_frame_data = write_json
+
+    if args.output is None:
+        write_frame_data(rows, sys.stdout)
+    else:
+        with open(args.output, 'wb') as output_file:
+            write_frame_data(rows, output_file)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,197 @@
+"""This module keeps small index files that hold only the information
+shown on the Character Select and Stage Select screens, so that those
+screens can open without parsing every character and stage document.
+
+Each index is built from the full XML documents the first time it is
+needed, and saved as JSON next to its list file. The index records the
+size and modification time of the list file and of every document it
+was built from; if any of them change, the index is rebuilt.
+
+Module Constants:
+    ROSTER_INDEX_PATH (String): The file path to the roster index.
+    STAGE_INDEX_PATH (String): The file path to the stage index.
+    INDEX_VERSION (int): The version of the index format. Indexes of
+        any other version are rebuilt.
+"""
+import json
+from collections import namedtuple
+from lib.custom_data import character_loader
+from lib.custom_data import stage_loader
+from lib.custom_data.character_data import load_frame_durations
+from lib.custom_data.content_pack import get_content_signature
+from lib.custom_data.text_ops import get_prefixed_lines_from_txt
+
+
+ROSTER_INDEX_PATH = 'characters/roster_index.json'
+STAGE_INDEX_PATH = 'stages/stage_index.json'
+INDEX_VERSION = 1
+
+
+# The information about a character shown on the Character Select
+# screen. line_index is the character's line within the character list.
+RosterEntry = namedtuple('RosterEntry', ['line_index', 'name',
+                                         'mugshot_path',
+                                         'preview_spritesheet_path',
+                                         'preview_frame_durations'])
+
+# The information about a Stage shown on the Stage Select screen.
+# line_index is the Stage's line within the stage list.
+StageEntry = namedtuple('StageEntry', ['line_index', 'name', 'subtitle',
+                                       'preview', 'thumbnail'])
+
+
+def load_roster_index():
+    """Return a tuple of RosterEntries for every character that can be
+    loaded, rebuilding the roster index first if it is out of date.
+
+    If no characters could be loaded, None is returned instead.
+    """
+    entries = load_index(ROSTER_INDEX_PATH,
+                         character_loader.CHARACTER_LIST_PATH,
+                         character_loader.FILEPATH_PREFIX,
+                         build_roster_entry)
+    return to_entry_tuple(entries, RosterEntry)
+
+
+def load_stage_index():
+    """Return a tuple of StageEntries for every Stage that can be
+    loaded, rebuilding the stage index first if it is out of date.
+
+    If no Stages could be loaded, None is returned instead.
+    """
+    entries = load_index(STAGE_INDEX_PATH, stage_loader.STAGE_LIST_PATH,
+                         stage_loader.FILEPATH_PREFIX, build_stage_entry)
+    return to_entry_tuple(entries, StageEntry)
+
+
+def build_roster_entry(line_index):
+    """Load a character's full data and return a list of the values
+    for its RosterEntry. If the character couldn't be loaded, None is
+    returned instead.
+
+    Args:
+        line_index: An integer for the line index of the character's
+            file path within the character list.
+    """
+    character = character_loader.load_character(line_index)
+    if character is None or len(character.actions) <= 0:
+        return None
+
+    first_action = character.actions[0]
+    return [line_index, character.name, character.mugshot_path,
+            first_action.spritesheet_path,
+            list(load_frame_durations(first_action))]
+
+
+def build_stage_entry(line_index):
+    """Load a Stage's full data and return a list of the values for its
+    StageEntry. If the Stage couldn't be loaded, None is returned
+    instead.
+
+    Args:
+        line_index: An integer for the line index of the Stage's file
+            path within the stage list.
+    """
+    stage = stage_loader.load_stage(line_index)
+    if stage is None:
+        return None
+
+    return [line_index, stage.name, stage.subtitle, stage.preview,
+            stage.thumbnail]
+
+
+def load_index(index_path, list_path, prefix, build_entry):
+    """Return a list containing the values of every entry in an index,
+    rebuilding and saving the index if it is missing or out of date.
+
+    Args:
+        index_path: A String for the file path to the index.
+        list_path: A String for the file path to the text file that
+            lists the documents covered by the index.
+        prefix: A String for the directory prefix of the paths within
+            the list file.
+        build_entry: A function that takes the line index of a
+            document within the list file, and returns a list of the
+            values for its entry, or None if it couldn't be loaded.
+    """
+    try:
+        source_paths = get_prefixed_lines_from_txt(list_path, prefix)
+    except IOError:
+        return []
+    signatures = get_signatures(list_path, source_paths)
+
+    # The index is always read as a loose file, since it is rewritten
+    # whenever it goes out of date.
+    try:
+        with open(index_path, 'r') as index_file:
+            index = json.load(index_file)
+        if (index['version'] == INDEX_VERSION and
+                index['signatures'] == signatures):
+            return index['entries']
+    except (IOError, ValueError, KeyError, TypeError):
+        pass
+
+    entries = []
+    for line_index in xrange(0, len(source_paths)):
+        new_entry = build_entry(line_index)
+        if new_entry is not None:
+            entries.append(new_entry)
+
+    save_index(index_path, signatures, entries)
+    return entries
+
+
+def get_signatures(list_path, source_paths):
+    """Return a dict mapping the file paths of a list file and all of
+    the documents it lists to their content signatures.
+
+    Args:
+        list_path: A String for the file path to the list file.
+        source_paths: A tuple of Strings for the file paths of every
+            document in the list.
+    """
+    signatures = {list_path: get_content_signature(list_path)}
+    for source_path in source_paths:
+        signatures[source_path] = get_content_signature(source_path)
+
+    return signatures
+
+
+def save_index(index_path, signatures, entries):
+    """Write an index to file. If it can't be written, the index will
+    simply be rebuilt the next time it is loaded.
+
+    Args:
+        index_path: A String for the file path to the index.
+        signatures: A dict mapping the file paths of the list file and
+            its documents to their content signatures.
+        entries: A list containing the values of every entry.
+    """
+    index = {'version': INDEX_VERSION, 'signatures': signatures,
+             'entries': entries}
+
+    try:
+        with open(index_path, 'w') as index_file:
+            json.dump(index, index_file, sort_keys=True)
+    except IOError:
+        pass
+
+
+def to_entry_tuple(entries, entry_class):
+    """Return a tuple of namedtuples built from index entries, or None
+    if there are no entries.
+
+    Args:
+        entries: A list containing the values of every entry.
+        entry_class: The namedtuple class to create for each entry.
+    """
+    if len(entries) <= 0:
+        return None
+
+    converted_entries = []
+    for values in entries:
+        values = [tuple(value) if type(value) is list else value
+                  for value in values]
+        converted_entries.append(entry_class(*values))
+
+    return tuple(converted_entries)
@@ -0,0 +1,140 @@
+"""This module loads Projectile data from external XML files and stores
+it in ProjectileData objects that can be read by the game engine.
+
+A Projectile file is only loaded the first time one of its Projectiles
+is fired. After that, the same ProjectileData is shared by every Frame
+and character that fires it.
+
+Module Constants:
+    FILEPATH_PREFIX (String): The file path of the root directory where
+        all character data files, including Projectile files, are kept.
+"""
+from threading import Lock
+from lxml import etree
+from pygame.locals import Rect
+from lib.custom_data.content_pack import open_content
+from lib.custom_data.character_data import ProjectileData, Frame, Hitbox
+from lib.custom_data.flyweights import intern_projectile
+from lib.custom_data.xml_ops import convert_to_int_if_numeric
+
+
+FILEPATH_PREFIX = 'characters/'
+
+_projectiles = {}
+_projectiles_lock = Lock()
+
+
+def load_projectile(filepath):
+    """Return the ProjectileData for a Projectile file, loading it if
+    it hasn't been loaded before.
+
+    Args:
+        filepath: A String for the file path to the Projectile's XML
+            file.
+
+    Returns:
+        A ProjectileData object. If there was an error loading the
+        file, None is returned instead.
+    """
+    with _projectiles_lock:
+        if filepath not in _projectiles:
+            projectile_data = load_projectile_from_file(filepath)
+            if projectile_data is not None:
+                intern_projectile(projectile_data)
+            _projectiles[filepath] = projectile_data
+
+        return _projectiles[filepath]
+
+
+def load_projectile_from_file(filepath):
+    """Load a Projectile's data from its XML file.
+
+    Args:
+        filepath: A String for the file path to the Projectile's XML
+            file.
+
+    Returns:
+        A ProjectileData object. If the file couldn't be read or
+        doesn't contain a Projectile, None is returned instead.
+    """
+    parser = etree.XMLParser(remove_blank_text=True)
+    try:
+        root = etree.parse(open_content(filepath), parser).getroot()
+    except (IOError, etree.XMLSyntaxError):
+        return None
+
+    element = root.find('projectile')
+    if element is None:
+        return None
+
+    projectile_data = ProjectileData()
+    projectile_data.name = element.get('name', '')
+    projectile_data.spritesheet_path = (FILEPATH_PREFIX +
+                                        element.get('spritesheet', ''))
+    projectile_data.rect = Rect(0, 0, get_int(element, 'width'),
+                                get_int(element, 'height'))
+    projectile_data.stamina = get_int(element, 'stamina')
+    projectile_data.first_loop_frame = get_int(element, 'first_loop_frame')
+    projectile_data.first_collision_frame = get_int(element,
+                                                    'first_collision_frame')
+    projectile_data.frames = [load_frame(frame_element) for frame_element
+                              in element.findall('frame')]
+
+    return projectile_data
+
+
+def load_frame(frame_element):
+    """Return a Frame loaded from a Projectile's frame element.
+
+    Args:
+        frame_element: The XML element for the frame.
+    """
+    frame = Frame()
+    frame.duration = get_int(frame_element, 'duration')
+    frame.cancelable = get_int(frame_element, 'cancelable')
+    frame.move_x = get_int(frame_element, 'move_x')
+    frame.move_y = get_int(frame_element, 'move_y')
+    frame.hitboxes = [load_hitbox(hitbox_element) for hitbox_element
+                      in frame_element.findall('hitbox')]
+
+    return frame
+
+
+def load_hitbox(hitbox_element):
+    """Return a Hitbox loaded from a Projectile frame's hitbox element.
+
+    Projectile files name the blocking attributes 'high_block' and
+    'low_block', rather than 'can_block_high' and 'can_block_low' as in
+    character files; either name is accepted.
+
+    Args:
+        hitbox_element: The XML element for the hitbox.
+    """
+    hitbox = Hitbox()
+    for attr_name in ('x_offset', 'y_offset', 'width', 'height', 'damage',
+                      'hitstun', 'blockstun', 'knockback', 'dizzy_stun',
+                      'effect'):
+        setattr(hitbox, attr_name, get_int(hitbox_element, attr_name))
+
+    hitbox.can_block_high = get_int(hitbox_element, 'can_block_high',
+        get_int(hitbox_element, 'high_block')) == 1
+    hitbox.can_block_low = get_int(hitbox_element, 'can_block_low',
+        get_int(hitbox_element, 'low_block')) == 1
+
+    return hitbox
+
+
+def get_int(element, attr_name, default=0):
+    """Return an XML element's attribute as an integer.
+
+    Args:
+        element: The XML element containing the attribute.
+        attr_name: A String for the name of the attribute.
+        default: Optional. The integer returned if the attribute is
+            missing or isn't a number. The default is 0.
+    """
+    attr_value = convert_to_int_if_numeric(element.get(attr_name, ''))
+    if type(attr_value) is int:
+        return attr_value
+    else:
+        return default
@@ -1,6 +1,12 @@
 """This module provides methods for working with and performing various
 operations on text files.
+
+Text files are read through the content pack, so they may either be
+packed or loose.
 """
+from lib.custom_data.content_pack import read_content
+
+
 def get_prefixed_lines_from_txt(txt_path, prefix=''):
     """Return a tuple containing all of the lines within a text file.
     Each line can be prefixed with a specific String.
@@ -11,9 +17,8 @@ def get_prefixed_lines_from_txt(txt_path, prefix=''):
         prefix (String): Optional. A String segment that will be
             prepended to the start of each line.
     """
-    with open(txt_path, 'U') as f:
-        lines = [prefix + line.rstrip('\n') for line in f]
-        return tuple(lines)
+    lines = [prefix + line for line in read_content(txt_path).splitlines()]
+    return tuple(lines)
 
 
 def num_of_lines_in_txt(txt_path):
@@ -24,6 +29,6 @@ def num_of_lines_in_txt(txt_path):
         txt_path (String): The file path to a text file.
     """
     try:
-        return sum(1 for line in open(txt_path))
+        return len(read_content(txt_path).splitlines())
     except:
         return None
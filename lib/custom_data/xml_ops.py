@@ -2,6 +2,7 @@
 for potential errors that may result from reading XML data.
 """
 from lxml import etree
+from lib.custom_data.content_pack import open_content
 from lib.custom_data.character_data import *
 from lib.custom_data.stage_data import *
 from lib.custom_data.settings_data import *
@@ -34,6 +35,9 @@ def load_xml_doc_as_object(xml_path, schema_path):
 def load_xml_from_file(xml_path, schema_path):
     """Retrieve the entire contents of an XML document.
 
+    The XML document is read through the content pack, so it may
+    either be packed or loose.
+
     Args:
         xml_path (String): The file path to a valid XML document.
         schema_path (String): The file path to an XML Schema that will
@@ -49,7 +53,7 @@ def load_xml_from_file(xml_path, schema_path):
     parser = etree.XMLParser(remove_blank_text=True)
 
     try:
-        xml_doc = etree.parse(xml_path, parser)
+        xml_doc = etree.parse(open_content(xml_path), parser)
         schema_doc = etree.parse(schema_path, parser)
     except:
         return None
@@ -89,7 +93,10 @@ def convert_element_to_object(element):
         elif type(attr_value) is dict:
             loaded_data = load_attribute_dict(element, attr_name)
         elif type(attr_value) is list:
-            loaded_data = load_child_objects(element, attr_name)
+            if is_list_element(element, attr_name):
+                loaded_data = load_listed_objects(element, attr_name)
+            else:
+                loaded_data = load_child_objects(element, attr_name)
         elif is_element_attribute(element, attr_name):
             loaded_data = load_element_attribute(element, attr_name)
         else:   # Optional attribute was omitted.
@@ -227,6 +234,41 @@ def load_child_objects(parent_element, child_list_name):
     return children
 
 
+def is_list_element(parent_element, list_name):
+    """Return a Boolean indicating whether the specified XML element
+    contains a single child element that wraps all of the list's items,
+    rather than containing the items directly.
+
+    For example, an Action's input steps are kept within an
+    <input_list> element.
+
+    Args:
+        parent_element (Element): The XML element that may contain the
+            wrapping element.
+        list_name (String): The tag name of the wrapping element, which
+            is the same as the name of the list attribute.
+    """
+    return parent_element.find(list_name) is not None
+
+
+def load_listed_objects(parent_element, list_name):
+    """Load all of the child elements within an element that wraps a
+    list.
+
+    Args:
+        parent_element (Element): The XML element containing the
+            wrapping element.
+        list_name (String): The tag name of the wrapping element, such
+            as 'input_list'.
+    """
+    list_element = parent_element.find(list_name)
+
+    # Comments are also children of the element, but have no tag name.
+    return [convert_element_to_object(item_element)
+            for item_element in list_element
+            if isinstance(item_element.tag, basestring)]
+
+
 def get_singular_from_plural(plural):
     """Convert a plural word into its singular form.
 
@@ -0,0 +1,113 @@
+"""This module contains the FrameTimeline, which maps elapsed update
+cycles to animation frames for animations whose frames have differing
+durations.
+
+A FrameTimeline stores the tick at which each frame ends, one after
+another, so the frame shown at any tick can be found with a binary
+search. This lets an animation or Action be moved to any point in time
+directly, rather than replaying every update cycle up to it. It also
+means that the only state needed to restore an animation's progress is
+a single tick counter.
+"""
+from bisect import bisect_right
+
+
+class FrameTimeline(object):
+    """A read-only table of when each frame of an animation starts and
+    ends.
+
+    Attributes:
+        frame_durations: A tuple of integers for the duration, in update
+            cycles, of each frame in order.
+        frame_ends: A tuple of integers for the tick at which each frame
+            ends, counting from the start of the first frame. This is
+            the running total of frame_durations.
+        total_duration: An integer for the number of update cycles in
+            one play-through of every frame.
+    """
+    def __init__(self, frame_durations):
+        """Declare and initialize instance variables.
+
+        Args:
+            frame_durations: A sequence of integers for the duration, in
+                update cycles, of each frame in order.
+        """
+        self.frame_durations = tuple(frame_durations)
+
+        frame_ends = []
+        elapsed_ticks = 0
+        for duration in self.frame_durations:
+            elapsed_ticks += duration
+            frame_ends.append(elapsed_ticks)
+
+        self.frame_ends = tuple(frame_ends)
+        self.total_duration = elapsed_ticks
+
+    def get_num_of_frames(self):
+        """Return an integer for the number of frames in the timeline."""
+        return len(self.frame_durations)
+
+    def get_start_tick(self, frame_index):
+        """Return an integer for the tick at which a frame starts.
+
+        Args:
+            frame_index: An integer for the index of the frame.
+        """
+        return self.frame_ends[frame_index] - self.frame_durations[frame_index]
+
+    def wrap_tick(self, tick, is_looping=True):
+        """Return a tick moved within the bounds of one play-through of
+        the timeline.
+
+        Args:
+            tick: An integer for the number of update cycles elapsed
+                since the start of the first frame.
+            is_looping: Optional. A Boolean indicating whether the
+                timeline repeats from the first frame after the last
+                one ends. If False, ticks past the end are held at the
+                last tick of the final frame. The default is True.
+        """
+        if self.total_duration <= 0:
+            return 0
+        elif is_looping:
+            return tick % self.total_duration
+        else:
+            return max(0, min(tick, self.total_duration - 1))
+
+    def get_frame_index(self, tick, is_looping=True):
+        """Return an integer for the index of the frame shown at a
+        certain tick.
+
+        Args:
+            tick: An integer for the number of update cycles elapsed
+                since the start of the first frame.
+            is_looping: Optional. A Boolean indicating whether the
+                timeline repeats from the first frame after the last
+                one ends. The default is True.
+        """
+        if self.total_duration <= 0:
+            return 0
+
+        tick = self.wrap_tick(tick, is_looping)
+        return bisect_right(self.frame_ends, tick)
+
+    def locate(self, tick, is_looping=True):
+        """Find the frame shown at a certain tick.
+
+        Args:
+            tick: An integer for the number of update cycles elapsed
+                since the start of the first frame.
+            is_looping: Optional. A Boolean indicating whether the
+                timeline repeats from the first frame after the last
+                one ends. The default is True.
+
+        Returns:
+            A tuple containing the index of the frame, and the number
+            of update cycles remaining until that frame ends.
+        """
+        if self.total_duration <= 0:
+            return (0, 0)
+
+        tick = self.wrap_tick(tick, is_looping)
+        frame_index = bisect_right(self.frame_ends, tick)
+        return (frame_index, self.frame_ends[frame_index] - tick)
@@ -3,21 +3,20 @@ import collections
 import pygame.transform as transform
 import pygame.draw
 import pygame.locals
-from pygame import image
 from pygame.surface import Surface
 from pygame.rect import Rect
-from lib.graphics import load_tuple_of_images
 from lib.graphics import render_text
-from lib.graphics import convert_to_colorkey_alpha
+from lib.graphics import import_image
 from lib.graphics import Graphic, Animation, CharacterAnimation
+from lib.image_cache import ImageCache
 from customize.globals import SCREEN_SIZE
 from customize.character_select import *
-from lib.custom_data.character_data import load_frame_durations
-from lib.custom_data.character_loader import (load_all_characters,
-                                              load_character)
+from lib.custom_data.character_loader import load_character
+from lib.custom_data.menu_index import load_roster_index
 from lib.game_states.state import State
 from lib.game_states.state_ids import StateIDs
 from lib.game_states.select_state_sfx import SelectStateSFX
+from lib.tween import frames_for_distance, frames_for_seconds
 
 
 PreviewData = collections.namedtuple('PreviewData',
@@ -32,9 +31,9 @@ class CharacterSelectState(State):
         bg_lines: BackgroundLines that will be drawn on the screen.
         roster: A RosterDisplay that will allow the players to choose
             from all of the characters included in the game.
-        all_preview_data: A tuple of PreviewData tuples, containing the
-            name, spritesheet, and frame durations for each character's
-            preview animation.
+        preview_cache: A PreviewCache that loads the name, spritesheet,
+            and frame durations for each character's preview animation
+            as they are needed.
         p1_preview: A CharacterPreview for player 1's currently-
             selected character.
         p2_preview: A CharacterPreview for player 2's currently-
@@ -65,14 +64,14 @@ class CharacterSelectState(State):
                 passed between Game States.
         """
         super(CharacterSelectState, self).__init__(state_manager, state_pass)
-        all_chars = load_all_characters()
+        all_chars = load_roster_index()
         general_font = pygame.font.Font(FONT_PATH, FONT_SIZE)
         vs_font = pygame.font.Font(FONT_PATH, VS_SIZE)
         self.p1_preview = None
         self.p2_preview = None
 
         self.roster = RosterDisplay(all_chars)
-        self.all_preview_data = self.load_all_preview_data(all_chars)
+        self.preview_cache = PreviewCache(all_chars)
         self.p1_char_index = None
         self.p2_char_index = self.get_initial_p2_char_index()
         if self.num_of_characters() > 0:
@@ -91,35 +90,20 @@ class CharacterSelectState(State):
         self.intro = IntroTransition(self,
                                      self.state_pass.announcer_channel)
         self.outro = OutroTransition(self)
+        self.add_static_layer(self.draw_static_graphics)
+        self.add_dynamic_layer(self.draw_dynamic_graphics)
 
         if self.returned_from_stage_select():
             self.select_previous_characters()
         else:
-            self.intro.play()
-
-    @staticmethod
-    def load_all_preview_data(all_chars):
-        """Return a tuple of PreviewData tuples for all characters'
-        preview animations.
+            self.intro.prepare()
 
-        Args:
-            all_chars: A tuple of CharacterData objects for all of the
-                characters included in the game.
+    def start_state(self):
+        """Start playing the intro animation, unless the players have
+        returned from the Stage Select Screen.
         """
-        all_preview_data = []
-
-        if all_chars is not None:
-            for character in all_chars:
-                name = character.name
-                spritesheet_path = character.actions[0].spritesheet_path
-                spritesheet = pygame.image.load(spritesheet_path)
-                spritesheet = spritesheet.convert_alpha()
-                frame_durations = load_frame_durations(character.actions[0])
-
-                all_preview_data.append(PreviewData(name, spritesheet,
-                                                    frame_durations))
-
-        return tuple(all_preview_data)
+        if self.intro.is_running:
+            self.intro.play()
 
     def get_initial_p2_char_index(self):
         """Return an integer for the roster index of Player 2's initial
@@ -129,7 +113,7 @@ class CharacterSelectState(State):
         character's index is returned.
         If not, the first character's index is returned.
         """
-        if len(self.all_preview_data) > 1:
+        if self.num_of_characters() > 1:
             return 1
         else:
             return 0
@@ -142,20 +126,22 @@ class CharacterSelectState(State):
             name_font: A PyGame Font used for rendering the characters'
                 name text.
         """
-        p1_char = self.all_preview_data[0]   # p1_char_index is initally None.
-        p2_char = self.all_preview_data[self.p2_char_index]
+        # p1_char_index is initally None.
+        p1_char = self.preview_cache.get_preview_data(0)
+        p2_char = self.preview_cache.get_preview_data(self.p2_char_index)
         self.p1_preview = CharacterPreview(False, p1_char.spritesheet,
                                            p1_char.name, name_font,
                                            p1_char.frame_durations)
         self.p2_preview = CharacterPreview(True, p2_char.spritesheet,
                                            p2_char.name, name_font,
                                            p2_char.frame_durations)
+        self.preview_cache.prefetch_neighbours(0)
 
     def num_of_characters(self):
         """Return an integer for the number of character loaded into
         the game.
         """
-        return len(self.all_preview_data)
+        return self.preview_cache.num_of_characters()
 
     def returned_from_stage_select(self):
         """Return a Boolean indicating whether the players returned to
@@ -173,8 +159,8 @@ class CharacterSelectState(State):
         self.toggle_player_display()
         self.roster.select_character(self.p2_char_index)
 
-        p1_char = self.all_preview_data[self.p1_char_index]
-        p2_char = self.all_preview_data[self.p2_char_index]
+        p1_char = self.preview_cache.get_preview_data(self.p1_char_index)
+        p2_char = self.preview_cache.get_preview_data(self.p2_char_index)
         self.p1_preview.change_character(p1_char.spritesheet, p1_char.name,
                                          p1_char.frame_durations)
         self.p2_preview.change_character(p2_char.spritesheet, p2_char.name,
@@ -218,6 +204,8 @@ class CharacterSelectState(State):
             if current_character != self.roster.get_character_index():
                 self.change_preview(self.roster.get_character_index())
 
+        self.invalidate_static_layers()
+
     def get_input_name(self, key_name):
         """Get the name of the in-game input command based on the key
         that was pressed.
@@ -307,7 +295,8 @@ class CharacterSelectState(State):
                 This index is based on the order of the character file
                 paths in the character list text file.
         """
-        preview_data = self.all_preview_data[character_index]
+        preview_data = self.preview_cache.get_preview_data(character_index)
+        self.preview_cache.prefetch_neighbours(character_index)
 
         if self.get_current_player() == 1:
             self.p1_preview.change_character(preview_data.spritesheet,
@@ -334,46 +323,157 @@ class CharacterSelectState(State):
             time: A float for the time elapsed, in seconds, since the
                 last update cycle.
         """
-        if self.intro.is_running:
-            self.intro.update(time)
-        elif self.outro.is_running:
-            self.outro.update(time)
+        if self.intro.is_running or self.outro.is_running:
+            # The transitions are moving the static graphics.
+            self.invalidate_static_layers()
         else:
             self.select_prompt.update()
-            if self.num_of_characters() > 0:
-                self.p1_preview.update()
-                self.p2_preview.update()
+
+        if self.num_of_characters() > 0:
+            self.p1_preview.update()
+            self.p2_preview.update()
 
         self.draw_state()
 
     def draw_state(self):
         """Render all of the State's graphical components onto the State
         Surface.
-        """
-        pygame.draw.rect(self.state_surface, (0, 0, 0),
-                         Rect(0, 0, SCREEN_SIZE[0], SCREEN_SIZE[1]))
 
+        During the intro and outro, most graphics are moving, so all of
+        them are drawn from scratch by the transition. Otherwise, the
+        State's layers are drawn.
+        """
         if self.intro.is_running or self.outro.is_running:
-            if self.num_of_characters() <= 0:
-                center_text_pos = NO_CHARS_POSITION
-            else:
-                center_text_pos = VS_POSITION
+            pygame.draw.rect(self.state_surface, (0, 0, 0),
+                             Rect(0, 0, SCREEN_SIZE[0], SCREEN_SIZE[1]))
 
             if self.intro.is_running:
                 self.intro.draw(self.state_surface)
             else:
                 self.outro.draw(self.state_surface)
         else:
-            self.bg_lines.draw(self.state_surface)
-            self.roster.draw(self.state_surface)
-            self.select_prompt.draw(self.state_surface)
+            self.draw_layers()
 
-            if self.num_of_characters() <= 0:
-                self.no_chars_text.draw(self.state_surface)
-            else:
-                self.vs_text.draw(self.state_surface)
-                self.p1_preview.draw(self.state_surface)
-                self.p2_preview.draw(self.state_surface)
+    def draw_static_graphics(self, parent_surf):
+        """Draw the graphics that only change in response to player
+        input onto a Surface.
+
+        These include the BackgroundLines, the current row of the
+        roster, and the VS text.
+
+        Args:
+            parent_surf: The Surface upon which the graphics will be
+                drawn.
+        """
+        self.bg_lines.draw(parent_surf)
+        self.roster.draw_row(parent_surf)
+
+        if self.num_of_characters() <= 0:
+            self.no_chars_text.draw(parent_surf)
+        else:
+            self.vs_text.draw(parent_surf)
+
+    def draw_dynamic_graphics(self, parent_surf):
+        """Draw the animated graphics onto a Surface.
+
+        These include the roster cursor and arrows, the player select
+        prompt, and both CharacterPreviews.
+
+        Args:
+            parent_surf: The Surface upon which the graphics will be
+                drawn.
+        """
+        self.roster.draw_indicators(parent_surf)
+        self.select_prompt.draw(parent_surf)
+
+        if self.num_of_characters() > 0:
+            self.p1_preview.draw(parent_surf)
+            self.p2_preview.draw(parent_surf)
+
+
+class PreviewCache(object):
+    """Loads the spritesheets for character previews as they are
+    needed, rather than all at once upon entering the State.
+
+    Whenever a character is previewed, the spritesheets of the
+    characters in the neighbouring roster slots are loaded on a
+    background thread, so that they are likely to be ready by the time
+    the cursor reaches them. Only the most recently used spritesheets
+    are kept in memory.
+
+    Attributes:
+        all_chars: A tuple of RosterEntry tuples for all of the
+            characters included in the game.
+        spritesheets: An ImageCache holding the most recently used
+            preview spritesheets.
+    """
+    def __init__(self, all_chars, capacity=PREVIEW_CACHE_SIZE):
+        """Declare and initialize instance variables.
+
+        Args:
+            all_chars: A tuple of RosterEntry tuples for all of the
+                characters included in the game. If None is passed,
+                the cache will be empty.
+            capacity: Optional. An integer for the maximum number of
+                spritesheets kept in memory at once. The default is
+                PREVIEW_CACHE_SIZE.
+        """
+        if all_chars is None:
+            self.all_chars = ()
+        else:
+            self.all_chars = all_chars
+        self.spritesheets = ImageCache(capacity)
+
+    def num_of_characters(self):
+        """Return an integer for the number of characters that can be
+        previewed.
+        """
+        return len(self.all_chars)
+
+    def get_preview_data(self, character_index):
+        """Return a PreviewData tuple for a character, loading their
+        spritesheet first if it isn't in memory.
+
+        Args:
+            character_index: An integer for the index of the character.
+        """
+        character = self.all_chars[character_index]
+        spritesheet = self.spritesheets.get_image(
+            character.preview_spritesheet_path)
+        return PreviewData(character.name, spritesheet,
+                           character.preview_frame_durations)
+
+    def get_neighbour_indexes(self, character_index):
+        """Return a list of the indexes of the characters in the roster
+        slots around a character: the slots to the left and right, and
+        the slots directly above and below.
+
+        Args:
+            character_index: An integer for the index of the character.
+        """
+        neighbours = []
+        slot = character_index % SLOTS_PER_ROW
+
+        if slot > 0:
+            neighbours.append(character_index - 1)
+        if slot < SLOTS_PER_ROW - 1:
+            neighbours.append(character_index + 1)
+        neighbours.append(character_index - SLOTS_PER_ROW)
+        neighbours.append(character_index + SLOTS_PER_ROW)
+
+        return [index for index in neighbours
+                if 0 <= index < self.num_of_characters()]
+
+    def prefetch_neighbours(self, character_index):
+        """Start loading the spritesheets of the characters around a
+        character in the background.
+
+        Args:
+            character_index: An integer for the index of the character.
+        """
+        self.spritesheets.prefetch(
+            [self.all_chars[index].preview_spritesheet_path
+             for index in self.get_neighbour_indexes(character_index)])
 
 
 class TransitionSpeeds(object):
@@ -409,6 +509,9 @@ class IntroTransition(object):
         * Once the three components have finished sliding in, the VS
           VS text wipes into the middle of the screen.
 
+    Each step is scheduled up front as a Tween that is delayed until
+    the previous steps have finished.
+
     Attributes:
         state: The CharacterSelectState that will be animated.
         vs_wipe_y: An integer for the top end of the wipe in effect,
@@ -433,114 +536,96 @@ class IntroTransition(object):
         self.is_running = False
         self.voice = pygame.mixer.Sound(VOICE_PATH)
         self.voice_channel = voice_channel
-        self.voice_has_played = False
 
-    def play(self):
-        """Begin running the intro animation."""
+    def prepare(self):
+        """Move all of the animated graphics to their starting
+        positions, so that the State is ready to play the intro once it
+        becomes active.
+        """
         self.is_running = True
-
-        if not self.state.returned_from_stage_select():
-            pygame.mixer.music.load(MUSIC_PATH)
-            pygame.mixer.music.play(-1)
-
         self.state.bg_lines.move_right_end(-1 * SCREEN_SIZE[0])
         self.state.roster.place_offscreen()
         if self.state.num_of_characters() > 0:
             self.state.p1_preview.place_offscreen()
             self.state.p2_preview.place_offscreen()
 
-    def update(self, time):
-        """Update the intro animation.
-
-        Args:
-            time: A float for time elapsed, in seconds, since the last
-                update cycle.
-        """
-        if (self.state.p1_preview is not None and
-             self.state.p2_preview is not None):
-            self.state.p1_preview.update()
-            self.state.p2_preview.update()
-
-        if not self.state.bg_lines.are_fully_extended():
-            self.move_lines_in(time)
-
-        elif (self.state.num_of_characters() <= 0 and
-              not self.state.roster.is_onscreen()):
-            self.slide_in_roster(time)
-        elif self.state.num_of_characters() > 0 and not (
-                self.state.p1_preview.is_onscreen() and
-                self.state.p2_preview.is_onscreen() and
-                self.state.roster.is_onscreen()):
-            self.slide_in_roster(time)
-            self.slide_in_previews(time)
-
-        elif self.vs_wipe_y > 0:
-            self.wipe_in_vs(time)
-            if not self.voice_has_played:
-                self.voice_channel.play(self.voice)
-                self.voice_has_played = True
-        else:
-            self.is_running = False
-
-    def move_lines_in(self, time):
-        """Scroll the BackgroundLines into the screen from left to
-        right.
+    def play(self):
+        """Begin running the intro animation.
 
-        Args:
-            time: A float for time elapsed, in seconds, since the last
-                update cycle.
+        prepare() must be called before this method.
         """
-        distance = TransitionSpeeds.LINES * time
-        self.state.bg_lines.move_right_end(distance)
+        tweens = self.state.get_tween_scheduler()
+        roster = self.state.roster
 
-        if self.state.bg_lines.are_fully_extended():
-            self.state.bg_lines.reset()
-
-    def slide_in_roster(self, time):
-        """Slide the roster into the screen from the bottom edge.
-
-        Args:
-            time: A float for time elapsed, in seconds, since the last
-                update cycle.
-        """
-        distance = -1 * TransitionSpeeds.ROSTER * time
-        self.state.roster.move(dy=distance)
+        if not self.state.returned_from_stage_select():
+            pygame.mixer.music.load(MUSIC_PATH)
+            pygame.mixer.music.play(-1)
 
-        if self.state.roster.is_onscreen():
-            self.state.roster.correct_position()
+        lines_duration = frames_for_distance(SCREEN_SIZE[0],
+                                             TransitionSpeeds.LINES)
+        tweens.start(0, SCREEN_SIZE[0], lines_duration,
+            on_update=lambda x, change: (
+                self.state.bg_lines.move_right_end(change)),
+            on_complete=self.state.bg_lines.reset, owner=self.state)
+
+        roster_distance = roster.y - (SCREEN_SIZE[1] - roster.slot_size())
+        slide_duration = frames_for_distance(roster_distance,
+                                             TransitionSpeeds.ROSTER)
+        tweens.start(0, roster_distance, slide_duration,
+            on_update=lambda y, change: roster.move(dy=(-1 * change)),
+            on_complete=roster.correct_position, delay=lines_duration,
+            owner=self.state)
 
-    def slide_in_previews(self, time):
-        """Slide both CharacterPreviews into the screen from the left
-        and right edges.
+        if self.state.num_of_characters() > 0:
+            preview_duration = frames_for_seconds(PREVIEW_SLIDE_DURATION)
+            self.slide_in_preview(self.state.p1_preview, 1,
+                                  preview_duration, lines_duration)
+            self.slide_in_preview(self.state.p2_preview, -1,
+                                  preview_duration, lines_duration)
+            slide_duration = max(slide_duration, preview_duration)
+
+        wipe_delay = lines_duration + slide_duration
+        tweens.start_timer(wipe_delay,
+                           lambda: self.voice_channel.play(self.voice),
+                           owner=self.state)
+        tweens.start(self.vs_wipe_y, 0,
+            frames_for_distance(self.vs_wipe_y, TransitionSpeeds.VS),
+            on_update=self.set_vs_wipe, on_complete=self.finish,
+            delay=wipe_delay, owner=self.state)
+
+    def slide_in_preview(self, preview, direction, duration, delay):
+        """Schedule a CharacterPreview to slide into the screen from
+        the left or right edge.
 
         Args:
-            time: A float for time elapsed, in seconds, since the last
-                update cycle.
-        """
-        p1_distance = self.state.p1_preview.slide_speed() * time
-        p2_distance = self.state.p2_preview.slide_speed() * time
-
-        if not self.state.p1_preview.is_onscreen():
-            self.state.p1_preview.move(dx=(p1_distance))
-            if self.state.p1_preview.is_onscreen():
-                self.state.p1_preview.correct_position()
-
-        if not self.state.p2_preview.is_onscreen():
-            self.state.p2_preview.move(dx=(-1 * p2_distance))
-            if self.state.p2_preview.is_onscreen():
-                self.state.p2_preview.correct_position()
-
-    def wipe_in_vs(self, time):
+            preview: The CharacterPreview that will be moved.
+            direction: An integer that is 1 if the preview slides to
+                the right, or -1 if it slides to the left.
+            duration: An integer for the length of the slide, in update
+                frames.
+            delay: An integer for the number of update frames to wait
+                before the slide begins.
+        """
+        self.state.get_tween_scheduler().start(0,
+            preview.animation.get_width(), duration,
+            on_update=lambda x, change: preview.move(dx=(direction * change)),
+            on_complete=preview.correct_position, delay=delay,
+            owner=self.state)
+
+    def set_vs_wipe(self, wipe_y, change):
         """Move the upper bound of the VS text's draw region in order
         to create a 'wipe-in' effect.
 
         Args:
-            time: A float for time elapsed, in seconds, since the last
-                update cycle.
+            wipe_y: A float for the new upper bound, relative to the VS
+                text Surface.
+            change: A float for the change from the previous bound.
         """
-        self.vs_wipe_y -= TransitionSpeeds.VS * time
-        if self.vs_wipe_y <= 0:
-            self.vs_wipe_y = 0
+        self.vs_wipe_y = wipe_y
+
+    def finish(self):
+        """End the intro animation."""
+        self.is_running = False
 
     def draw(self, parent_surf):
         """Draw all of the Character Select Screen graphics onto a
@@ -589,6 +674,9 @@ class OutroTransition(object):
         * The BackgroundLines scroll out of the screen from left to
           right, leaving only a black screen.
 
+    Each step is scheduled up front as a Tween that is delayed until
+    the previous steps have finished.
+
     Attributes:
         state: The CharacterSelectState that will be animated.
         vs_wipe_y: An integer for the top end of the wipe out effect,
@@ -614,6 +702,8 @@ class OutroTransition(object):
     def play(self, next_state, music_will_fade=False):
         """Start playing the outro animation.
 
+        Nothing will happen if the outro is already running.
+
         Args:
             next_state: An integer for the index of the Game State to
                 run once the outro finishes. See the StateIDs enum for
@@ -621,85 +711,81 @@ class OutroTransition(object):
             music_will_fade: A Boolean indicating whether the Select
                 Screen music should be faded out.
         """
+        if self.is_running:
+            return
+
         self.is_running = True
         self.next_state = next_state
         if music_will_fade:
             pygame.mixer.music.fadeout(MUSIC_FADEOUT_TIME)
 
-    def update(self, time):
-        """Update the outro animation.
+        tweens = self.state.get_tween_scheduler()
+        roster = self.state.roster
+        bg_lines = self.state.bg_lines
 
-        Args:
-            time: A float for the amount of time elapsed, in seconds,
-                since the last update.
-        """
-        if self.state.num_of_characters() > 0:
-            self.state.p1_preview.update()
-            self.state.p2_preview.update()
-
-        # Start of animation sequence.
-        if self.vs_wipe_y > 0:
-            self.wipe_out_vs(time)
-
-        elif (self.state.num_of_characters() <= 0 and
-              not self.state.roster.is_offscreen()):
-            self.slide_out_roster(time)
-        elif (self.state.num_of_characters() > 0 and
-              not (self.state.p1_preview.is_offscreen() and
-                   self.state.p2_preview.is_offscreen() and
-                   self.state.roster.is_offscreen())):
-            self.slide_out_roster(time)
-            self.slide_out_previews(time)
-
-        elif not self.state.bg_lines.are_not_visible():
-            self.move_lines_out(time)
+        wipe_duration = frames_for_distance(self.vs_wipe_y,
+                                            TransitionSpeeds.VS)
+        tweens.start(self.vs_wipe_y, 0, wipe_duration,
+                     on_update=self.set_vs_wipe, owner=self.state)
 
-        else:
-            self.state.change_state(self.next_state)
-
-    def move_lines_out(self, time):
-        """Scroll the lines out of the screen, from left to right.
-
-        Args:
-            time: A float for the amount of time elapsed, in seconds,
-                since the last update.
-        """
-        self.state.bg_lines.move_left_end(TransitionSpeeds.LINES * time)
-
-    def slide_out_roster(self, time):
-        """Slide the roster in the direction of the bottom edge of the
-        screen.
-
-        Args:
-            time: A float for the amount of time elapsed, in seconds,
-                since the last update.
-        """
-        self.state.roster.move(dy=(TransitionSpeeds.ROSTER * time))
+        roster_distance = SCREEN_SIZE[1] - roster.y
+        slide_duration = frames_for_distance(roster_distance,
+                                             TransitionSpeeds.ROSTER)
+        tweens.start(0, roster_distance, slide_duration,
+            on_update=lambda y, change: roster.move(dy=change),
+            delay=wipe_duration, owner=self.state)
 
-    def slide_out_previews(self, time):
-        """Slide the CharacterPreviews out toward either side of the
-        screen.
+        if self.state.num_of_characters() > 0:
+            p1_preview = self.state.p1_preview
+            p2_preview = self.state.p2_preview
+            p1_duration = self.slide_out_preview(p1_preview, -1,
+                p1_preview.x + p1_preview.animation.get_width(),
+                wipe_duration)
+            p2_duration = self.slide_out_preview(p2_preview, 1,
+                SCREEN_SIZE[0] - p2_preview.x, wipe_duration)
+            slide_duration = max(slide_duration, p1_duration, p2_duration)
+
+        lines_distance = bg_lines.right_end - bg_lines.left_end
+        tweens.start(0, lines_distance,
+            frames_for_distance(lines_distance, TransitionSpeeds.LINES),
+            on_update=lambda x, change: bg_lines.move_left_end(change),
+            on_complete=self.finish,
+            delay=(wipe_duration + slide_duration), owner=self.state)
+
+    def slide_out_preview(self, preview, direction, distance, delay):
+        """Schedule a CharacterPreview to slide out toward the left or
+        right edge of the screen, and return an integer for the length
+        of the slide in update frames.
 
         Args:
-            time: A float for the amount of time elapsed, in seconds,
-                since the last update.
-        """
-        p1_distance = self.state.p1_preview.slide_speed() * time
-        p2_distance = self.state.p2_preview.slide_speed() * time
-        self.state.p1_preview.move(dx=(-1 * p1_distance))
-        self.state.p2_preview.move(dx=p2_distance)
-
-    def wipe_out_vs(self, time):
+            preview: The CharacterPreview that will be moved.
+            direction: An integer that is 1 if the preview slides to
+                the right, or -1 if it slides to the left.
+            distance: A float for the distance the preview will travel.
+            delay: An integer for the number of update frames to wait
+                before the slide begins.
+        """
+        duration = frames_for_distance(distance, preview.slide_speed())
+        self.state.get_tween_scheduler().start(0, distance, duration,
+            on_update=lambda x, change: preview.move(dx=(direction * change)),
+            delay=delay, owner=self.state)
+        return duration
+
+    def set_vs_wipe(self, wipe_y, change):
         """Move the lower bound of the VS text's draw region upward in
         order to produce a 'wipe-out' effect.
 
         Args:
-            time: A float for the amount of time elapsed, in seconds,
-                since the last update.
+            wipe_y: A float for the new lower bound, relative to the VS
+                text Surface.
+            change: A float for the change from the previous bound.
         """
-        self.vs_wipe_y -= TransitionSpeeds.VS * time
-        if self.vs_wipe_y < 0:
-            self.vs_wipe_y = 0
+        self.vs_wipe_y = wipe_y
+
+    def finish(self):
+        """End the outro and switch to the next Game State."""
+        self.is_running = False
+        self.state.change_state(self.next_state)
 
     def draw(self, parent_surf):
         """Draw all of the Character Select Screen graphics onto a
@@ -896,8 +982,8 @@ class RosterDisplay():
             screen.
         y: An integer for the y-position of the roster relative to the
             screen.
-        mugshots: A tuple of Surfaces, each containing a character's
-            mugshot.
+        all_chars: A tuple of RosterEntry tuples for all of the
+            characters included in the game.
         current_row: An integer for the index of the currently-selected
             'row' of characters. Each row contains a number of
             characters specified by the SLOTS_PER_ROW constant.
@@ -910,6 +996,23 @@ class RosterDisplay():
             mugshot.
         rendered_row: A Surface containing the currently-selected row
             of character slots.
+        row_surfs: A dict mapping the indexes of the resident rows to
+            their rendered Surfaces. Only the current row and the rows
+            directly above and below it are kept resident, so that
+            scrolling by one row never has to wait for rendering.
+        slot_surfs: An OrderedDict mapping the indexes of characters to
+            their framed mugshot Surfaces, from the least to the most
+            recently shown. At most SLOT_CACHE_SIZE are kept, and the
+            Surface of the least recently shown slot is drawn over to
+            make a new one.
+        mugshots: An ImageCache that loads the characters' mugshots.
+            The mugshots of the rows beyond the resident rows are
+            prefetched, so that they are usually loaded by the time
+            those rows become resident.
+        spare_row_surfs: A list of row Surfaces released from rows that
+            are no longer resident, to be reused for new rows.
+        blank_slot: A Surface containing an empty character slot, shared
+            by every row that isn't full.
         scroll_up_arrow: A RosterArrow indicating that the players can
             scroll up a row.
         scroll_down_arrow: A RosterArrow indicating that the players can
@@ -919,19 +1022,24 @@ class RosterDisplay():
         """Declare and initialize instance variables.
 
         Args:
-            all_chars: A tuple of CharacterData objects for all of the
+            all_chars: A tuple of RosterEntry tuples for all of the
                 characters included in the game.
                 If None is passed, a blank roster will be created.
         """
         if all_chars is None:
-            self.mugshots = []
+            self.all_chars = ()
         else:
-            self.mugshots = self.load_all_mugshots(all_chars)
-        self.rendered_row = self.render_row(0)
-        self.x = self.get_screen_centered_x()
-        self.y = SCREEN_SIZE[1] - self.rendered_row.get_height()
+            self.all_chars = all_chars
+        self.row_surfs = {}
+        self.slot_surfs = collections.OrderedDict()
+        self.mugshots = ImageCache(MUGSHOT_CACHE_SIZE)
+        self.spare_row_surfs = []
+        self.blank_slot = self.render_slot(-1)
         self.current_row = 0
         self.current_slot = 0
+        self.show_row(0)
+        self.x = self.get_screen_centered_x()
+        self.y = SCREEN_SIZE[1] - self.rendered_row.get_height()
         self.cursor = RosterCursor((self.x, self.y))
         self.scroll_up_arrow = RosterArrow(ArrowType.UP, self.x, self.y,
                                            self.rendered_row.get_width(),
@@ -940,49 +1048,134 @@ class RosterDisplay():
                                              self.rendered_row.get_width(),
                                              self.rendered_row.get_height())
 
-    @staticmethod
-    def load_all_mugshots(all_chars):
-        """Return a tuple of Surfaces, containing the mugshot images for
-        every character.
+    def num_of_characters(self):
+        """Return an integer for the number of characters in the
+        roster.
+        """
+        return len(self.all_chars)
+
+    def get_resident_rows(self, row_index):
+        """Return a set of the indexes of the rows that should be kept
+        resident while a certain row is shown: the row itself, and the
+        rows that scrolling up or down would lead to.
 
         Args:
-            all_chars: A tuple of CharacterData objects for all of the
-                characters included in the game.
+            row_index: An integer for the index of the shown row.
+        """
+        row_amount = max(self.num_of_rows(), 1)
+        return set([row_index, (row_index - 1) % row_amount,
+                    (row_index + 1) % row_amount])
+
+    def show_row(self, row_index):
+        """Make a row the currently-displayed row, rendering it and its
+        neighbouring rows if they aren't already resident.
+
+        Rows that are no longer adjacent to the shown row are released,
+        and their Surfaces are kept for reuse. The mugshots of the rows
+        two above and two below are then prefetched.
+
+        Args:
+            row_index: An integer for the index of the row to show.
+        """
+        resident_rows = self.get_resident_rows(row_index)
+
+        for old_row in self.row_surfs.keys():
+            if old_row not in resident_rows:
+                self.release_row(old_row)
+
+        for new_row in resident_rows:
+            if new_row not in self.row_surfs:
+                self.row_surfs[new_row] = self.render_row(new_row)
+
+        self.rendered_row = self.row_surfs[row_index]
+        self.prefetch_mugshots(row_index)
+
+    def release_row(self, row_index):
+        """Stop keeping a row resident, and set aside its Surface to be
+        reused. Its framed slots stay in slot_surfs.
+
+        Args:
+            row_index: An integer for the index of the row to release.
+        """
+        self.spare_row_surfs.append(self.row_surfs.pop(row_index))
+
+    def prefetch_mugshots(self, row_index):
+        """Start loading the mugshots of the rows one beyond the
+        resident rows in the background, skipping characters whose
+        slots are already rendered.
+
+        Args:
+            row_index: An integer for the index of the shown row.
         """
+        row_amount = max(self.num_of_rows(), 1)
         mugshot_paths = []
 
-        for character in all_chars:
-            mugshot_paths.append(character.mugshot_path)
+        next_rows = (set([(row_index + 2) % row_amount,
+                          (row_index - 2) % row_amount]) -
+                     self.get_resident_rows(row_index))
+
+        for next_row in next_rows:
+            first_slot = next_row * SLOTS_PER_ROW
+            last_slot = min(first_slot + SLOTS_PER_ROW,
+                            self.num_of_characters())
+            for slot_index in xrange(first_slot, last_slot):
+                if slot_index not in self.slot_surfs:
+                    mugshot_paths.append(
+                        self.all_chars[slot_index].mugshot_path)
 
-        return load_tuple_of_images(mugshot_paths)
+        self.mugshots.prefetch(mugshot_paths)
 
     def render_row(self, row_index):
-        """Render a row of mugshots in order from the mugshot list.
+        """Render a row of mugshots in order from the roster.
+
+        A spare row Surface will be drawn over if there is one, rather
+        than creating a new Surface.
 
         Args:
             row_index: An integer for the index of the row that will be
                 rendered. For example, given that SLOTS_PER_ROW is 5,
                 passing 1 would render mugshots of index 5 through 9.
         """
-        row_surf = Surface((self.slot_size() * SLOTS_PER_ROW,
-                            self.slot_size()))
+        if len(self.spare_row_surfs) > 0:
+            row_surf = self.spare_row_surfs.pop()
+        else:
+            row_surf = Surface((self.slot_size() * SLOTS_PER_ROW,
+                                self.slot_size()))
         slot_x = 0
 
         first_slot = row_index * SLOTS_PER_ROW
         last_slot = first_slot + SLOTS_PER_ROW
 
-        for slot_index in xrange(first_slot, last_slot + 1):
-            if slot_index <= len(self.mugshots) - 1:
-                new_slot = self.render_slot(slot_index)
+        for slot_index in xrange(first_slot, last_slot):
+            if slot_index <= self.num_of_characters() - 1:
+                row_surf.blit(self.get_slot_surf(slot_index), (slot_x, 0))
             else:
-                new_slot = self.render_slot(-1)
-            row_surf.blit(new_slot, (slot_x, 0))
+                row_surf.blit(self.blank_slot, (slot_x, 0))
 
             slot_x += self.slot_size()
 
         return row_surf
 
-    def render_slot(self, slot_index):
+    def get_slot_surf(self, slot_index):
+        """Return a Surface containing a character's framed mugshot,
+        rendering it if it isn't already in slot_surfs, and mark it as
+        the most recently shown slot.
+
+        Args:
+            slot_index: An integer for the index of the character.
+        """
+        slot_surf = self.slot_surfs.pop(slot_index, None)
+
+        if slot_surf is None:
+            if len(self.slot_surfs) >= SLOT_CACHE_SIZE:
+                # Draw over the least recently shown slot.
+                slot_surf = self.slot_surfs.popitem(last=False)[1]
+            slot_surf = self.render_slot(slot_index, slot_surf)
+
+        self.slot_surfs[slot_index] = slot_surf
+        return slot_surf
+
+    def render_slot(self, slot_index, slot_surf=None):
         """Render one of the character's mugshots and place it within a
         frame.
 
@@ -990,15 +1183,19 @@ class RosterDisplay():
         be rendered.
 
         Args:
-            slot_index: The index of the character's mugshot within
-                mugshot_paths. Passing a value less than 0 will create
-                a blank slot.
+            slot_index: The index of the character within the roster.
+                Passing a value less than 0 will create a blank slot.
+            slot_surf: Optional. A Surface of the slot's size to draw
+                over. If it is None, a new Surface will be created.
 
         Returns:
             A Surface containing a framed mugshot, if slot_index is 0 or
             more. Otherwise, a Surface with a blank slot is returned.
         """
-        slot_surf = Surface((self.slot_size(), self.slot_size()))
+        if slot_surf is None:
+            slot_surf = Surface((self.slot_size(), self.slot_size()))
+        else:
+            slot_surf.fill((0, 0, 0))
 
         # Background.
         pygame.draw.rect(slot_surf, BACKGROUND_COLOR,
@@ -1007,7 +1204,8 @@ class RosterDisplay():
 
         # Mugshot.
         if slot_index >= 0:
-            mugshot = self.mugshots[slot_index]
+            mugshot = self.mugshots.get_image(
+                self.all_chars[slot_index].mugshot_path)
             slot_surf.blit(mugshot, (FRAME_THICKNESS, FRAME_THICKNESS))
 
         # Frame.
@@ -1033,7 +1231,8 @@ class RosterDisplay():
         """Return an integer for the number of rows of characters that
         can be selected.
         """
-        return int(round_up(len(self.mugshots) / float(SLOTS_PER_ROW)))
+        return int(round_up(self.num_of_characters() /
+                            float(SLOTS_PER_ROW)))
 
     def draw(self, parent_surf):
         """Draw the entire roster onto another Surface.
@@ -1042,7 +1241,25 @@ class RosterDisplay():
             parent_surf: The Surface upon which the roster will be
                 drawn.
         """
+        self.draw_row(parent_surf)
+        self.draw_indicators(parent_surf)
+
+    def draw_row(self, parent_surf):
+        """Draw the currently-selected row of character slots onto
+        another Surface.
+
+        Args:
+            parent_surf: The Surface upon which the row will be drawn.
+        """
         parent_surf.blit(self.rendered_row, (self.x, self.y))
+
+    def draw_indicators(self, parent_surf):
+        """Draw the cursor and any scroll arrows onto another Surface.
+
+        Args:
+            parent_surf: The Surface upon which the cursor and arrows
+                will be drawn.
+        """
         self.cursor.draw(parent_surf)
         if self.current_row > 0:
             self.scroll_up_arrow.draw(parent_surf)
@@ -1060,7 +1277,7 @@ class RosterDisplay():
         self.cursor.move(0 - self.slot_size() * self.current_slot, 0)
         self.current_row = 0
         self.current_slot = 0
-        self.rendered_row = self.render_row(0)
+        self.show_row(0)
 
     def select_character(self, character_index):
         """Move selection to a specific character.
@@ -1076,18 +1293,18 @@ class RosterDisplay():
 
         self.current_row = row
         self.current_slot = new_slot
-        self.rendered_row = self.render_row(row)
+        self.show_row(row)
         self.cursor.move(self.slot_size() * slot_diff, 0)
 
     def select_next(self):
         """Select the next character slot, if there is one."""
-        if self.get_character_index() < len(self.mugshots) - 1:
+        if self.get_character_index() < self.num_of_characters() - 1:
             if self.current_slot >= SLOTS_PER_ROW - 1:
                 # Move on to the next row.
                 self.cursor.move(0 - self.slot_size() * self.current_slot, 0)
                 self.current_slot = 0
                 self.current_row += 1
-                self.rendered_row = self.render_row(self.current_row)
+                self.show_row(self.current_row)
             else:
                 self.current_slot += 1
                 self.cursor.move(self.slot_size(), 0)
@@ -1102,7 +1319,7 @@ class RosterDisplay():
                                  0)
                 self.current_slot = SLOTS_PER_ROW - 1
                 self.current_row -= 1
-                self.rendered_row = self.render_row(self.current_row)
+                self.show_row(self.current_row)
             else:
                 self.current_slot -= 1
                 self.cursor.move(0 - self.slot_size(), 0)
@@ -1112,8 +1329,8 @@ class RosterDisplay():
         less slots than the previous one, make sure  the selection only
         goes as far as the very last slot.
         """
-        if len(self.mugshots) % SLOTS_PER_ROW != 0:
-            last_slot = (len(self.mugshots) - 1) % SLOTS_PER_ROW
+        if self.num_of_characters() % SLOTS_PER_ROW != 0:
+            last_slot = (self.num_of_characters() - 1) % SLOTS_PER_ROW
             self.cursor.move(0 - (self.slot_size() *
                                   (self.current_slot - last_slot)), 0)
             self.current_slot = last_slot
@@ -1127,12 +1344,12 @@ class RosterDisplay():
         if self.current_row < self.num_of_rows() - 1:
             self.current_row += 1
 
-            if self.get_character_index() > len(self.mugshots) - 1:
+            if self.get_character_index() > self.num_of_characters() - 1:
                 self.correct_last_row_selection()
         else:
             self.current_row = 0
 
-        self.rendered_row = self.render_row(self.current_row)
+        self.show_row(self.current_row)
 
     def scroll_up_row(self):
         """Scroll up to the previous row of characters.
@@ -1145,7 +1362,7 @@ class RosterDisplay():
         else:
             self.current_row = self.num_of_rows() - 1
             self.correct_last_row_selection()
-        self.rendered_row = self.render_row(self.current_row)
+        self.show_row(self.current_row)
 
     def move(self, dx=0, dy=0):
         """Move the roster across the screen space.
@@ -1223,10 +1440,8 @@ class RosterCursor(Animation):
             position: A tuple of two integers which represent the x
                 and y-positions of the cursor relative to ths screen.
         """
-        self.p1_image = pygame.image.load(P1_SPRITESHEET)
-        self.p1_image = convert_to_colorkey_alpha(self.p1_image)
-        self.p2_image = pygame.image.load(P2_SPRITESHEET)
-        self.p2_image = convert_to_colorkey_alpha(self.p2_image)
+        self.p1_image = import_image(P1_SPRITESHEET)
+        self.p2_image = import_image(P2_SPRITESHEET)
         super(RosterCursor, self).__init__(self.p1_image, position,
                                            CURSOR_FRAME_AMOUNT,
                                            CURSOR_FRAME_DURATION)
@@ -1263,8 +1478,7 @@ class RosterArrow(Animation):
             roster_height: An integer for the height of the roster, in
                 pixels.
         """
-        spritesheet = image.load(ARROW_SPRITESHEET)
-        spritesheet = convert_to_colorkey_alpha(spritesheet)
+        spritesheet = import_image(ARROW_SPRITESHEET)
         super(RosterArrow, self).__init__(spritesheet, (0, 0),
                                           ARROW_FRAME_AMOUNT,
                                           ARROW_FRAME_DURATION)
@@ -5,6 +5,8 @@ from pygame.locals import *
 from pygame.surface import Surface
 from customize.globals import *
 from lib.custom_data.settings_manager import load_settings
+from lib.tween import TweenScheduler
+from lib.assets import AssetManager
 from lib.game_states.state import State
 from lib.game_states.state_pass import StatePass
 from lib.game_states.state_ids import StateIDs
@@ -13,6 +15,11 @@ from lib.game_states.settings_state import SettingsState
 from lib.game_states.character_select_state import CharacterSelectState
 from lib.game_states.stage_select_state import StageSelectState
 
+
+# A custom PyGame event that wakes the game up while it is idle.
+IDLE_WAKE_EVENT = USEREVENT + 1
+
+
 class GameStateManager(object):
     """This class runs the main game loop and updates the appropriate
     Game State.
@@ -53,6 +60,20 @@ class GameStateManager(object):
         scaled_surf: A Surface with dimensions that match the current
             window magnification rate. (The rate is defined by
             screen_scale in state_pass.settings.)
+        darkened_surf: When a State's brightness is lowered, such as
+            during a fade, its Surface is copied onto this Surface and
+            darkened before being drawn. For States drawn at native
+            resolution, this is done before the Surface is magnified.
+        idle_timer: An integer counter for the number of update cycles
+            that have passed without player input or any visible State
+            animating. Once it reaches IDLE_DELAY, the game goes idle
+            and waits for input rather than updating every frame.
+        tweens: The TweenScheduler that runs the transitions and other
+            timed animations of every Game State.
+        assets: The AssetManager that loads images for Game States.
+            If RENDER_AT_SCALE is enabled, it pre-scales them to the
+            screen scale, and States that support it will be drawn to
+            the screen without being magnified.
     """
     # Initialization
     def __init__(self):
@@ -63,7 +84,10 @@ class GameStateManager(object):
         self.prepare_screen()
         self.clock = pygame.time.Clock()
         self.state_pass = StatePass(settings)
+        self.tweens = TweenScheduler()
+        self.assets = AssetManager(self.get_render_scale(settings), UPSCALER)
         self.active_state_stack = [self.create_state_by_id(StateIDs.TITLE)]
+        self.active_state_stack[0].start_state()
         self.next_state = None
         self.init_state_thread = Thread()
         self.zoom_one_surf = Surface((SCREEN_SIZE[0],
@@ -73,6 +97,9 @@ class GameStateManager(object):
         self.zoom_three_surf = Surface((SCREEN_SIZE[0] * 3,
                                         SCREEN_SIZE[1] * 3)).convert()
         self.scaled_surf = self.zoom_one_surf
+        self.darkened_surf = Surface((SCREEN_SIZE[0],
+                                      SCREEN_SIZE[1])).convert()
+        self.idle_timer = 0
 
     def create_screen(self, settings_data):
         """Return the Surface that will be used as the game screen.
@@ -91,6 +118,19 @@ class GameStateManager(object):
 
         return screen
 
+    def get_render_scale(self, settings_data):
+        """Return an integer for the magnification rate that images
+        should be pre-scaled by when they are loaded.
+
+        Args:
+            settings_data: A SettingsData object for various options
+                that can be set by the players via the Settings screen.
+        """
+        if RENDER_AT_SCALE:
+            return settings_data.screen_scale
+        else:
+            return 1
+
     def prepare_screen(self):
         """Perform additional operations to initialize the game
         window display.
@@ -149,7 +189,10 @@ class GameStateManager(object):
             else:
                 self.screen = pygame.display.set_mode(scaled_size, 0)
 
-    def scale_state_surface(self, state_surf, scale):
+            self.assets.set_render_scale(
+                self.get_render_scale(self.state_pass.settings))
+
+    def scale_state_surface(self, state_surf, scale, brightness=255):
         """Magnify Surface of a Game State according to the specified
        magnification rate and draw it onto the scaled game Surface
        currently in use.
@@ -157,6 +200,9 @@ class GameStateManager(object):
         Args:
             state_surf: The State Surface to resize.
             scale: An integer for the magnification rate.
+            brightness: Optional. An integer from 0 to 255 for how
+                brightly the State Surface will be shown. By default,
+                it is shown as-is.
         """
         new_size = (SCREEN_SIZE[0] * scale,
                     SCREEN_SIZE[1] * scale)
@@ -167,23 +213,32 @@ class GameStateManager(object):
             self.scaled_surf = self.zoom_two_surf
         else:
             self.scaled_surf = self.zoom_three_surf
+
+        if brightness < 255:
+            state_surf = self.darken_surface(state_surf, brightness)
         pygame.transform.scale(state_surf, new_size, self.scaled_surf)
 
-        # Scaling causes the alpha value of the Surface to be lost,
-        # so scaled_surf's alpha value will have to be explicitly set
-        # to match the original transparency of the surf.
-        self.match_surface_alpha(state_surf)
+    def darken_surface(self, surf, brightness):
+        """Copy a Surface onto darkened_surf, darken it, and return
+        darkened_surf.
 
-    def match_surface_alpha(self, surf):
-        """Match the alpha transparency of the scaled Surface currently
-        in use with that of another Surface.
+        For States drawn at native resolution, the darkening is applied
+        before the Surface is magnified, so that it covers as few pixels
+        as possible and the scaled Surface can still be blitted to the
+        screen without any blending.
 
         Args:
-            surf: The Surface whose alpha value will be used as
-                reference.
+            surf: The Surface to darken. It will not be modified.
+            brightness: An integer from 0 to 255 for how brightly the
+                Surface will be shown. 0 will turn it completely black.
         """
-        if self.scaled_surf.get_alpha() != surf.get_alpha():
-            self.scaled_surf.set_alpha(surf.get_alpha())
+        if self.darkened_surf.get_size() != surf.get_size():
+            self.darkened_surf = Surface(surf.get_size()).convert()
+
+        self.darkened_surf.blit(surf, (0, 0))
+        self.darkened_surf.fill((brightness, brightness, brightness),
+                                special_flags=BLEND_MULT)
+        return self.darkened_surf
 
     def is_loading_next_state(self):
         """Return a Boolean indicating whether the next Game State is
@@ -217,8 +272,11 @@ class GameStateManager(object):
     def pop_top_state(self):
         """Pop the currently-active State off the top of the stack and
         switch processing to the State underneath it.
+
+        Any transitions still running in the popped State are cancelled.
         """
-        self.active_state_stack.pop()
+        popped_state = self.active_state_stack.pop()
+        self.tweens.cancel(popped_state)
 
     def change_state(self, next_state_id):
         """Pop the currently-active State from the stack and push a new
@@ -264,6 +322,7 @@ class GameStateManager(object):
         stack and switch game processing to that State.
         """
         self.active_state_stack.append(self.next_state)
+        self.next_state.start_state()
         self.next_state = None
 
     # Game Processing
@@ -274,6 +333,9 @@ class GameStateManager(object):
                 pygame.quit()
                 sys.exit()
 
+            if event.type == KEYDOWN:
+                self.idle_timer = 0
+
             if event.type == KEYDOWN and not self.is_loading_next_state():
                 active_state = self.active_state_stack[-1]
                 if active_state.is_accepting_input:
@@ -289,6 +351,58 @@ class GameStateManager(object):
         for visible_state in self.get_visible_states():
             visible_state.update_state(seconds)
 
+    def is_animating(self):
+        """Return a Boolean indicating whether any part of the game
+        needs to keep updating at the full frame rate.
+
+        This is the case while the next Game State is being prepared,
+        while any Tweens are running, or while any visible State has
+        something moving on screen.
+        """
+        if self.next_state is not None or self.is_loading_next_state():
+            return True
+
+        if self.tweens.is_running():
+            return True
+
+        for visible_state in self.get_visible_states():
+            if visible_state.is_animating():
+                return True
+
+        return False
+
+    def update_idle_timer(self):
+        """Count another quiet update cycle, or reset the count if
+        something in the game is animating.
+        """
+        if self.is_animating():
+            self.idle_timer = 0
+        elif not self.is_idle():
+            self.idle_timer += 1
+
+    def is_idle(self):
+        """Return a Boolean indicating whether the game has been quiet
+        for long enough to stop updating every frame.
+        """
+        return self.idle_timer >= IDLE_DELAY
+
+    def wait_for_activity(self):
+        """Block until an event arrives or IDLE_TIMEOUT milliseconds
+        pass, whichever happens first.
+
+        The event that woke the game is put back on the queue so that
+        handle_events() will respond to it as usual. The time spent
+        waiting is discarded from the game clock, so that the next
+        update doesn't try to catch up on it.
+        """
+        pygame.time.set_timer(IDLE_WAKE_EVENT, IDLE_TIMEOUT)
+        event = pygame.event.wait()
+        pygame.time.set_timer(IDLE_WAKE_EVENT, 0)
+
+        if event.type != IDLE_WAKE_EVENT:
+            pygame.event.post(event)
+        self.clock.tick()
+
     def update_game_visuals(self):
         """Update the entire game display."""
         self.scale_screen(self.state_pass.settings.screen_scale)
@@ -312,15 +426,25 @@ class GameStateManager(object):
         update the screen as a whole.
 
         The State Surface will also be scaled according to screen_scale
-        within state_pass.
+        within state_pass, unless the State already draws at that
+        scale.
 
         Args:
             drawn_state: The State that will be drawn.
         """
         scale = self.state_pass.settings.screen_scale
 
-        self.scale_state_surface(drawn_state.state_surface, scale)
-        self.screen.blit(self.scaled_surf, drawn_state.screen_offset())
+        if drawn_state.render_scale == scale:
+            drawn_surf = drawn_state.state_surface
+            if drawn_state.brightness < 255:
+                drawn_surf = self.darken_surface(drawn_surf,
+                                                 drawn_state.brightness)
+        else:
+            self.scale_state_surface(drawn_state.state_surface, scale,
+                                     drawn_state.brightness)
+            drawn_surf = self.scaled_surf
+
+        self.screen.blit(drawn_surf, drawn_state.screen_offset())
 
     def sleep_between_cycles(self, milliseconds):
         """If there is time remaining between game update cycles,
@@ -340,8 +464,15 @@ class GameStateManager(object):
             pygame.time.wait(1)
 
     def run_game(self):
-        """Run the main game loop."""
+        """Run the main game loop.
+
+        Once the game has gone idle, each loop will wait for player
+        input before updating, instead of running at the frame rate.
+        """
         while True:
+            if self.is_idle():
+                self.wait_for_activity()
+
             # Update processes after a passage of time equal to the
             # global frame rate.
             milliseconds = self.clock.tick(FRAME_RATE)
@@ -350,7 +481,10 @@ class GameStateManager(object):
             if self.next_state is not None:
                 self.run_next_state()
             self.handle_events()
+            self.tweens.update(seconds)
             self.update_visible_states(seconds)
+            self.update_idle_timer()
             self.update_game_visuals()
-            self.sleep_between_cycles(milliseconds)
+            if not self.is_idle():
+                self.sleep_between_cycles(milliseconds)
 
@@ -10,7 +10,8 @@ from customize.globals import SCREEN_SIZE
 from customize.globals import INPUT_NAMES
 from customize.globals import FRAME_RATE
 from customize.settings import *
-from lib.graphics import Graphic, Animation, render_text
+from lib.graphics import Graphic, Animation, SpriteGroup, render_text
+from lib.tween import frames_for_distance
 from lib.game_states.state import State
 from lib.game_states.state_pass import StatePass
 from lib.custom_data.settings_manager import save_settings
@@ -70,6 +71,8 @@ class SettingsState(State):
         self.is_leaving_state = False
         self.load_settings_from_file()
         self.prepare_state()
+        self.add_static_layer(self.draw_static_graphics)
+        self.add_dynamic_layer(self.binding_list.draw_arrows)
 
     def load_settings_from_file(self):
         """Load settings data from the external settings file."""
@@ -81,7 +84,9 @@ class SettingsState(State):
         display_setting.set_selected_option(int(loaded.show_box_display))
 
     def prepare_state(self):
-        """Set the cursor's default position and start the intro animation."""
+        """Set the cursor's default position and place the screen
+        outside of the window, ready for the intro animation.
+        """
         scale = self.state_pass.settings.screen_scale
         self.exact_offset = (SCREEN_SIZE[0] * scale, 0.0)
         self.setting_list.set_selected_setting(SettingIndex.SCALE)
@@ -90,6 +95,11 @@ class SettingsState(State):
         self.is_accepting_input = False
         self.is_intro_on = True
 
+    def start_state(self):
+        """Start the introductory slide animation."""
+        self.state_pass.ui_channel.play(self.slide_sound)
+        self.slide(SCREEN_SIZE[0], 0, self.finish_intro)
+
     # Updating
     def update_state(self, time):
         """Update all processes within this State.
@@ -98,79 +108,56 @@ class SettingsState(State):
             time: A float for the time, in seconds, elapsed since the last
                 update cycle.
         """
-        if self.is_intro_on:
-            self.enter_state(time)
-        elif self.is_leaving_state:
-            self.leave_state(time)
-
         self.draw_state()
 
-    # Sliding Animations
-    def enter_state(self, time):
-        """Show the introductory slide animation.
-
-        It will end once the once the screen fills the entire window.
+    def is_animating(self):
+        """Return a Boolean indicating whether the screen is currently
+        sliding in or out of the window.
+        """
+        return self.is_intro_on or self.is_leaving_state
 
-        Args:
-            time: A float for the time, in seconds, elapsed since the last
-                update cycle.
+    # Sliding Animations
+    def finish_intro(self):
+        """End the introductory slide animation once the screen fills
+        the entire window.
         """
-        self.animate_slide(time)
-        if self.exact_offset[0] <= 0.0:
-            self.is_accepting_input = True
-            self.is_intro_on = False
+        self.is_accepting_input = True
+        self.is_intro_on = False
 
-    def leave_state(self, time):
+    def leave_state(self):
         """Leave the Settings Screen.
 
         First, the screen will slide out of the window. Once it is
-        completely out of sight, the animation will end.
-        Afterwards, data from this screen will be saved and processing
-        will be sent to the previously-active Game State.
-
-        Args:
-            time: A float for the time, in seconds, elapsed since the last
-                update cycle.
+        completely out of sight, processing will be sent to the
+        previously-active Game State.
         """
-        self.animate_slide(time, is_backwards=True)
-        scale = self.state_pass.settings.screen_scale
-
-        if self.exact_offset[0] >= SCREEN_SIZE[0] * scale:
-            self.is_leaving_state = False
-            self.update_game_settings()
-            self.save_settings_to_file()
-            self.discard_state()
+        self.is_leaving_state = True
+        self.is_accepting_input = False
+        self.state_pass.ui_channel.play(self.exit_sound)
+        self.slide(0, SCREEN_SIZE[0], self.discard_state)
 
-    def animate_slide(self, time, is_backwards=False):
+    def slide(self, start_x, end_x, on_complete):
         """Slide the Settings Screen in or out of the game window.
 
+        Positions are given at the game's native resolution and are
+        scaled to match the current screen scale on every frame, so
+        the slide is unaffected by changes to the scale.
+
         Args:
-            time: A float for the time, in seconds, elapsed since the last
-                update cycle.
-            is_backwards: A Boolean indicating whether the State Surface
-                should slide out of the window, rather than into it.
+            start_x: An integer for the x-position, relative to the
+                window, where the screen begins sliding.
+            end_x: An integer for the x-position where the screen
+                stops.
+            on_complete: A function with no arguments that will be
+                called once the slide ends.
         """
-        scale = self.state_pass.settings.screen_scale
-        distance = SLIDE_SPEED * time * scale
+        def move_screen(x, change):
+            scale = self.state_pass.settings.screen_scale
+            self.exact_offset = (x * scale, 0.0)
 
-        if not is_backwards:
-            if self.exact_offset[0] >= SCREEN_SIZE[0] * scale:
-                self.state_pass.ui_channel.play(self.slide_sound)
-
-            new_x = self.exact_offset[0] - distance
-            self.exact_offset = (new_x, 0.0)
-            # Prevent the screen from going past the left edge of the window.
-            if self.exact_offset[0] <= 0.0:
-                self.exact_offset = (0.0, 0.0)
-        else:
-            if self.exact_offset[0] <= 0.0:
-                self.state_pass.ui_channel.play(self.exit_sound)
-
-            new_x = self.exact_offset[0] + distance
-            self.exact_offset = (new_x, 0.0)
-            # Prevent the screen from going past the right edge of the window.
-            if self.exact_offset[0] >= SCREEN_SIZE[0] * scale:
-                self.exact_offset = (SCREEN_SIZE[0] * scale, 0.0)
+        self.get_tween_scheduler().start(start_x, end_x,
+            frames_for_distance(end_x - start_x, SLIDE_SPEED),
+            on_update=move_screen, on_complete=on_complete, owner=self)
 
     # Input Handling
     def get_player_input(self, event):
@@ -224,7 +211,10 @@ class SettingsState(State):
             if input_name == 'cancel':
                 self.update_game_settings()
                 self.save_settings_to_file()
-                self.is_leaving_state = True
+                self.leave_state()
+
+        # Any of the above may have changed the displayed text.
+        self.invalidate_static_layers()
 
     def get_key_input(self, event):
         """Determine the in-game input from a key press.
@@ -320,10 +310,22 @@ class SettingsState(State):
         """Draw all of this State's contained graphics onto the State
         Surface.
         """
+        self.draw_layers()
 
-        self.bg_image.draw(self.state_surface)
-        self.setting_list.draw(self.state_surface)
-        self.binding_list.draw(self.state_surface)
+    def draw_static_graphics(self, parent_surf):
+        """Draw the background and all Setting and Key Binding text
+        onto a Surface.
+
+        These graphics only change in response to player input, so they
+        are drawn onto this State's StaticLayer.
+
+        Args:
+            parent_surf: The Surface upon which the graphics will be
+                drawn.
+        """
+        self.bg_image.draw(parent_surf)
+        self.setting_list.draw(parent_surf)
+        self.binding_list.draw_bindings(parent_surf)
 
 
 class SettingIndex(object):
@@ -649,6 +651,8 @@ class KeyBindingList(object):
                             down to show more bindings.
         top_binding         The index of the key binding currently
                             shown
+        sprite_group        A SpriteGroup that batches the drawing of
+                            the key binding text.
     """
     # Initialization
     def __init__(self, setting_list, p1_bindings, p2_bindings):
@@ -675,6 +679,7 @@ class KeyBindingList(object):
             (BINDING_LIST_X + ARROW_X, BINDING_LIST_Y +
              DOWN_ARROW_Y),
             ARROW_FRAMES, ARROW_DURATION)
+        self.sprite_group = SpriteGroup()
 
     def load_bindings(self, p1_bindings, p2_bindings):
         """Create all KeyBinding objects in a list and return them.
@@ -900,11 +905,21 @@ class KeyBindingList(object):
 
         @type parent_surf: SurfaceType
         """
+        self.draw_bindings(parent_surf)
+        self.draw_arrows(parent_surf)
+
+    def draw_bindings(self, parent_surf):
+        """Draw the text for the Key Bindings currently on display
+        onto a Surface.
+
+        Args:
+            parent_surf: The Surface upon which all of the Key Binding
+                text will be drawn.
+        """
         for index in range(self.top_binding, self.top_binding +
                 BINDINGS_ON_SCREEN):
-            self.bindings[index].draw(parent_surf)
-
-        self.draw_arrows(parent_surf)
+            self.bindings[index].queue_draw(self.sprite_group)
+        self.sprite_group.draw(parent_surf)
 
     def draw_arrows(self, parent_surf):
         """Draw the scrolling arrows if appropriate.
@@ -1073,6 +1088,16 @@ class KeyBinding(object):
         self.input_text.draw(parent_surf)
         self.key_text.draw(parent_surf)
 
+    def queue_draw(self, sprite_group):
+        """Add the text graphics for this key binding to a
+        SpriteGroup.
+
+        Args:
+            sprite_group    The SpriteGroup that will draw the text.
+        """
+        self.input_text.queue_draw(sprite_group)
+        self.key_text.queue_draw(sprite_group)
+
 
 class UnderlineText(Graphic):
     """Represents a text Graphic that can be underlined.
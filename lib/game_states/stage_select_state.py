@@ -51,20 +51,25 @@ Module Constants:
     TRANSITION_SLIDE_SPEED (int): The speed, in pixels per second, that
         Graphics move in and out of the screen at when transitioning in
         or out of this State.
+    PREVIEW_CACHE_SIZE (int): The maximum number of Stage preview images
+        kept in memory at once.
+    THUMB_CACHE_SIZE (int): The maximum number of Stage thumbnail images
+        kept in memory at once. This should be enough for the shown row
+        of Thumbnails and the rows directly above and below it.
 """
 import pygame.draw
-import pygame.image
-from collections import namedtuple
 from enum import IntEnum
 from math import ceil
 from random import randint
-from lib.graphics import (Graphic, Animation, render_text,
+from lib.graphics import (Graphic, Animation, SpriteGroup, render_text,
                           get_line_center, calculate_center_position)
+from lib.image_cache import ImageCache
 from customize.globals import SCREEN_SIZE
-from lib.custom_data.stage_loader import load_all_stages
+from lib.custom_data.menu_index import load_stage_index
 from lib.game_states.state import State
 from lib.game_states.state_ids import StateIDs
 from lib.game_states.select_state_sfx import SelectStateSFX
+from lib.tween import frames_for_distance
 from pygame.surface import Surface
 from pygame.rect import Rect
 
@@ -93,9 +98,8 @@ NUM_OF_ARROW_FRAMES = 2
 ARROW_FRAME_DURATION = 10
 THUMB_TO_ARROW_DISTANCE = 4
 TRANSITION_SLIDE_SPEED = 300
-
-
-StageMetadata = namedtuple('StageMetadata', 'name subtitle preview thumbnail')
+PREVIEW_CACHE_SIZE = 8
+THUMB_CACHE_SIZE = NUM_OF_THUMBS * 3
 
 
 class StageSelectState(State):
@@ -107,9 +111,15 @@ class StageSelectState(State):
             Stage name and No Stages Loaded text.
         subtitle_font (Font): The PyGame Font used for rendering the
             Stage subtitle text.
-        metadata (tuple of StageMetadata): This contains the names,
-            subtitles, preview images, and thumbnail images of all
+        stages (tuple of StageEntry): This contains the names,
+            subtitles, and preview and thumbnail image paths of all
             Stages available in the game.
+        preview_images (ImageCache): Loads the Stage preview images as
+            they are selected.
+        thumb_images (ImageCache): Loads the Stage thumbnail images as
+            their rows are shown.
+        blank_thumb (Surface): A plain white image shown in Thumbnails
+            that don't represent any Stage.
         thumbnails (tuple of Thumbnail): This contains Thumbnails
             representing every Stage within the game.
         preview (StagePreview): A snapshot of the Stage currently
@@ -132,10 +142,12 @@ class StageSelectState(State):
             sound clips in response to player input.
         transition (TransitionAnimation): An object that handles the
             intro and outro animations for this State.
-        selected_stage (int): The index number within metadata for the
+        selected_stage (int): The index number within stages for the
             Stage currently being selected.
         is_selection_confirmed (Boolean): Indicates whether the players
             have confirmed a Stage for battle. Set to False by default.
+        sprite_group (SpriteGroup): Collects the Graphics in each
+            layer so that they can be drawn in a single batch.
     """
     def __init__(self, state_manager, state_pass):
         """Declare and initialize instance variables.
@@ -159,8 +171,13 @@ class StageSelectState(State):
             NUM_OF_ARROW_FRAMES, ARROW_FRAME_DURATION)
         self.scroll_down_arrow.flip(is_vertical=True)
         self.sfx = SelectStateSFX(self.state_pass.ui_channel)
+        self.sprite_group = SpriteGroup()
 
-        self.metadata = self.load_all_stage_metadata()
+        self.stages = self.load_all_stages()
+        self.preview_images = ImageCache(PREVIEW_CACHE_SIZE)
+        self.thumb_images = ImageCache(THUMB_CACHE_SIZE)
+        self.blank_thumb = Surface((THUMB_SIZE, THUMB_SIZE))
+        self.blank_thumb.fill((255, 255, 255))
         if self.num_of_stages() <= 0:
             self.no_stages_text = render_text(self.name_font,
                 'No Stages Loaded', (255, 255, 255), (0, 0, 0), (0, 0))
@@ -170,10 +187,11 @@ class StageSelectState(State):
                              (0, 0, PREVIEW_WIDTH, PREVIEW_HEIGHT))
         else:
             self.stage_name = render_text(self.name_font,
-                self.metadata[0].name, (255, 255, 255), (0, 0, 0), (0, 0))
+                self.stages[0].name, (255, 255, 255), (0, 0, 0), (0, 0))
             self.stage_subtitle = render_text(self.subtitle_font,
-                self.metadata[0].subtitle, (255, 255, 255), (0, 0, 0), (0, 0))
-            preview_image = self.metadata[0].preview
+                self.stages[0].subtitle, (255, 255, 255), (0, 0, 0), (0, 0))
+            preview_image = self.preview_images.get_image(
+                self.stages[0].preview)
 
         self.preview = StagePreview(preview_image, self.calculate_preview_y())
         self.thumbnails = self.create_thumbnails()
@@ -184,31 +202,73 @@ class StageSelectState(State):
 
         self.selected_stage = 0
         self.is_selection_confirmed = False
+        self.prefetch_nearby_images()
 
         self.place_graphics_offscreen()
         self.transition = TransitionAnimation(self)
 
-    def load_all_stage_metadata(self):
-        """Return a tuple containing StageMetadata namedtuples for all
+        # The BackgroundLines move on every frame and are drawn beneath
+        # everything else, so none of this State's graphics can be
+        # cached on a StaticLayer.
+        self.add_dynamic_layer(self.draw_bg_lines)
+        self.add_dynamic_layer(self.draw_selection_graphics)
+        self.add_dynamic_layer(self.draw_scroll_arrows)
+
+    def load_all_stages(self):
+        """Return a tuple containing StageEntry namedtuples for all
         Stages loaded into the game.
-        """
-        metadata = []
-        all_stage_data = load_all_stages()
 
-        if all_stage_data is not None:
-            for stage_data in all_stage_data:
-                name = stage_data.name
-                subtitle = stage_data.subtitle
-                preview = pygame.image.load(stage_data.preview)
-                thumbnail = pygame.image.load(stage_data.thumbnail)
-                metadata.append(StageMetadata(name, subtitle,
-                                              preview, thumbnail))
+        Only the Stages' names and image file paths are read; the
+        images themselves are loaded once they need to be shown.
+        """
+        stage_index = load_stage_index()
 
-        return tuple(metadata)
+        if stage_index is None:
+            return ()
+        else:
+            return stage_index
 
     def num_of_stages(self):
         """Return the integer amount of Stages loaded into the game."""
-        return len(self.metadata)
+        return len(self.stages)
+
+    def get_thumbnail_image(self, stage_index):
+        """Return the thumbnail image for a Stage.
+
+        Args:
+            stage_index (int): The index number of the Stage within
+                stages. If no Stage has this index, blank_thumb is
+                returned instead.
+        """
+        if stage_index <= self.num_of_stages() - 1:
+            return self.thumb_images.get_image(
+                self.stages[stage_index].thumbnail)
+        else:
+            return self.blank_thumb
+
+    def prefetch_nearby_images(self):
+        """Start loading the images that are likely to be shown next in
+        the background: the previews of the Stages before and after the
+        selected one, and the thumbnails of the rows above and below
+        the shown row.
+        """
+        if self.num_of_stages() <= 0:
+            return
+
+        nearby_stages = [(self.selected_stage + 1) % self.num_of_stages(),
+                         (self.selected_stage - 1) % self.num_of_stages()]
+        self.preview_images.prefetch([self.stages[stage_index].preview
+                                      for stage_index in nearby_stages])
+
+        top_of_row = (self.selected_stage -
+                      (self.selected_stage % NUM_OF_THUMBS))
+        nearby_thumbs = []
+        for row_offset in (NUM_OF_THUMBS, -NUM_OF_THUMBS):
+            for thumb_index in range(0, NUM_OF_THUMBS):
+                stage_index = top_of_row + row_offset + thumb_index
+                if 0 <= stage_index <= self.num_of_stages() - 1:
+                    nearby_thumbs.append(self.stages[stage_index].thumbnail)
+        self.thumb_images.prefetch(nearby_thumbs)
 
     def create_thumbnails(self):
         """Return a tuple containing a number of Thumbnails depicting
@@ -223,14 +283,9 @@ class StageSelectState(State):
         y = calculate_center_position(0, SCREEN_SIZE[1], total_thumb_height)
 
         for stage_index in range(0, NUM_OF_THUMBS):
-            if stage_index <= self.num_of_stages() - 1:
-                image = self.metadata[stage_index].thumbnail
-            else:
-                # If less Stages were loaded than the amount specified by
-                # NUM_OF_THUMBS, fill the remaining Thumbnails with white.
-                image = Surface((THUMB_SIZE, THUMB_SIZE))
-                pygame.draw.rect(image, (255, 255, 255),
-                                 Rect(0, 0, THUMB_SIZE, THUMB_SIZE))
+            # If less Stages were loaded than the amount specified by
+            # NUM_OF_THUMBS, the remaining Thumbnails will be blank.
+            image = self.get_thumbnail_image(stage_index)
 
             new_thumbnail = StageThumbnail(image, y)
             thumbnails.append(new_thumbnail)
@@ -400,6 +455,8 @@ class StageSelectState(State):
                 which Stage relative to the current one should be
                 selected.
         """
+        previous_stage = self.selected_stage
+
         if direction == CursorDirection.PREVIOUS :
             if self.selected_stage > 0:
                 self.selected_stage -= 1
@@ -449,10 +506,14 @@ class StageSelectState(State):
                     # was on the final row.
                     self.selected_stage = self.num_of_stages() - 1
 
+        previous_row = previous_stage // NUM_OF_THUMBS
         self.highlight_selected_thumbnail()
-        self.update_thumbnail_images()
-        self.preview.change_stage(self.metadata[self.selected_stage].preview)
-        self.render_info_text(self.metadata[self.selected_stage])
+        if self.selected_stage // NUM_OF_THUMBS != previous_row:
+            self.update_thumbnail_images()
+        self.preview.change_stage(self.preview_images.get_image(
+            self.stages[self.selected_stage].preview))
+        self.render_info_text(self.stages[self.selected_stage])
+        self.prefetch_nearby_images()
 
     def highlight_selected_thumbnail(self):
         """Highlight the currently-selected StageThumbnail, and
@@ -476,35 +537,29 @@ class StageSelectState(State):
         top_of_row = (self.selected_stage -
                       (self.selected_stage % NUM_OF_THUMBS))
         for thumb_index in range(0, NUM_OF_THUMBS):
-            if top_of_row + thumb_index <= self.num_of_stages() - 1:
-                stage_index = top_of_row + thumb_index
-                image = self.metadata[stage_index].thumbnail
-            else:
-                # If the last row is currently selected and it has less
-                # Stages than NUM_OF_THUMBS, fill the remaining Thumbnails
-                # with white.
-                image = Surface((THUMB_SIZE, THUMB_SIZE))
-                pygame.draw.rect(image, (255, 255, 255),
-                                 Rect(0, 0, THUMB_SIZE, THUMB_SIZE))
+            # If the last row is currently selected and it has less
+            # Stages than NUM_OF_THUMBS, the remaining Thumbnails will be
+            # blank.
+            image = self.get_thumbnail_image(top_of_row + thumb_index)
             # The new image is blitted onto the Thumbnail Surface,
             # rather than having the image replaced, in order to
             # keep the border.
             self.thumbnails[thumb_index].image.blit(image, (BORDER_WIDTH,
                                                             BORDER_WIDTH))
 
-    def render_info_text(self, metadata):
+    def render_info_text(self, stage):
         """Re-render the displayed Stage name and subtitle to reflect
-        the Stage represented by the specified StageMetadata.
+        the Stage represented by the specified StageEntry.
 
         Args:
-            metadata (StageMetadata): An instance of the StageMetadata
-                namedtiple containing information for the Stage
+            stage (StageEntry): An instance of the StageEntry
+                namedtuple containing information for the Stage
                 currently being selected.
         """
         self.stage_name = render_text(self.name_font,
-            metadata.name, (255, 255, 255), (0, 0, 0), (0, 0))
+            stage.name, (255, 255, 255), (0, 0, 0), (0, 0))
         self.stage_subtitle = render_text(self.subtitle_font,
-            metadata.subtitle, (255, 255, 255), (0, 0, 0), (0, 0))
+            stage.subtitle, (255, 255, 255), (0, 0, 0), (0, 0))
         self.align_text()
 
     def confirm_stage(self):
@@ -520,6 +575,10 @@ class StageSelectState(State):
         """
         self.change_state(StateIDs.SELECT_CHARACTER)
 
+    def start_state(self):
+        """Start playing the intro animation."""
+        self.transition.reset()
+
     def update_state(self, time):
         """Update all processes within the State.
 
@@ -527,9 +586,6 @@ class StageSelectState(State):
             time (float): The time, in seconds, elapsed since the last
                 game update.
         """
-        if self.transition.is_running:
-            self.transition.update(time)
-
         for line in self.bg_lines:
             line.update_movement(time)
 
@@ -537,55 +593,79 @@ class StageSelectState(State):
 
     def draw_state(self):
         """Draw all graphics within this State onto the screen."""
-        pygame.draw.rect(self.state_surface, (0, 0, 0),
+        self.draw_layers()
+
+    def draw_bg_lines(self, parent_surf):
+        """Clear a Surface to black and draw the BackgroundLines onto
+        it.
+
+        Args:
+            parent_surf (Surface): The Surface upon which the lines
+                will be drawn.
+        """
+        pygame.draw.rect(parent_surf, (0, 0, 0),
                          Rect(0, 0, SCREEN_SIZE[0], SCREEN_SIZE[1]))
 
         for line in self.bg_lines:
-            line.draw(self.state_surface)
+            line.queue_draw(self.sprite_group)
+        self.sprite_group.draw(parent_surf)
 
-        # Draw the currently-selected Thumbnail last and on top,
-        # so that its highlighted border is not covered by the others.
+    def draw_selection_graphics(self, parent_surf):
+        """Draw the StageThumbnails, StagePreview, and Stage info text
+        onto a Surface.
+
+        Args:
+            parent_surf (Surface): The Surface upon which the graphics
+                will be drawn.
+        """
+        # Draw the currently-selected Thumbnail on top, so that its
+        # highlighted border is not covered by the others.
         for index in range(0, NUM_OF_THUMBS):
-            if not index == self.selected_thumbnail():
-                self.thumbnails[index].draw(self.state_surface)
-        self.thumbnails[self.selected_thumbnail()].draw(self.state_surface)
+            if index == self.selected_thumbnail():
+                self.thumbnails[index].queue_draw(self.sprite_group, z=1)
+            else:
+                self.thumbnails[index].queue_draw(self.sprite_group)
 
-        self.preview.draw(self.state_surface)
+        self.preview.queue_draw(self.sprite_group, z=1)
 
         if self.num_of_stages() > 0:
-            self.draw_scroll_arrows()
-            self.stage_name.draw(self.state_surface)
-            self.stage_subtitle.draw(self.state_surface)
+            self.stage_name.queue_draw(self.sprite_group, z=1)
+            self.stage_subtitle.queue_draw(self.sprite_group, z=1)
         else:
-            self.no_stages_text.draw(self.state_surface)
+            self.no_stages_text.queue_draw(self.sprite_group, z=1)
 
-    def draw_scroll_arrows(self):
+        self.sprite_group.draw(parent_surf)
+
+    def draw_scroll_arrows(self, parent_surf):
         """If there are more Stages that can be selected beyond the
         ones shown on screen, draw the scroll arrows to indicate this.
+
+        Args:
+            parent_surf (Surface): The Surface upon which the arrows
+                will be drawn.
         """
         if self.num_of_stages() > NUM_OF_THUMBS:
             current_row = self.selected_stage // NUM_OF_THUMBS
             max_row = self.num_of_stages() // NUM_OF_THUMBS
 
             if current_row > 0:
-                self.scroll_up_arrow.draw(self.state_surface)
+                self.scroll_up_arrow.draw(parent_surf)
             if current_row < max_row:
-                self.scroll_down_arrow.draw(self.state_surface)
+                self.scroll_down_arrow.draw(parent_surf)
 
 
 class TransitionAnimation(object):
     """Handles the animations played when entering and leaving the
     Stage Select State.
 
+    The Graphics slide in two waves, one after the other. Each wave
+    travels the full height of the screen.
+
     Attributes:
         is_running (Boolean): Indicates whether or not a transition
             animation is currently being executed.
         state (StageSelectState): The Stage Select State that this
             object will animate.
-        group1_distance (float): The vertical distance travelled, in
-            pixels, by the first wave of Graphics to move on-screen.
-        group2_distance (float): The vertical distance travelled, in
-            pixels, by the second wave of Graphics to move on-screen.
         next_state (StateIDs): An enum value for the State to load once
             the animation is finished. See the state_ids module for
             possible values. Setting this attribute to None will keep
@@ -594,6 +674,9 @@ class TransitionAnimation(object):
     def __init__(self, state, next_state=None):
         """Declare and initialize instance variables.
 
+        The intro is considered to be running from the start, although
+        it will only begin moving once reset() is called.
+
         Args:
             state (StageSelectState): The Stage Select State that this
                 object will animate.
@@ -605,69 +688,18 @@ class TransitionAnimation(object):
         """
         self.state = state
         self.is_running = True
-        self.group1_distance = 0.0
-        self.group2_distance = 0.0
         self.next_state = next_state
 
-    def update(self, time):
-        """Update the transition animation.
-
-        Args:
-            time (float): The number of seconds elapsed since the last
-                update cycle.
-        """
-        distance = TRANSITION_SLIDE_SPEED * time
-
-        if not self.distance_is_complete(self.group1_distance):
-            if self.state_will_change():
-                # Outro
-                selection_data = self.get_selection_data()
-                self.slide_graphics(self.state.thumbnails, distance)
-                self.slide_graphics(selection_data, -1 * distance)
-            else:
-                # Intro
-                self.slide_graphics(self.state.bg_lines, distance)
-            self.group1_distance += distance
-        elif not self.distance_is_complete(self.group2_distance):
-            if self.state_will_change():
-                # Outro
-                self.slide_graphics(self.state.bg_lines, distance)
-            else:
-                # Intro
-                selection_data = self.get_selection_data()
-                self.slide_graphics(self.state.thumbnails, distance)
-                self.slide_graphics(selection_data, -1 * distance)
-
-            self.group2_distance += distance
-        else:
-            self.is_running = False
-            if self.next_state is not None:
-                self.state.change_state(self.next_state)
-
-    def distance_is_complete(self, distance_counter):
-        """Return a Boolean indicating whether a certain group of
-        Graphics have travelled far enough along the screen to be in
-        their proper positions.
-
-        Args:
-            distance_counter (float): A counter keeping track of the
-                vertical distance travelled, in pixels, by a group
-                of Graphics moving at the same time.
-        """
-        return distance_counter >= float(SCREEN_SIZE[1])
-
     def state_will_change(self):
         """Return a Boolean indiacting whether the game will change
         States once the animation finishes.
         """
         return self.next_state is not None
+
     def slide_graphics(self, graphics, distance):
         """Move a group of Graphics some vertical distance across the
         screen.
 
-        The Graphics will be kept from moving past the top or bottom of
-        the screen, depending on whether they're moving up or down.
-
         Args:
             graphics (tuple of Graphic): A group of Graphics that will
                 all be moved the same distance.
@@ -679,6 +711,26 @@ class TransitionAnimation(object):
         for graphic in graphics:
             graphic.move(0, distance)
 
+    def slide_selection(self, distance):
+        """Slide the StageThumbnails down and the Graphics describing
+        the currently-selected Stage up.
+
+        Args:
+            distance (float): The distance, in pixels, that the
+                Graphics will travel vertically.
+        """
+        self.slide_graphics(self.state.thumbnails, distance)
+        self.slide_graphics(self.get_selection_data(), -1 * distance)
+
+    def slide_bg_lines(self, distance):
+        """Slide the BackgroundLines down.
+
+        Args:
+            distance (float): The distance, in pixels, that the lines
+                will travel vertically.
+        """
+        self.slide_graphics(self.state.bg_lines, distance)
+
     def get_selection_data(self):
         """Return a tuple containing all of the Graphics describing the
         currently-selected Stage, including the StagePreview along with
@@ -691,9 +743,19 @@ class TransitionAnimation(object):
         else:
             return (self.state.preview, self.state.no_stages_text)
 
+    def finish(self):
+        """End the animation and change States if one was specified."""
+        self.is_running = False
+        if self.next_state is not None:
+            self.state.change_state(self.next_state)
+
     def reset(self, next_state=None):
         """Prepare the animation and play it again.
 
+        During the intro, the BackgroundLines slide in first, followed
+        by the Stage selection Graphics. The outro runs in the reverse
+        order.
+
         Args:
             next_state (StateIDs): Optional. An enum value for the State
                 to load once the animation is finished. See the
@@ -701,11 +763,28 @@ class TransitionAnimation(object):
                 the default value of None will keep the StageSelectState
                 open after running the animation.
         """
-        self.group1_distance = 0.0
-        self.group2_distance = 0.0
         self.is_running = True
         self.next_state = next_state
 
+        if self.state_will_change():
+            first_wave = self.slide_selection
+            second_wave = self.slide_bg_lines
+        else:
+            first_wave = self.slide_bg_lines
+            second_wave = self.slide_selection
+
+        tweens = self.state.get_tween_scheduler()
+        wave_distance = SCREEN_SIZE[1]
+        wave_duration = frames_for_distance(wave_distance,
+                                            TRANSITION_SLIDE_SPEED)
+        tweens.start(0, wave_distance, wave_duration,
+                     on_update=lambda y, change: first_wave(change),
+                     owner=self.state)
+        tweens.start(0, wave_distance, wave_duration,
+                     on_update=lambda y, change: second_wave(change),
+                     on_complete=self.finish, delay=wave_duration,
+                     owner=self.state)
+
 
 class StageThumbnail(Graphic):
     """A small icon for a Stage that can be selected by the players.
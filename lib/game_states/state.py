@@ -1,5 +1,6 @@
 from pygame.surface import Surface
 from customize.globals import SCREEN_SIZE
+from lib.graphics import StaticLayer, DynamicLayer
 from lib.custom_data.character_data import *
 from exceptions import NotImplementedError
 from __builtin__ import False
@@ -33,6 +34,15 @@ class State(object):
             to obtain drawing-friendly coordinates.
         is_accepting_input: A Boolean indicating whether this State is
             currently responding to player input.
+        brightness: An integer from 0 to 255 for how brightly
+            state_surface is shown on the screen. 255 shows it as-is,
+            while 0 shows it completely black.
+        layers: A list of StaticLayers and DynamicLayers that will be
+            drawn onto state_surface in order from bottom to top by
+            draw_layers().
+        render_scale: An integer for the magnification rate that
+            state_surface is drawn at. This is 1 unless the State has
+            called enable_render_scale().
     """
     def __init__(self, state_manager, state_pass):
         """Declare and initialize instance variables.
@@ -45,9 +55,21 @@ class State(object):
         self.state_pass = state_pass
         self.state_manager = state_manager
         self.state_surface = Surface(SCREEN_SIZE).convert()
-        self.state_surface.set_alpha(255)
         self.exact_offset = (0.0, 0.0)
         self.is_accepting_input = True
+        self.brightness = 255
+        self.layers = []
+        self.render_scale = 1
+
+    def start_state(self):
+        """Begin the State's timed processes, such as its intro
+        animation.
+
+        This is called once the State has finished loading and is
+        pushed onto the State stack, so that transitions don't start
+        running while the State is still being prepared.
+        """
+        pass
 
     def load_state(self):
         """Use the information passed on from the parameters to set up
@@ -145,6 +167,49 @@ class State(object):
         """
         raise NotImplementedError
 
+    def enable_render_scale(self):
+        """Have this State draw straight onto a window-sized Surface,
+        if the game is set to pre-scale its images.
+
+        Afterwards, all of the State's images must be loaded through
+        the AssetManager (see get_asset_manager()), so that they are
+        magnified by render_scale. Graphics are still positioned at
+        the game's native resolution, and scale themselves as they are
+        drawn.
+        Call this at the start of the State's init(), before any layers
+        are added.
+        """
+        self.render_scale = self.get_asset_manager().render_scale
+        if self.render_scale != 1:
+            self.state_surface = Surface(
+                (SCREEN_SIZE[0] * self.render_scale,
+                 SCREEN_SIZE[1] * self.render_scale)).convert()
+
+    def get_asset_manager(self):
+        """Return the AssetManager that loads and pre-scales images for
+        States that draw at the window's scale.
+        """
+        return self.state_manager.assets
+
+    def get_tween_scheduler(self):
+        """Return the TweenScheduler that runs all of the game's
+        transitions and timed animations.
+        """
+        return self.state_manager.tweens
+
+    def is_animating(self):
+        """Return a Boolean indicating whether this State is running a
+        transition, fade, or any other timed process that requires the
+        game to keep updating at the full frame rate.
+
+        Looped animations, such as animated backgrounds and flashing
+        prompts, count as well, since they would slow to a crawl once
+        the game went idle. States that don't override this method are
+        always considered to be animating, which keeps the game from
+        going idle while they are active.
+        """
+        return True
+
     def screen_offset(self):
         """Convert exact_offset into a tuple of integers and return
         it.
@@ -152,6 +217,51 @@ class State(object):
         offset = (int(self.exact_offset[0]), int(self.exact_offset[1]))
         return offset
 
+    def add_static_layer(self, render, is_transparent=False):
+        """Add a StaticLayer on top of this State's other layers and
+        return it.
+
+        Args:
+            render: A function that draws all of the layer's graphics
+                onto the Surface passed as its only argument. It will
+                only be called again once the layer is invalidated.
+            is_transparent: Optional. Set to True if blank parts of the
+                layer should show the layers beneath it.
+        """
+        new_layer = StaticLayer(self.state_surface.get_size(), render,
+                                is_transparent)
+        self.layers.append(new_layer)
+        return new_layer
+
+    def add_dynamic_layer(self, render):
+        """Add a DynamicLayer on top of this State's other layers and
+        return it.
+
+        Args:
+            render: A function that draws all of the layer's graphics
+                onto the Surface passed as its only argument. It will
+                be called every time the layers are drawn.
+        """
+        new_layer = DynamicLayer(render)
+        self.layers.append(new_layer)
+        return new_layer
+
+    def invalidate_static_layers(self):
+        """Have all of this State's StaticLayers render their graphics
+        again the next time they are drawn.
+
+        Call this whenever something shown on a StaticLayer changes.
+        """
+        for layer in self.layers:
+            layer.invalidate()
+
+    def draw_layers(self):
+        """Draw all of this State's layers onto the State Surface, in
+        order from bottom to top.
+        """
+        for layer in self.layers:
+            layer.draw(self.state_surface)
+
     def draw_state(self):
         """Draw all graphics within the State onto the screen."""
         raise NotImplementedError
@@ -10,7 +10,9 @@ from pygame.color import Color
 from customize.globals import SCREEN_SIZE
 from customize.globals import FRAME_RATE
 from customize.title import *
-from lib.graphics import Graphic, Animation, render_text
+from lib.graphics import (Graphic, Animation, SpriteGroup, render_text,
+                          convert_to_colorkey_alpha)
+from lib.tween import frames_for_distance, frames_for_seconds
 from lib.game_states.state import *
 from lib.game_states.state_ids import StateIDs
 from lib.game_states.state_fader import StateFader
@@ -52,53 +54,62 @@ class TitleState(State):
                 onto other States.
         """
         super(TitleState, self).__init__(state_manager, state_pass)
+        self.enable_render_scale()
+        assets = self.get_asset_manager()
         self.background = Animation.from_file(BG_PATH, (0, 0),
-            BG_FRAMES, BG_DURATION)
+            BG_FRAMES, BG_DURATION, assets=assets)
         self.logo = Animation.from_file(LOGO_PATH,
                               (LOGO_X, LOGO_Y),
-                              LOGO_FRAMES, LOGO_DURATION)
-        self.intro_animator = IntroAnimator()
+                              LOGO_FRAMES, LOGO_DURATION, assets=assets)
+        # The intro fades in the logo, which only works on images without
+        # per-pixel alpha. This also gives it its own copy of the image.
+        self.logo.image = convert_to_colorkey_alpha(self.logo.image)
+        self.intro_animator = IntroAnimator(self)
         self.intro_animator.reset(self.background, self.logo)
-        self.fader = StateFader(self.change_state)
+        self.fader = StateFader(self)
 
         confirm = Sound(SFX_CONFIRM_PATH)
         cancel = Sound(SFX_CANCEL_PATH)
         scroll = Sound(SFX_SCROLL_PATH)
         slide = Sound(SFX_SLIDE_PATH)
         ui_channel = self.state_pass.ui_channel
-        prompt = PressStartPrompt(ui_channel, confirm, cancel, scroll,
-                                  slide)
-        main_options = MainOptionList(ui_channel, confirm, cancel,
-                                      scroll, slide)
-        battle_setup = BattleSetupList(ui_channel, confirm, cancel,
-                                       scroll, slide)
+        prompt = PressStartPrompt(self, ui_channel, confirm, cancel,
+                                  scroll, slide, assets)
+        main_options = MainOptionList(self, ui_channel, confirm, cancel,
+                                      scroll, slide, assets)
+        battle_setup = BattleSetupList(self, ui_channel, confirm, cancel,
+                                       scroll, slide, assets)
 
         self.option_lists = [prompt, main_options, battle_setup]
         self.current_options = TitleOptionList.PRESS_START
         for option_list in self.option_lists:
             option_list.reset()
 
+    def start_state(self):
+        """Start playing the introductory animation."""
+        self.intro_animator.play(self.background, self.logo,
+                                 self.state_pass.announcer_channel)
+
     def update_state(self, time):
         """Update all processes within this State.
 
+        The intro and fades are run by the TweenScheduler, so the
+        OptionLists are only updated while neither is running.
+
         Args:
             time: An float for the time elapsed, in seconds, since the
                 last update cycle.
         """
-        if self.intro_animator.is_running:
-            self.intro_animator.update(time, self.background, self.logo,
-                                       self.state_pass.announcer_channel)
-        elif self.fader.is_running:
-            self.fader.update(time, self.state_surface)
-        else:
+        if not (self.intro_animator.is_running or self.fader.is_running):
             updated_options = self.option_lists[self.current_options]
 
-            updated_options.update(time)
-            if updated_options.next_state is not None:
-                self.determine_state_change(updated_options.next_state)
-                updated_options.next_state = None
-            elif updated_options.is_offscreen():
+            if updated_options.is_offscreen():
                 self.change_options()
+            else:
+                updated_options.update(time)
+                if updated_options.next_state is not None:
+                    self.determine_state_change(updated_options.next_state)
+                    updated_options.next_state = None
 
         self.draw_state()
 
@@ -162,6 +173,8 @@ class TitleState(State):
         elif self.current_options == TitleOptionList.MAIN_OPTIONS:
             self.current_options = TitleOptionList.BATTLE_SETUP
 
+        self.option_lists[self.current_options].reset()
+
     def determine_state_change(self, state_id):
         """Determine which State to run next and switch game processing to it.
 
@@ -192,28 +205,36 @@ class IntroAnimator(object):
     introductory animation.
 
     Attributes:
+        state: The TitleState that owns the animation's Tweens, so that
+            they are cancelled if it is removed.
+        tweens: The TweenScheduler that runs the animation.
+        active_tweens: A list of the Tweens that the animation has
+            started.
         is_running: A Boolean indicating whether the animation is
             currently being shown.
         voice: A PyGame Sound with the announcer stating the game's
             title.
-        voice_timer: An integer counter that keeps track of how many
-            update cycles have passed since the voice clip started
-            playing.
         voice_has_played: A Boolean indicating whether the voice clip
             has already played.
         voice_duration: An integer for the duration of the voice clip,
             in update cycles.
     """
-    def __init__(self):
-        """Declare and initialize instance variables."""
+    def __init__(self, state):
+        """Declare and initialize instance variables.
+
+        Args:
+            state: The TitleState showing the animation.
+        """
+        self.state = state
+        self.tweens = state.get_tween_scheduler()
+        self.active_tweens = []
         self.is_running = False
         self.voice = Sound(VOICE_PATH)
-        self.voice_duration = (self.voice.get_length() * FRAME_RATE)
-        self.voice_timer = 0
+        self.voice_duration = frames_for_seconds(self.voice.get_length())
         self.voice_has_played = False
 
-    def update(self, time, bg, logo, sound_channel):
-        """Update the animation's processes.
+    def play(self, bg, logo, sound_channel):
+        """Start the animation.
 
         The animation will proceed as follows:
             1. Scroll the background up from the bottom edge until it
@@ -223,56 +244,64 @@ class IntroAnimator(object):
             4. Once the voice clip finishes, play the title theme and
                activate the logo's animation.
 
+        reset() must be called before this method.
+
         Args:
-            time: A float for the time elapsed, in seconds, since the
-                last update cycle.
             bg: The Title Screen's background Animation.
             logo: The game logo Animation.
             sound_channel: The PyGame Channel that will be used to
                 play the announcer's voice.
         """
-        if bg.exact_pos[1] > 0.0:
-            self.move_background_up(bg, time)
-        elif logo.image.get_alpha() < 255:
-            self.fade_in_logo(logo)
+        scroll_distance = bg.exact_pos[1]
+        self.active_tweens.append(self.tweens.start(scroll_distance, 0.0,
+            frames_for_distance(scroll_distance, BG_SCROLL_SPEED),
+            on_update=lambda y, change: bg.move(0, change),
+            on_complete=lambda: self.fade_in_logo(logo, sound_channel),
+            owner=self.state))
 
-        if (logo.image.get_alpha() >= FADE_DELAY
-                and (not self.voice_has_played)):
-            sound_channel.play(self.voice)
-            self.voice_has_played = True
-        elif (self.voice_has_played and
-              self.voice_timer < self.voice_duration):
-            self.voice_timer += 1
-        elif self.voice_timer >= self.voice_duration:
-            pygame.mixer.music.play(-1)
-            logo.is_animated = True
-            self.is_running = False
+    def fade_in_logo(self, logo, sound_channel):
+        """Gradually increase the opacity of the game logo, playing the
+        voice clip once it starts to show.
+
+        Args:
+            logo: The game logo Animation.
+            sound_channel: The PyGame Channel that will be used to
+                play the announcer's voice.
+        """
+        def set_logo_alpha(alpha, change):
+            logo.image.set_alpha(int(alpha))
+            if alpha >= FADE_DELAY and not self.voice_has_played:
+                self.play_voice(logo, sound_channel)
 
-    def move_background_up(self, bg, time):
-        """Move the background up at a set speed.
+        fade_speed = FADE_LOGO_RATE * FRAME_RATE
+        self.active_tweens.append(self.tweens.start(0, 255,
+            frames_for_distance(255, fade_speed), on_update=set_logo_alpha,
+            owner=self.state))
 
-        The background will not move past the top edge of the screen.
+    def play_voice(self, logo, sound_channel):
+        """Play the voice clip, and finish the animation once it ends.
 
         Args:
-            bg: The Title Screen's background Animation.
-            time: A float for the amount of time, in seconds, elapsed
-                since the last update cycle.
+            logo: The game logo Animation.
+            sound_channel: The PyGame Channel that will be used to
+                play the announcer's voice.
         """
-        distance = -1 * BG_SCROLL_SPEED * time
-        bg.move(0, distance)
+        sound_channel.play(self.voice)
+        self.voice_has_played = True
+        self.active_tweens.append(self.tweens.start_timer(
+            self.voice_duration, lambda: self.finish(logo),
+            owner=self.state))
 
-        if bg.exact_pos[1] < 0.0:
-            distance = 0.0 - bg.exact_pos[1]
-            bg.move(0, distance)
-
-    def fade_in_logo(self, logo):
-        """Gradually increase the opacity of the game logo.
+    def finish(self, logo):
+        """Play the title theme and start animating the logo.
 
         Args:
             logo: The game logo Animation.
         """
-        old_alpha = logo.image.get_alpha()
-        logo.image.set_alpha(old_alpha + FADE_LOGO_RATE)
+        pygame.mixer.music.play(-1)
+        logo.is_animated = True
+        self.is_running = False
+        self.active_tweens = []
 
     def skip_intro(self, bg, logo, sound_channel):
         """Skip to the end of animation immediately.
@@ -283,19 +312,22 @@ class IntroAnimator(object):
             sound_channel: The PyGame Channel that will be used to
                 play the announcer's voice.
         """
+        for tween in self.active_tweens:
+            tween.cancel()
+        self.active_tweens = []
+
         if not self.voice_has_played:
             sound_channel.play(self.voice)
+            self.voice_has_played = True
 
         bg.move(0, -1 * bg.rect[1])
-        pygame.mixer.music.play(-1)
         logo.image.set_alpha(255)
-        logo.is_animated = True
-        self.is_running = False
+        self.finish(logo)
 
     def reset(self, bg, logo):
         """Prepare the animation to be shown.
 
-        This method must be called before the first call to update()
+        This method must be called before the first call to play()
         to ensure that all components are ready for use.
         If not, bad things will happen... (maybe)
 
@@ -305,7 +337,6 @@ class IntroAnimator(object):
         """
         pygame.mixer.stop()
         pygame.mixer.music.load(MUSIC_PATH)
-        self.voice_timer = 0
         self.voice_has_played = False
         bg.exact_pos = (0.0, SCREEN_SIZE[1] + BG_OFFSET)
         logo.is_animated = False
@@ -322,6 +353,12 @@ class OptionList(object):
     unique Options as well as ways of responding to them.
 
     Attributes:
+        state: The TitleState that owns the OptionList's Tweens, so that
+            they are cancelled if it is removed.
+        tweens: The TweenScheduler that runs the slide in and slide out
+            animations.
+        slide_tween: The Tween running the current slide, or None if
+            the Options have not slid yet.
         options: A list of Options.
         option_index: The index of the Option currently being
             highlighted by the players.
@@ -346,12 +383,18 @@ class OptionList(object):
         next_state: The index of the next Game State will be run. Refer
             to the StateIDs enum for possible choices. A value of None
             means that processing should remain in the Title State.
+        sprite_group: A SpriteGroup that batches the drawing of all
+            visible Options.
+        assets: The AssetManager used for loading and pre-scaling the
+            Options' images. If this is None, they will be kept at
+            native resolution.
     """
-    def __init__(self, x, y, channel, sfx_confirm, sfx_cancel,
-                 sfx_scroll, sfx_slide):
+    def __init__(self, state, x, y, channel, sfx_confirm, sfx_cancel,
+                 sfx_scroll, sfx_slide, assets=None):
         """Declare and initialize instance variables.
 
         Args:
+            state: The TitleState showing the OptionList.
             x: An integer for the x-position of the first Option,
                 relative to the screen.
             y: An integer for the y-position of the first Option,
@@ -361,7 +404,13 @@ class OptionList(object):
             sfx_confirm: A PyGame Sound for confirming an option.
             sfx_cancel: A PyGame Sound for cancelling a decision.
             sfx_scroll: A PyGame Sound for scrolling through the list.
+            assets: Optional. The AssetManager that will load and
+                pre-scale the Options' images.
         """
+        self.state = state
+        self.tweens = state.get_tween_scheduler()
+        self.slide_tween = None
+        self.assets = assets
         self.x = x
         self.y = y
         self.sound_channel = channel
@@ -373,6 +422,7 @@ class OptionList(object):
         self.confirm_timer = -1
         self.animation = ListAnimation.NONE
         self.next_state = None
+        self.sprite_group = SpriteGroup()
         self.options = []
         self.create_options()
         self.highlight_option(0)
@@ -397,25 +447,25 @@ class OptionList(object):
         if the confirmation timer is set to a value higher than -1.
         Once it has flashed long enough, the operation described by
         the selected Option will be performed.
-        In other cases, an animation will be shown based on the value
+        In other cases, an animation will be started based on the value
         of the animation variable.
 
         Args:
             time: A float for the amount of time elapsed, in seconds,
                 since the last update cycle.
         """
-        if self.is_offscreen():
-            self.animation = ListAnimation.SHOW
-
         if self.confirm_timer > -1:
             self.flash_confirmed_option()
             if self.confirm_timer >= CONFIRM_DURATION:
                 self.confirm_timer = -1     # End the flash.
                 self.respond_to_confirm()
+        elif self.is_sliding():
+            return
         elif self.animation == ListAnimation.SHOW:
-            self.show_all(time)
-        elif self.animation == ListAnimation.HIDE:
-            self.hide_all(time)
+            self.show_all()
+        elif (self.animation == ListAnimation.HIDE and
+              not self.is_offscreen()):
+            self.hide_all()
 
     def draw(self, parent_surf):
         """Draw all of the Options in this list onto a Surface.
@@ -429,7 +479,8 @@ class OptionList(object):
         """
         for option in self.options:
             if option.is_visible:
-                option.draw(parent_surf)
+                option.queue_draw(self.sprite_group)
+        self.sprite_group.draw(parent_surf)
 
     def reset(self):
         """Prepare this OptionList to be shown again."""
@@ -457,60 +508,80 @@ class OptionList(object):
             for i in xrange(1, len(self.options), 2):
                 self.options[i].reposition(x=(SCREEN_SIZE[0] + biggest_width))
 
-    def show_all(self, time):
+    def show_all(self):
         """Animate the OptionList revealing itself on-screen.
 
         The animation consists of sliding the Options in from either
         edge of the screen. The direction of the slide alternates
         between Options. (e.g. The first Option slides in from the left
         while the second Option comes from the right.)
-
-        Args:
-            time: A float for the time elapsed, in seconds, since the
-                last update cycle.
         """
         if self.options[0].rect.x == self.x:
             self.prepare_to_show_all()
-        else:
-            distance = int(TEXT_SLIDE_SPEED * time)
-
-            for i in xrange(0, len(self.options), 2):
-                self.options[i].move(distance)
-                # Prevent the Option from sliding past its final position.
-                if self.options[i].rect.x > self.x:
-                    self.options[i].reposition(x=self.x)
-            if len(self.options) > 1:
-                for i in xrange(1, len(self.options), 2):
-                    self.options[i].move(distance * -1)
-                    if self.options[i].rect.x < self.x:
-                        self.options[i].reposition(x=self.x)
-
-            if self.options[0].rect.x >= self.x:
-                self.animation = ListAnimation.NONE
-
-    def hide_all(self, time):
-        """Hide this OptionList on-screen and then send processing over
-        to the next queued OptionList.
+
+        self.slide_options([self.x] * len(self.options),
+                           self.finish_showing)
+
+    def finish_showing(self):
+        """End the 'show all' animation."""
+        self.animation = ListAnimation.NONE
+
+    def hide_all(self):
+        """Hide this OptionList on-screen. Once it is hidden, the Title
+        State will send processing over to the next queued OptionList.
 
         The animation consists of sliding the Options out to either
         edge of the screen. The direction of the slide alternates
         between Options. (e.g. The first Option slides out to the left
         while the second Option goes over to the right.)
-
-        Args:
-            time: A float for the time elapsed, in seconds, since the
-                last update cycle.
         """
-        if self.options[0].rect.x == self.x:
-            self.sound_channel.play(self.sfx_slide)
+        self.sound_channel.play(self.sfx_slide)
 
-        distance = TEXT_SLIDE_SPEED * time
+        end_positions = []
+        for i in xrange(0, len(self.options)):
+            if i % 2 == 0:
+                end_positions.append(0 - self.options[i].rect.width)
+            else:
+                end_positions.append(SCREEN_SIZE[0])
 
-        for i in xrange(0, len(self.options), 2):
-            self.options[i].move(distance * -1)
-        if len(self.options) > 1:
-            for i in xrange(1, len(self.options), 2):
-                self.options[i].move(distance)
+        self.slide_options(end_positions)
+
+    def slide_options(self, end_positions, on_complete=None):
+        """Slide all of the Options horizontally at the same speed,
+        stopping each one once it reaches its end position.
+
+        Args:
+            end_positions: A list of integers for the final
+                x-positions of each Option, in the same order as
+                options.
+            on_complete: Optional. A function with no arguments that
+                will be called once every Option has stopped.
+        """
+        start_positions = [option.exact_pos[0] for option in self.options]
+        longest_distance = max([abs(end - start) for start, end in
+                                zip(start_positions, end_positions)])
+
+        def move_options(distance, change):
+            for i in xrange(0, len(self.options)):
+                start = start_positions[i]
+                end = end_positions[i]
+                if end >= start:
+                    new_x = min(start + distance, end)
+                else:
+                    new_x = max(start - distance, end)
+                self.options[i].reposition(x=int(new_x))
+
+        self.slide_tween = self.tweens.start(0.0, longest_distance,
+            frames_for_distance(longest_distance, TEXT_SLIDE_SPEED),
+            on_update=move_options, on_complete=on_complete,
+            owner=self.state)
+
+    def is_sliding(self):
+        """Return a Boolean indicating whether the Options are in the
+        middle of sliding in or out.
+        """
+        return (self.slide_tween is not None and
+                not self.slide_tween.is_finished)
 
     def is_animating(self):
         """Determine whether this OptionList is currently performing an
@@ -614,23 +685,28 @@ class PressStartPrompt(OptionList):
             prompt's visibility was toggled. Setting it to -1 or less
             will stop the idle flashing.
     """
-    def __init__(self, channel, sfx_confirm, sfx_cancel, sfx_scroll,
-                 sfx_slide):
+    def __init__(self, state, channel, sfx_confirm, sfx_cancel,
+                 sfx_scroll, sfx_slide, assets=None):
         """Declare and initialize instance variables.
 
         Args:
+            state: The TitleState showing the prompt.
             sfx_confirm: A PyGame Sound for confirming an option.
             sfx_cancel: A PyGame Sound for cancelling a decision.
             sfx_scroll: A PyGame Sound for scrolling through the list.
+            assets: Optional. The AssetManager that will load and
+                pre-scale the Options' images.
         """
-        super(PressStartPrompt, self).__init__(START_X, START_Y, channel,
-                                               sfx_confirm, sfx_cancel,
-                                               sfx_scroll, sfx_slide)
+        super(PressStartPrompt, self).__init__(state, START_X, START_Y,
+                                               channel, sfx_confirm,
+                                               sfx_cancel, sfx_scroll,
+                                               sfx_slide, assets)
         self.idle_flash_timer = 0
 
     def create_options(self):
         """Create the prompt."""
-        self.options.append(Option(START_PROMPT_TEXT, self.x, self.y))
+        self.options.append(Option(START_PROMPT_TEXT, self.x, self.y,
+                                   self.assets))
 
     def update(self, time):
         """Update the processes within this prompt.
@@ -692,19 +768,23 @@ class MainOptionList(OptionList):
         state_pass: The StatePass object containing data that will be
             transferred between all Game States.
     """
-    def __init__(self, channel, sfx_confirm, sfx_cancel, sfx_scroll,
-                 sfx_slide):
+    def __init__(self, state, channel, sfx_confirm, sfx_cancel,
+                 sfx_scroll, sfx_slide, assets=None):
         """Declare and initialize instance variables.
 
         Args:
+            state: The TitleState showing the list.
             sfx_confirm: A PyGame Sound for confirming an option.
             sfx_cancel: A PyGame Sound for cancelling a decision.
             sfx_scroll: A PyGame Sound for scrolling through the list.
+            assets: Optional. The AssetManager that will load and
+                pre-scale the Options' images.
         """
-        super(MainOptionList, self).__init__(MAIN_OPTIONS_X, MAIN_OPTIONS_Y,
+        super(MainOptionList, self).__init__(state,
+                                             MAIN_OPTIONS_X, MAIN_OPTIONS_Y,
                                              channel, sfx_confirm,
                                              sfx_cancel, sfx_scroll,
-                                             sfx_slide)
+                                             sfx_slide, assets)
         self.animation = ListAnimation.SHOW
 
     def create_options(self):
@@ -713,7 +793,7 @@ class MainOptionList(OptionList):
         y = self.y
 
         for i in xrange(0, len(names)):
-            self.options.append(Option(names[i], self.x, y))
+            self.options.append(Option(names[i], self.x, y, self.assets))
             y += self.options[i].rect.height + OPTION_DISTANCE
 
     def handle_input(self, input_name):
@@ -789,18 +869,22 @@ class BattleSetupList(OptionList):
         state_pass: The StatePass object containing data that will be
             passed between all Game States.
     """
-    def __init__(self, channel, sfx_confirm, sfx_cancel, sfx_scroll,
-                 sfx_slide):
+    def __init__(self, state, channel, sfx_confirm, sfx_cancel,
+                 sfx_scroll, sfx_slide, assets=None):
         """Declare and initialize instance variables.
 
         Args:
+            state: The TitleState showing the list.
             sfx_confirm: A PyGame Sound for confirming an option.
             sfx_cancel: A PyGame Sound for cancelling a decision.
             sfx_scroll: A PyGame Sound for scrolling through the list.
+            assets: Optional. The AssetManager that will load and
+                pre-scale the Options' images.
         """
-        super(BattleSetupList, self).__init__(BATTLE_X, BATTLE_Y, channel,
+        super(BattleSetupList, self).__init__(state, BATTLE_X, BATTLE_Y,
+                                              channel,
                                               sfx_confirm, sfx_cancel,
-                                              sfx_scroll, sfx_slide)
+                                              sfx_scroll, sfx_slide, assets)
         self.sfx_slide = self.sfx_cancel
         self.animation = ListAnimation.SHOW
 
@@ -813,12 +897,13 @@ class BattleSetupList(OptionList):
 
         for setting in BattleSetupOption.get_all_option_data()[:-1]:
             new_setting = BattleSetting(setting.name, self.x, y,
+                                        self.assets,
                                         *setting.possible_values)
             y += new_setting.rect.height + OPTION_DISTANCE
             battle_settings.append(new_setting)
 
         confirm_name = BattleSetupOption.get_all_option_data()[-1].name
-        confirm_option = Option(confirm_name, self.x, y)
+        confirm_option = Option(confirm_name, self.x, y, self.assets)
         battle_settings.append(confirm_option)
 
         self.options.extend(battle_settings)
@@ -902,8 +987,11 @@ class Option(Graphic):
             written on the screen.
         is_visible: A Boolean indicating whether the text will be
             drawn onto its parent Surface.
+        assets: The AssetManager used for pre-scaling the rendered
+            text. If this is None, it will be kept at native
+            resolution.
     """
-    def __init__(self, text, x, y):
+    def __init__(self, text, x, y, assets=None):
         """Declare and initialize instance variables.
 
         Args:
@@ -912,20 +1000,41 @@ class Option(Graphic):
                 relative to the screen.
             y: An integer value for the Option text's y-coordinate
                 relative to the screen.
+            assets: Optional. The AssetManager that will pre-scale the
+                rendered text.
         """
         self.font = Font(OPTION_FONT_PATH, OPTION_FONT_SIZE)
-        image = render_text(self.font, text, OPTION_NORMAL_COLOR)
-        super(Option, self).__init__(image, (x, y))
+        self.assets = assets
+        image = self.render(text, OPTION_NORMAL_COLOR)
+        if assets is None:
+            super(Option, self).__init__(image, (x, y))
+        else:
+            super(Option, self).__init__(image, (x, y), assets.render_scale)
         self.text = text
         self.is_visible = True
 
+    def render(self, text, text_color):
+        """Return a Surface with some text rendered in the Option's
+        font, pre-scaled if the Option has an AssetManager.
+
+        Args:
+            text: The String that will be rendered.
+            text_color: A tuple of integers for the RGB color of the
+                text.
+        """
+        text_surf = render_text(self.font, text, text_color)
+        if self.assets is None:
+            return text_surf
+        else:
+            return self.assets.prescale(text_surf)
+
     def highlight(self):
         """Redraw the text with an alternate color."""
-        self.image = render_text(self.font, self.text, OPTION_HIGHLIGHT_COLOR)
+        self.image = self.render(self.text, OPTION_HIGHLIGHT_COLOR)
 
     def unhighlight(self):
         """Redraw the text with normal coloration."""
-        self.image = render_text(self.font, self.text, OPTION_NORMAL_COLOR)
+        self.image = self.render(self.text, OPTION_NORMAL_COLOR)
 
 
 class BattleSetting(Option):
@@ -946,7 +1055,7 @@ class BattleSetting(Option):
         scroll_right_arrow: A Graphic that displays the image of the
             'scroll values right' arrow.
     """
-    def __init__(self, text, x, y, *values):
+    def __init__(self, text, x, y, assets, *values):
         """Declare and initialize instance variables.
 
         Args:
@@ -955,22 +1064,25 @@ class BattleSetting(Option):
                 to the screen.
             y: The integer coordinate for the text's y-position relative
                 to the screen.
+            assets: The AssetManager that will load and pre-scale the
+                BattleSetting's images. Pass None to keep them at native
+                resolution.
             values: All of the integer values that can be set for this
                 BattleSetting.
         """
-        super(BattleSetting, self).__init__(text, x, y)
+        super(BattleSetting, self).__init__(text, x, y, assets)
         self.values = values
         self.value_index = 0
-        self.value_surf = render_text(self.font, str(self.values[0]),
+        self.value_surf = self.render(str(self.values[0]),
                                       OPTION_NORMAL_COLOR)
         value_x = self.rect.x + VALUE_DISTANCE
         self.scroll_left_arrow = Graphic.from_file(LEFT_ARROW_PATH,
             (value_x - ARROW_DISTANCE,
-             self.rect.y + ARROW_Y_OFFSET))
+             self.rect.y + ARROW_Y_OFFSET), assets)
         self.scroll_left_arrow.move(-1 * self.scroll_left_arrow.rect.width, 0)
         self.scroll_right_arrow = Graphic.from_file(LEFT_ARROW_PATH,
-            (value_x + self.value_surf.get_width() + ARROW_DISTANCE,
-            self.rect.y + ARROW_Y_OFFSET))
+            (value_x + self.get_value_width() + ARROW_DISTANCE,
+            self.rect.y + ARROW_Y_OFFSET), assets)
         self.scroll_right_arrow.flip(is_horizontal=True)
 
     def scroll_values_left(self, sound_channel, scroll_sound):
@@ -983,7 +1095,7 @@ class BattleSetting(Option):
         """
         if self.value_index > 0:
             self.value_index -= 1
-            self.value_surf = render_text(self.font,
+            self.value_surf = self.render(
                 str(self.values[self.value_index]), OPTION_HIGHLIGHT_COLOR)
             sound_channel.play(scroll_sound)
 
@@ -997,26 +1109,32 @@ class BattleSetting(Option):
         """
         if self.value_index < len(self.values) - 1:
             self.value_index += 1
-            self.value_surf = render_text(self.font,
+            self.value_surf = self.render(
                 str(self.values[self.value_index]), OPTION_HIGHLIGHT_COLOR)
             sound_channel.play(scroll_sound)
 
     def highlight(self):
         """Redraw the text with an alternate color."""
         super(BattleSetting, self).highlight()
-        self.value_surf = render_text(self.font,
-            str(self.values[self.value_index]), OPTION_HIGHLIGHT_COLOR)
+        self.value_surf = self.render(str(self.values[self.value_index]),
+                                      OPTION_HIGHLIGHT_COLOR)
 
     def unhighlight(self):
         """Redraw the text with normal coloration."""
         super(BattleSetting, self).unhighlight()
-        self.value_surf = render_text(self.font,
-            str(self.values[self.value_index]), OPTION_NORMAL_COLOR)
+        self.value_surf = self.render(str(self.values[self.value_index]),
+                                      OPTION_NORMAL_COLOR)
 
     def get_value(self):
         """Return the selected value."""
         return self.values[self.value_index]
 
+    def get_value_width(self):
+        """Return an integer for the width of the selected value's text
+        at the game's native resolution.
+        """
+        return self.value_surf.get_width() / self.scale
+
     def draw(self, parent_surf):
         """Draw the text onto a Surface.
 
@@ -1024,33 +1142,50 @@ class BattleSetting(Option):
             parent_surf: The Surface upon which the BattleSetting text
                 will be drawn.
         """
-        super(BattleSetting, self).draw(parent_surf)
-        parent_surf.blit(self.value_surf, (self.rect.x + VALUE_DISTANCE,
-                                           self.rect.y))
-        self.draw_scroll_arrows(parent_surf)
+        sprite_group = SpriteGroup()
+        self.queue_draw(sprite_group)
+        sprite_group.draw(parent_surf)
+
+    def queue_draw(self, sprite_group, z=0):
+        """Add the text and scroll arrows to a SpriteGroup.
+
+        Args:
+            sprite_group: The SpriteGroup that will draw this
+                BattleSetting.
+            z: Optional. An integer for the BattleSetting's drawing
+                order within the group. Higher values are drawn on top.
+        """
+        super(BattleSetting, self).queue_draw(sprite_group, z=z)
+        sprite_group.add(self.value_surf,
+                         ((self.rect.x + VALUE_DISTANCE) * self.scale,
+                          self.rect.y * self.scale), None, z)
+        self.queue_scroll_arrows(sprite_group, z)
 
-    def draw_scroll_arrows(self, parent_surf):
-        """Draw the scroll value arrows onto a Surface.
+    def queue_scroll_arrows(self, sprite_group, z=0):
+        """Add the scroll value arrows to a SpriteGroup.
 
         The left arrow will only be shown if there are values preceding
         the one that is selected. Likewise, the right arrow will only
         be shown if there are subsequent values.
 
         Args:
-            parent_surf: The Surface upon which the arrows will be
-                drawn.
+            sprite_group: The SpriteGroup that will draw the arrows.
+            z: Optional. An integer for the arrows' drawing order
+                within the group.
         """
         value_x = self.rect.x + VALUE_DISTANCE
         left_arrow_x = (value_x - self.scroll_left_arrow.rect[2]
                         - ARROW_DISTANCE)
-        right_arrow_x = (value_x + self.value_surf.get_width()
+        right_arrow_x = (value_x + self.get_value_width()
                          + ARROW_DISTANCE)
         y = self.rect.y + ARROW_Y_OFFSET
 
         if self.value_index > 0:
-            self.scroll_left_arrow.draw(parent_surf, left_arrow_x, y)
+            self.scroll_left_arrow.queue_draw(sprite_group, left_arrow_x,
+                                              y, z=z)
         if self.value_index < len(self.values) - 1:
-            self.scroll_right_arrow.draw(parent_surf, right_arrow_x, y)
+            self.scroll_right_arrow.queue_draw(sprite_group, right_arrow_x,
+                                               y, z=z)
 
 
 # Enumerations
@@ -3,15 +3,185 @@ animations via the PyGame Surface and Image modules.
 
 It also contains module level methods to assist in loading and managing
 in-game images in other modules.
+
+All images should be loaded through import_image(), which converts
+them to the display's pixel format with the cheapest kind of
+transparency that they need.
+
+Module Constants:
+    OPAQUE (String): The name of the alpha type for images without any
+        transparent pixels.
+    COLORKEY (String): The name of the alpha type for images whose
+        pixels are either fully transparent or fully opaque. Their
+        transparent pixels are marked with a run-length encoded
+        colorkey, which makes them very fast to draw.
+    PER_PIXEL_ALPHA (String): The name of the alpha type for images
+        with partially-transparent pixels, such as anti-aliased edges.
 """
+import logging
+from collections import namedtuple
+from cStringIO import StringIO
 from __builtin__ import True, False
 from math import ceil
+import pygame.display
 from pygame.locals import *
 from pygame.surface import Surface
 from pygame import image
 from pygame import transform
 from pygame import color
+from pygame import mask
 from pygame import Rect
+from customize.globals import USE_PIXEL_CACHE
+from lib import profiler
+from lib import pixel_cache
+from lib.custom_data.content_pack import read_content
+from lib.frame_timeline import FrameTimeline
+
+
+OPAQUE = 'opaque'
+COLORKEY = 'colorkey'
+PER_PIXEL_ALPHA = 'per-pixel alpha'
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+
+# The format and size of every image loaded by import_image().
+ImportReport = namedtuple('ImportReport', ['filepath', 'alpha_type',
+                                           'byte_size'])
+_import_reports = {}
+
+
+def import_image(filepath, alpha_type=None):
+    """Load an image from file and return it as a Surface converted to
+    the display's pixel format.
+
+    If USE_PIXEL_CACHE is enabled, the decoded pixels are kept in the
+    pixel cache, so that later launches of the game can skip reading
+    and decompressing the source file.
+    The format and size of the image will be recorded, and can be
+    retrieved with get_import_reports().
+
+    Args:
+        filepath: A String for the file path to the image.
+        alpha_type: Optional. A String for the kind of transparency
+            that the Surface will use. See OPAQUE, COLORKEY, and
+            PER_PIXEL_ALPHA for the possible values. If this is None,
+            it will be detected from the image's pixels.
+    """
+    if USE_PIXEL_CACHE:
+        source_hash, contents = pixel_cache.get_source_hash(filepath)
+        cache_path = pixel_cache.get_cache_path(source_hash,
+                                                str(alpha_type))
+        cached = pixel_cache.load_pixels(cache_path, convert_to_alpha_type)
+    else:
+        contents = None
+        cached = None
+
+    if cached is None:
+        if contents is None:
+            contents = read_content(filepath)
+        # Decode the bytes that were already read for hashing, rather
+        # than reading the file a second time.
+        loaded_image = image.load(StringIO(contents), filepath)
+        if alpha_type is None:
+            alpha_type = detect_alpha_type(loaded_image)
+        converted_image = convert_to_alpha_type(loaded_image, alpha_type)
+
+        if USE_PIXEL_CACHE:
+            if alpha_type == PER_PIXEL_ALPHA:
+                pixel_format = 'RGBA'
+            else:
+                pixel_format = 'RGB'
+            pixel_cache.save_pixels(cache_path, converted_image, alpha_type,
+                                    pixel_format)
+    else:
+        converted_image, alpha_type = cached
+
+    byte_size = converted_image.get_pitch() * converted_image.get_height()
+    _import_reports[filepath] = ImportReport(filepath, alpha_type,
+                                             byte_size)
+    logger.debug('Imported %s as %s (%d bytes)', filepath, alpha_type,
+                 byte_size)
+
+    return converted_image
+
+
+def convert_to_alpha_type(surf, alpha_type):
+    """Return a copy of a Surface converted to the display's pixel
+    format with a certain kind of transparency.
+
+    Args:
+        surf: The Surface to convert.
+        alpha_type: A String for the kind of transparency to use. See
+            OPAQUE, COLORKEY, and PER_PIXEL_ALPHA for the possible
+            values.
+    """
+    if alpha_type == OPAQUE:
+        return surf.convert()
+    elif alpha_type == COLORKEY:
+        return convert_to_colorkey_alpha(surf)
+    else:
+        return surf.convert_alpha()
+
+
+def detect_alpha_type(surf):
+    """Return a String for the cheapest kind of transparency that can
+    show a Surface's pixels correctly. See OPAQUE, COLORKEY, and
+    PER_PIXEL_ALPHA for the possible values.
+
+    Images without an alpha channel are treated as colorkeyed if they
+    contain any magenta pixels, as those are drawn transparent by
+    convert_to_colorkey_alpha().
+
+    Args:
+        surf: A Surface freshly loaded from file.
+    """
+    if surf.get_flags() & SRCALPHA:
+        pixel_amount = surf.get_width() * surf.get_height()
+        visible_pixels = mask.from_surface(surf, 0).count()
+        opaque_pixels = mask.from_surface(surf, 254).count()
+
+        if opaque_pixels == pixel_amount:
+            return OPAQUE
+        elif opaque_pixels == visible_pixels:
+            return COLORKEY
+        else:
+            return PER_PIXEL_ALPHA
+    elif surf.get_colorkey() is not None:
+        return COLORKEY
+    elif mask.from_threshold(surf, color.Color('magenta'),
+                             (1, 1, 1, 255)).count() > 0:
+        return COLORKEY
+    else:
+        return OPAQUE
+
+
+def get_import_reports():
+    """Return a tuple of ImportReports for every image loaded so far
+    through import_image(), sorted by file path.
+    """
+    return tuple(sorted(_import_reports.values()))
+
+
+def is_display_format(surf):
+    """Return a Boolean indicating whether a Surface has been converted
+    to the display's pixel format, making it suitable for fast drawing.
+
+    If the display hasn't been created yet, this always returns True.
+
+    Args:
+        surf: The Surface to check.
+    """
+    display = pygame.display.get_surface()
+    if display is None:
+        return True
+    elif surf.get_flags() & SRCALPHA:
+        # convert_alpha() always produces 32-bit Surfaces.
+        return surf.get_bitsize() == 32
+    else:
+        return (surf.get_bitsize() == display.get_bitsize() and
+                surf.get_masks() == display.get_masks())
 
 
 def load_tuple_of_images(filepaths):
@@ -27,7 +197,7 @@ def load_tuple_of_images(filepaths):
     all_images = []
 
     for filepath in filepaths:
-        new_image = image.load(filepath).convert_alpha()
+        new_image = import_image(filepath)
         all_images.append(new_image)
 
     return tuple(all_images)
@@ -92,16 +262,54 @@ def convert_to_colorkey_alpha(surf, colorkey=color.Color('magenta')):
                         with a matching colour will be drawn
                         transparent as well.
         """
-        colorkeyed_surf = Surface(surf.get_size())
+        colorkeyed_surf = Surface(surf.get_size()).convert()
 
         colorkeyed_surf.fill(colorkey)
         colorkeyed_surf.blit(surf, (0, 0))
-        colorkeyed_surf.set_colorkey(colorkey)
-        colorkeyed_surf.convert()
+        colorkeyed_surf.set_colorkey(colorkey, RLEACCEL)
 
         return colorkeyed_surf
 
 
+def is_culled(parent_surf, x, y, width, height):
+    """Return a Boolean indicating whether a region that is about to
+    be drawn lies entirely outside of the parent Surface's clipping
+    area, meaning that drawing it would have no visible effect.
+
+    Culled regions are tallied by the profiler.
+
+    Args:
+        parent_surf: The Surface that the region would be drawn onto.
+        x: An integer for the region's x-position relative to the
+            parent Surface.
+        y: An integer for the region's y-position relative to the
+            parent Surface.
+        width: An integer for the width of the region, in pixels.
+        height: An integer for the height of the region, in pixels.
+    """
+    if parent_surf.get_clip().colliderect((x, y, width, height)):
+        return False
+    else:
+        profiler.count(profiler.CULLED_DRAWS)
+        return True
+
+
+def scale_rect(rect, scale):
+    """Return a Rect with the position and dimensions of a region
+    multiplied by a magnification rate.
+
+    This converts regions measured at the game's native resolution to
+    regions on a pre-scaled image or a window-sized Surface.
+
+    Args:
+        rect: A Rect or tuple of four integers for the region's
+            x-position, y-position, width, and height.
+        scale: An integer for the magnification rate.
+    """
+    return Rect(rect[0] * scale, rect[1] * scale,
+                rect[2] * scale, rect[3] * scale)
+
+
 def calculate_center_position(area_origin, area_size, obj_size):
     """Return an integer for the position of a graphical object such
     that the object is positioned at the horizontal or vertical center
@@ -162,8 +370,12 @@ class Graphic(object):
             rect        A PyGame Rect object that contains the
                         Graphic's on-screen coordinates as well as its
                         dimensions.
+            scale       The magnification rate that image has been
+                        pre-scaled by. exact_pos and rect are always
+                        measured at the game's native resolution; they
+                        are only multiplied by scale when drawing.
     """
-    def __init__(self, surf, position):
+    def __init__(self, surf, position, scale=1):
         """Declare and initialize instance variables.
 
         Keyword arguments:
@@ -172,16 +384,20 @@ class Graphic(object):
             position    Tuple containing the coordinates of the
                         top-left corner of the image relative to the
                         screen.
+            scale       Optional. The magnification rate that surf has
+                        already been pre-scaled by. The default of 1
+                        means that it is at native resolution.
         """
         self.image = surf
         self.exact_pos = position
-        width = self.image.get_width()
-        height = self.image.get_height()
+        self.scale = scale
+        width = self.image.get_width() / scale
+        height = self.image.get_height() / scale
         self.rect = Rect(int(self.exact_pos[0]), int(self.exact_pos[1]),
                          width, height)
 
     @classmethod
-    def from_file(self, filepath, position):
+    def from_file(self, filepath, position, assets=None):
         """Create a Graphic from an external image file.
 
         Keyword arguments:
@@ -190,10 +406,16 @@ class Graphic(object):
             position    Tuple containing the coordinates of the
                         top-left corner of the image relative to the
                         screen.
+            assets      Optional. An AssetManager that will load the
+                        image, pre-scaled to its render scale. If this
+                        is None, the image will be loaded at native
+                        resolution.
         """
-        external_image = image.load(filepath)
-        external_image = convert_to_colorkey_alpha(external_image)
-        return Graphic(external_image, position)
+        if assets is None:
+            return Graphic(import_image(filepath), position)
+        else:
+            return Graphic(assets.load_image(filepath), position,
+                           assets.render_scale)
 
     def get_right_edge(self):
         """Return the x-coordinate of the Graphic's right edge."""
@@ -220,6 +442,9 @@ class Graphic(object):
     def draw(self, surf, x=None, y=None, region=None):
         """Draw the Graphic onto a specified Surface.
 
+        Nothing will be drawn if the Graphic lies entirely outside of
+        the Surface's clipping area.
+
         Args:
             surf: The Surface where this Graphic will be drawn
                 to.
@@ -234,10 +459,56 @@ class Graphic(object):
                 this is None, all of the Graphic will be drawn.
         """
         if x is None or y is None:
-            surf.blit(self.image, self.rect, region)
+            x = self.rect.x
+            y = self.rect.y
+        if region is None:
+            width = self.rect.width
+            height = self.rect.height
         else:
+            width = region[2]
+            height = region[3]
+
+        if self.scale != 1:
+            x, y, width, height = scale_rect((x, y, width, height),
+                                             self.scale)
+            if region is not None:
+                region = scale_rect(region, self.scale)
+
+        assert is_display_format(self.image), ('Graphics must be converted '
+                                               'to the display format first.')
+        if not is_culled(surf, x, y, width, height):
             surf.blit(self.image, (x, y), region)
 
+    def queue_draw(self, sprite_group, x=None, y=None, region=None, z=0):
+        """Add the Graphic to a SpriteGroup, so that it will be drawn
+        along with the rest of the group's sprites.
+
+        Args:
+            sprite_group: The SpriteGroup that will draw this Graphic.
+            x: Optional. The x-position of the Graphic relative to the
+                parent Surface. If this is not given, the position
+                passed to init() will be used instead.
+            y: Optional. The y-position of the Graphic relative to the
+                parent Surface. If this is not given, the position
+                passed to init() will be used instead.
+            region: Optional. A Rect specifying the area of this
+                Graphic that will be drawn onto the parent Surface. If
+                this is None, all of the Graphic will be drawn.
+            z: Optional. An integer for the Graphic's drawing order
+                within the group. Higher values are drawn on top.
+        """
+        if x is None or y is None:
+            x = self.rect.x
+            y = self.rect.y
+
+        if self.scale != 1:
+            x = x * self.scale
+            y = y * self.scale
+            if region is not None:
+                region = scale_rect(region, self.scale)
+
+        sprite_group.add(self.image, (x, y), region, z)
+
     def move(self, dx=0, dy=0):
         """Move the Graphic some distance across the screen.
 
@@ -322,10 +593,15 @@ class Animation(Graphic):
         is_reversed         Set to True if the Animation should cycle
                             through its frames in reverse order.
                             By default, this is set to False.
+        scale               The magnification rate that image has been
+                            pre-scaled by. rect and draw_rect are
+                            always measured at the game's native
+                            resolution.
     """
 
     def __init__(self, surf, position, frame_amount, frame_duration,
-                 is_animated=True, is_looped=True, is_reversed=False):
+                 is_animated=True, is_looped=True, is_reversed=False,
+                 scale=1):
         """Declare and initialize instance variables.
 
         Keyword arguments:
@@ -344,8 +620,10 @@ class Animation(Graphic):
                                 only play once.
             is_reversed         Set to True if the Animation should
                                 play backwards.
+            scale               Optional. The magnification rate that
+                                surf has already been pre-scaled by.
         """
-        super(Animation, self).__init__(surf, position)
+        super(Animation, self).__init__(surf, position, scale)
         self.frame_amount = frame_amount
         self.frame_width = self.calculate_frame_width()
         self.frame_duration = frame_duration
@@ -359,7 +637,8 @@ class Animation(Graphic):
 
     @classmethod
     def from_file(self, filepath, position, frame_amount, frame_duration,
-                  is_animated=True, is_looped=True, is_reversed=False):
+                  is_animated=True, is_looped=True, is_reversed=False,
+                  assets=None):
         """Create an Animation from an external image file.
 
         Keyword arguments:
@@ -378,12 +657,22 @@ class Animation(Graphic):
                                 only play once.
             is_reversed         Set to True if the Animation should
                                 play backwards.
+            assets              Optional. An AssetManager that will
+                                load the spritesheet, pre-scaled to its
+                                render scale. If this is None, the
+                                spritesheet will be loaded at native
+                                resolution.
         """
-        external_sheet = image.load(filepath)
-        external_sheet = convert_to_colorkey_alpha(external_sheet)
+        if assets is None:
+            external_sheet = import_image(filepath)
+            scale = 1
+        else:
+            external_sheet = assets.load_image(filepath)
+            scale = assets.render_scale
+
         return Animation(external_sheet, position, frame_amount,
                          frame_duration, is_animated, is_looped,
-                         is_reversed)
+                         is_reversed, scale)
 
     def calculate_frame_width(self):
         """Calculate the frame width by dividing the width of the
@@ -456,6 +745,9 @@ class Animation(Graphic):
     def draw(self, parent_surf):
         """Draw the current frame onto the specified Surface.
 
+        The Animation will still advance if it lies entirely outside
+        of the Surface's clipping area, but nothing will be drawn.
+
         Keyword arguments:
             parent_surf     The Surface upon which the Animation will
                             be drawn.
@@ -463,14 +755,50 @@ class Animation(Graphic):
         if self.is_animated == True:
             self.animate()
 
-        parent_surf.blit(self.image, self.rect, self.draw_rect)
+        dest = (self.rect.x, self.rect.y, self.frame_width, self.rect.height)
+        area = self.draw_rect
+        if self.scale != 1:
+            dest = scale_rect(dest, self.scale)
+            area = scale_rect(area, self.scale)
+
+        assert is_display_format(self.image), ('Animations must be '
+                                               'converted to the display '
+                                               'format first.')
+        if not is_culled(parent_surf, *dest):
+            parent_surf.blit(self.image, dest, area)
+
+    def queue_draw(self, sprite_group, z=0):
+        """Add the current frame to a SpriteGroup, so that it will be
+        drawn along with the rest of the group's sprites.
+
+        Like draw(), this will also advance the Animation.
+
+        Keyword arguments:
+            sprite_group    The SpriteGroup that will draw this
+                            Animation.
+            z               Optional. An integer for the Animation's
+                            drawing order within the group. Higher
+                            values are drawn on top.
+        """
+        if self.is_animated == True:
+            self.animate()
+
+        if self.scale == 1:
+            sprite_group.add(self.image, self.rect, self.draw_rect, z)
+        else:
+            sprite_group.add(self.image,
+                             (self.rect.x * self.scale,
+                              self.rect.y * self.scale),
+                             scale_rect(self.draw_rect, self.scale), z)
 
 
 class CharacterAnimation(object):
     """A special type of animation for a character's action.
 
     Unlike regular Animations, this one can have different durations for
-    each individual frame.
+    each individual frame. Its progress is kept as a single tick
+    counter, so it can be moved to any point in the animation with
+    seek().
 
     Attributes:
         is_facing_left: A Boolean indicating whether the character is
@@ -479,10 +807,12 @@ class CharacterAnimation(object):
             frames in order.
         frame_durations: A tuple of integers containing the duration,
             in update cycles, of each animation frame in order.
+        timeline: A FrameTimeline for finding the frame shown at any
+            tick.
+        tick: An integer for the number of update cycles elapsed since
+            the start of the current loop of the animation.
         current_frame: An integer for the index of the animation frame
             currently being displayed.
-        frame_timer: An integer for the number of update cycles elapsed
-            since the current animation frame was shown.
     """
     def __init__(self, is_facing_left, spritesheet, frame_durations):
         """Declare and initialize instance variables:
@@ -504,8 +834,9 @@ class CharacterAnimation(object):
         self.spritesheet = spritesheet
         self.is_facing_left = is_facing_left
         self.frame_durations = frame_durations
+        self.timeline = FrameTimeline(frame_durations)
+        self.tick = 0
         self.current_frame = 0
-        self.frame_timer = 0
         if is_facing_left:
             self.flip_sprite()
 
@@ -522,9 +853,9 @@ class CharacterAnimation(object):
                 the second frame for 8 update cycles, and so on.
         """
         self.frame_durations = frame_durations
+        self.timeline = FrameTimeline(frame_durations)
         self.spritesheet = spritesheet
-        self.current_frame = 0
-        self.frame_timer = 0
+        self.seek(0)
         if self.is_facing_left:
             self.flip_sprite()
 
@@ -560,8 +891,7 @@ class CharacterAnimation(object):
         """
         ordered_sheet = Surface((self.spritesheet.get_width(),
                                  self.spritesheet.get_height()),
-                                SRCALPHA)
-        ordered_sheet.convert_alpha()
+                                SRCALPHA).convert_alpha()
 
         for frame_index in xrange(0, self.get_num_of_frames()):
             frame_x = self.get_width() * frame_index
@@ -602,6 +932,9 @@ class CharacterAnimation(object):
     def draw(self, parent_surf, x, y):
         """Draw the animation onto a Surface at a specific location.
 
+        Nothing will be drawn if the animation lies entirely outside of
+        the Surface's clipping area.
+
         Args:
             parent_surf: The Surface upon which the animation will be
                 drawn.
@@ -610,18 +943,249 @@ class CharacterAnimation(object):
             y: An integer for the animation's y-position relative to the
                 parent Surface.
         """
+        if is_culled(parent_surf, x, y, self.get_width(),
+                     self.get_height()):
+            return
+
+        assert is_display_format(self.spritesheet), ('Animations must be '
+                                                     'converted to the '
+                                                     'display format first.')
         frame_region = self.get_frame_region(self.current_frame)
         parent_surf.blit(self.spritesheet, (x, y), frame_region)
 
+    def queue_draw(self, sprite_group, x, y, z=0):
+        """Add the current frame to a SpriteGroup at a specific
+        location, so that it will be drawn along with the rest of the
+        group's sprites.
+
+        Args:
+            sprite_group: The SpriteGroup that will draw this animation.
+            x: An integer for the animation's x-position relative to the
+                parent Surface.
+            y: An integer for the animation's y-position relative to the
+                parent Surface.
+            z: Optional. An integer for the animation's drawing order
+                within the group. Higher values are drawn on top.
+        """
+        frame_region = self.get_frame_region(self.current_frame)
+        sprite_group.add(self.spritesheet, (x, y), frame_region, z)
+
     def update(self):
         """Update the animation by cycling through to the next frame
         once enough time has elapsed.
         """
-        self.frame_timer += 1
+        self.seek(self.tick + 1)
+
+    def seek(self, tick):
+        """Move the animation to the frame shown at a certain tick. The
+        animation loops, so ticks past its end wrap around.
+
+        Args:
+            tick: An integer for the number of update cycles elapsed
+                since the start of the first frame.
+        """
+        self.tick = self.timeline.wrap_tick(tick)
+        self.current_frame = self.timeline.get_frame_index(self.tick)
+
+
+class SpriteGroup(object):
+    """A batch of sprites that are collected over the course of a draw
+    and then blitted onto a Surface all at once.
+
+    Sprites are drawn in order of their z value, from lowest to highest.
+    Sprites sharing the same z value are drawn in the order they were
+    added. Where PyGame supports it, the whole batch is submitted in a
+    single Surface.blits() call, which avoids the overhead of calling
+    Surface.blit() from Python for every sprite.
+
+    Attributes:
+        sprites: A list of tuples, each containing the z value of a
+            sprite followed by its arguments for Surface.blit().
+        clip_rect: A Rect for the region of the parent Surface that the
+            sprites will be clipped to. If this is None, sprites can be
+            drawn anywhere on the parent Surface.
+    """
+    def __init__(self, clip_rect=None):
+        """Declare and initialize instance variables.
+
+        Args:
+            clip_rect: Optional. A Rect for the region of the parent
+                Surface that the sprites will be clipped to.
+        """
+        self.sprites = []
+        self.clip_rect = clip_rect
+
+    def add(self, surf, dest, area=None, z=0):
+        """Add a sprite to be drawn with the rest of the group.
+
+        Args:
+            surf: The Surface containing the sprite's image.
+            dest: A Rect or tuple of integers for the sprite's position
+                on the parent Surface.
+            area: Optional. A Rect for the region of surf that will be
+                drawn. If this is None, all of surf will be drawn.
+            z: Optional. An integer for the sprite's drawing order.
+                Higher values are drawn on top.
+        """
+        assert is_display_format(surf), ('Sprites must be converted to '
+                                         'the display format first.')
+
+        if area is None:
+            self.sprites.append((z, (surf, dest)))
+        else:
+            self.sprites.append((z, (surf, dest, area)))
+
+    def clear(self):
+        """Remove all sprites from the group."""
+        del self.sprites[:]
+
+    def draw(self, parent_surf):
+        """Draw every sprite in the group onto a Surface, and then
+        empty the group so that it can be filled again for the next
+        frame.
+
+        Args:
+            parent_surf: The Surface upon which the sprites will be
+                drawn.
+        """
+        # list.sort() is stable, so sprites on the same z level keep
+        # the order they were added in.
+        self.sprites.sort(key=lambda sprite: sprite[0])
+
+        if self.clip_rect is not None:
+            old_clip = parent_surf.get_clip()
+            parent_surf.set_clip(self.clip_rect)
+
+        visible_blits = [sprite[1] for sprite in self.sprites
+                         if not self.is_sprite_culled(parent_surf,
+                                                      sprite[1])]
+
+        # Surface.blits() was added in PyGame 1.9.4.
+        if hasattr(parent_surf, 'blits'):
+            parent_surf.blits(visible_blits, False)
+        else:
+            for blit_args in visible_blits:
+                parent_surf.blit(*blit_args)
+
+        if self.clip_rect is not None:
+            parent_surf.set_clip(old_clip)
+
+        self.clear()
+
+    def is_sprite_culled(self, parent_surf, blit_args):
+        """Return a Boolean indicating whether a sprite lies entirely
+        outside of the parent Surface's clipping area.
+
+        Args:
+            parent_surf: The Surface that the sprite would be drawn
+                onto.
+            blit_args: A tuple of the sprite's arguments for
+                Surface.blit().
+        """
+        dest = blit_args[1]
+        if len(blit_args) > 2:
+            width = blit_args[2][2]
+            height = blit_args[2][3]
+        else:
+            width, height = blit_args[0].get_size()
+
+        return is_culled(parent_surf, dest[0], dest[1], width, height)
+
+
+class StaticLayer(object):
+    """A drawing layer for graphics that rarely change, such as
+    backgrounds, borders, and labels.
+
+    The layer's graphics are rendered once onto a cached Surface, which
+    is then drawn in a single blit on every frame until the layer is
+    invalidated.
+
+    Attributes:
+        render: A function that draws all of the layer's graphics onto
+            the Surface passed as its only argument.
+        surf: A Surface that caches the layer's rendered graphics.
+        is_transparent: A Boolean indicating whether the parts of the
+            layer left blank by render will show the layers beneath
+            it. If False, they will be drawn black instead.
+        is_dirty: A Boolean indicating whether the cached Surface is
+            out of date and must be rendered again before it is drawn.
+    """
+    def __init__(self, size, render, is_transparent=False):
+        """Declare and initialize instance variables.
+
+        Args:
+            size: A tuple of integers for the width and height of the
+                layer, in pixels.
+            render: A function that draws all of the layer's graphics
+                onto the Surface passed as its only argument.
+            is_transparent: Optional. Set to True if blank parts of the
+                layer should show the layers beneath it.
+        """
+        self.render = render
+        self.is_transparent = is_transparent
+        # Transparent layers keep per-pixel alpha, so that antialiased
+        # text and translucent images blend with whatever lies beneath
+        # the layer rather than with a colorkey.
+        if is_transparent:
+            self.surf = Surface(size, SRCALPHA).convert_alpha()
+        else:
+            self.surf = Surface(size).convert()
+        self.is_dirty = True
+
+    def invalidate(self):
+        """Mark the layer's graphics as changed, so that they will be
+        rendered again the next time the layer is drawn.
+        """
+        self.is_dirty = True
+
+    def refresh(self):
+        """Render the layer's graphics onto the cached Surface."""
+        if self.is_transparent:
+            self.surf.fill((0, 0, 0, 0))
+        else:
+            self.surf.fill((0, 0, 0))
+        self.render(self.surf)
+        self.is_dirty = False
 
-        if self.frame_timer >= self.frame_durations[self.current_frame]:
-            self.frame_timer = 0
+    def draw(self, parent_surf):
+        """Draw the layer onto a Surface, rendering it again first if
+        it has been invalidated.
 
-            self.current_frame += 1
-            if self.current_frame > self.get_num_of_frames() - 1:
-                self.current_frame = 0
+        Args:
+            parent_surf: The Surface upon which the layer will be drawn.
+        """
+        if self.is_dirty:
+            self.refresh()
+        assert is_display_format(self.surf), ('Layers must be converted to '
+                                              'the display format first.')
+        parent_surf.blit(self.surf, (0, 0))
+
+
+class DynamicLayer(object):
+    """A drawing layer for graphics that change every frame, such as
+    animations and flashing text. It is drawn from scratch each time.
+
+    Attributes:
+        render: A function that draws all of the layer's graphics onto
+            the Surface passed as its only argument.
+    """
+    def __init__(self, render):
+        """Declare and initialize instance variables.
+
+        Args:
+            render: A function that draws all of the layer's graphics
+                onto the Surface passed as its only argument.
+        """
+        self.render = render
+
+    def invalidate(self):
+        """Do nothing, as dynamic layers are never cached."""
+        pass
+
+    def draw(self, parent_surf):
+        """Draw the layer onto a Surface.
+
+        Args:
+            parent_surf: The Surface upon which the layer will be drawn.
+        """
+        self.render(parent_surf)
@@ -0,0 +1,121 @@
+"""This module contains the ImageCache, which loads images as they are
+needed and keeps only the most recently used ones in memory.
+
+Images that are likely to be needed soon can be prefetched, which loads
+them on a background thread so that the game doesn't stall when they
+are finally requested.
+"""
+from collections import OrderedDict
+from threading import Thread, Lock
+from lib.graphics import import_image
+
+
+class ImageCache(object):
+    """Loads images on demand and keeps a limited number of them in
+    memory, releasing the least recently used images first.
+
+    Surfaces that have been released from the cache remain valid, so
+    anything still displaying one can continue to do so.
+
+    Attributes:
+        capacity: An integer for the maximum number of images kept in
+            memory at once.
+        images: An OrderedDict mapping the file paths of the loaded
+            images to their Surfaces, from least to most recently used.
+        pending_paths: A list of the file paths of the images waiting to
+            be prefetched.
+        prefetch_thread: The Thread that prefetches images.
+        is_prefetching: A Boolean indicating whether prefetch_thread is
+            still loading pending images.
+        lock: A Lock that guards images, pending_paths, and
+            is_prefetching, which are shared with prefetch_thread.
+    """
+    def __init__(self, capacity):
+        """Declare and initialize instance variables.
+
+        Args:
+            capacity: An integer for the maximum number of images kept
+                in memory at once.
+        """
+        self.capacity = capacity
+        self.images = OrderedDict()
+        self.pending_paths = []
+        self.prefetch_thread = Thread()
+        self.is_prefetching = False
+        self.lock = Lock()
+
+    def get_image(self, filepath):
+        """Return a Surface containing an image, loading it if it isn't
+        in memory, and mark it as the most recently used image.
+
+        Args:
+            filepath: A String for the file path to the image.
+        """
+        with self.lock:
+            image = self.images.pop(filepath, None)
+            if image is not None:
+                self.images[filepath] = image
+                return image
+
+        image = import_image(filepath)
+        with self.lock:
+            self.store_image(filepath, image)
+        return image
+
+    def store_image(self, filepath, image):
+        """Keep an image in memory as the most recently used one,
+        releasing the least recently used images if there are too many.
+        The lock must be held when calling this method.
+
+        Args:
+            filepath: A String for the file path to the image.
+            image: The Surface containing the image.
+        """
+        self.images.pop(filepath, None)
+        self.images[filepath] = image
+
+        while len(self.images) > self.capacity:
+            self.images.popitem(last=False)
+
+    def prefetch(self, filepaths):
+        """Start loading some images in the background.
+
+        Any images from a previous call that haven't been loaded yet
+        will be skipped, as they are assumed to no longer be needed.
+        Only as many images as can fit alongside the most recently used
+        one are prefetched, so that prefetching never releases it.
+
+        Args:
+            filepaths: A list of Strings for the file paths to the
+                images, in order of priority.
+        """
+        filepaths = filepaths[:max(self.capacity - 1, 0)]
+
+        with self.lock:
+            self.pending_paths = [filepath for filepath in filepaths
+                                  if filepath not in self.images]
+            if len(self.pending_paths) <= 0 or self.is_prefetching:
+                return
+
+            self.is_prefetching = True
+            self.prefetch_thread = Thread(target=self.run_prefetch)
+            self.prefetch_thread.daemon = True
+            self.prefetch_thread.start()
+
+    def run_prefetch(self):
+        """Load pending images one at a time until there are none left.
+        This runs on prefetch_thread.
+        """
+        while True:
+            with self.lock:
+                if len(self.pending_paths) <= 0:
+                    self.is_prefetching = False
+                    return
+                filepath = self.pending_paths.pop(0)
+                if filepath in self.images:
+                    continue
+
+            image = import_image(filepath)
+            with self.lock:
+                if filepath not in self.images:
+                    self.store_image(filepath, image)
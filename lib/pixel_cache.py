@@ -0,0 +1,246 @@
+"""This module keeps an on-disk cache of decoded image pixels, so that
+images don't have to be decompressed from their source files every
+time the game loads them.
+
+Each cached image is stored in its own file within PIXEL_CACHE_PATH,
+named after a hash of the source file's contents. A cache file holds a
+small header followed by the image's raw pixels, which are read by
+memory-mapping the file and wrapping it with pygame.image.frombuffer().
+This skips decompression entirely, and leaves the reading of large
+images to the operating system's page cache, which is shared between
+processes.
+
+So that an image that is already cached doesn't have to be read just
+to find its hash, a manifest in PIXEL_CACHE_PATH records the hash of
+every source file along with its size and modification time. A source
+file is only read and hashed again once either of those changes.
+
+If a cache file can't be read or written, such as on a read-only disk,
+the image is simply loaded from its source file as usual.
+
+Module Constants:
+    MAGIC (String): The four bytes that every cache file begins with.
+    CACHE_VERSION (int): The version of the cache file format. Cache
+        files from any other version are ignored and replaced.
+    HEADER (Struct): The layout of a cache file's header. It contains
+        MAGIC, CACHE_VERSION, the name of the image's alpha type, the
+        pixel format passed to pygame.image.tostring(), and the
+        image's width and height.
+    MANIFEST_PATH (String): The file path to the manifest of source
+        file hashes.
+"""
+import os
+import mmap
+import json
+import struct
+import hashlib
+from threading import Lock
+from pygame import image
+from customize.globals import USE_PIXEL_CACHE, PIXEL_CACHE_PATH
+from lib.custom_data.content_pack import (read_content,
+                                          get_content_signature,
+                                          normalize_path)
+
+
+MAGIC = 'SCPX'
+CACHE_VERSION = 1
+HEADER = struct.Struct('<4sH16s4sII')
+MANIFEST_PATH = os.path.join(PIXEL_CACHE_PATH, 'manifest.json')
+
+_manifest = None
+_manifest_lock = Lock()
+
+
+def get_source_hash(filepath):
+    """Return the hash of a source image's contents, looking it up in
+    the manifest if the file hasn't changed since it was last hashed.
+
+    Args:
+        filepath: A String for the file path to the source image.
+
+    Returns:
+        A tuple containing a String for the hexadecimal hash, and a
+        String with the file's contents if they had to be read to hash
+        them, or None if the hash came from the manifest.
+
+    Raises:
+        IOError: The source image doesn't exist.
+    """
+    manifest_key = normalize_path(filepath)
+    signature = get_content_signature(filepath)
+
+    with _manifest_lock:
+        entry = get_manifest().get(manifest_key)
+    if signature is not None and entry is not None and entry[:2] == signature:
+        return (entry[2], None)
+
+    contents = read_content(filepath)
+    source_hash = hashlib.sha1(contents).hexdigest()
+    if signature is not None:
+        with _manifest_lock:
+            get_manifest()[manifest_key] = signature + [source_hash]
+            save_manifest()
+
+    return (source_hash, contents)
+
+
+def get_cache_path(source_hash, variant=''):
+    """Return a String for the file path of an image's cache file.
+
+    Args:
+        source_hash: A String for the hash of the source image, as
+            returned by get_source_hash().
+        variant: Optional. A String that distinguishes between
+            different conversions of the same source image, such as
+            the alpha type it was loaded with.
+    """
+    cache_hash = hashlib.sha1(source_hash + '\0' + variant)
+    return os.path.join(PIXEL_CACHE_PATH, cache_hash.hexdigest() + '.pix')
+
+
+def get_manifest():
+    """Return the dict mapping the normalized file path of every
+    hashed source image to a list of its size, its modification time,
+    and its hash, reading it from file the first time this is called.
+
+    The caller must hold _manifest_lock.
+    """
+    global _manifest
+
+    if _manifest is None:
+        try:
+            with open(MANIFEST_PATH, 'r') as manifest_file:
+                _manifest = json.load(manifest_file)
+            if not isinstance(_manifest, dict):
+                _manifest = {}
+        except (IOError, ValueError):
+            _manifest = {}
+
+    return _manifest
+
+
+def save_manifest():
+    """Write the manifest to file. If it can't be written, any
+    changed source images will simply be hashed again next time.
+
+    The caller must hold _manifest_lock.
+    """
+    temp_path = MANIFEST_PATH + '.tmp'
+
+    try:
+        if not os.path.isdir(PIXEL_CACHE_PATH):
+            os.makedirs(PIXEL_CACHE_PATH)
+
+        with open(temp_path, 'w') as manifest_file:
+            json.dump(_manifest, manifest_file, sort_keys=True)
+
+        # Windows won't rename a file over an existing one.
+        if os.path.exists(MANIFEST_PATH):
+            os.remove(MANIFEST_PATH)
+        os.rename(temp_path, MANIFEST_PATH)
+    except (IOError, OSError):
+        pass
+
+
+def load_pixels(cache_path, convert):
+    """Load an image from its cache file and convert it for drawing.
+
+    Args:
+        cache_path: A String for the file path to the cache file, as
+            returned by get_cache_path().
+        convert: A function that takes the cached Surface and the name
+            of its alpha type, and returns a converted copy of the
+            Surface. The cached Surface reads straight from the mapped
+            file, so it can't be used once this function returns.
+
+    Returns:
+        A tuple containing the converted Surface and a String for the
+        name of its alpha type. If the image isn't cached, None is
+        returned instead.
+    """
+    if not (USE_PIXEL_CACHE and os.path.isfile(cache_path)):
+        return None
+
+    try:
+        with open(cache_path, 'rb') as cache_file:
+            mapped_file = mmap.mmap(cache_file.fileno(), 0,
+                                    access=mmap.ACCESS_READ)
+    except (IOError, OSError, ValueError):
+        return None
+
+    try:
+        if len(mapped_file) < HEADER.size:
+            return None
+
+        (magic, version, alpha_type, pixel_format,
+         width, height) = HEADER.unpack_from(mapped_file, 0)
+        alpha_type = alpha_type.rstrip('\0')
+        pixel_format = pixel_format.rstrip('\0')
+        pixels_size = width * height * len(pixel_format)
+
+        if (magic != MAGIC or version != CACHE_VERSION or
+                len(mapped_file) != HEADER.size + pixels_size):
+            return None
+
+        pixels = buffer(mapped_file, HEADER.size, pixels_size)
+        cached_image = image.frombuffer(pixels, (width, height),
+                                        pixel_format)
+        converted_image = convert(cached_image, alpha_type)
+        del cached_image, pixels
+        return (converted_image, alpha_type)
+    finally:
+        mapped_file.close()
+
+
+def save_pixels(cache_path, surf, alpha_type, pixel_format):
+    """Write an image's pixels to its cache file.
+
+    Args:
+        cache_path: A String for the file path to the cache file, as
+            returned by get_cache_path().
+        surf: The Surface containing the image.
+        alpha_type: A String for the name of the image's alpha type.
+        pixel_format: A String for the format of the stored pixels.
+            This can be any format supported by both
+            pygame.image.tostring() and pygame.image.frombuffer(), such
+            as 'RGB' or 'RGBA'.
+    """
+    if not USE_PIXEL_CACHE:
+        return
+
+    width, height = surf.get_size()
+    header = HEADER.pack(MAGIC, CACHE_VERSION, alpha_type, pixel_format,
+                         width, height)
+    temp_path = cache_path + '.tmp'
+
+    try:
+        if not os.path.isdir(PIXEL_CACHE_PATH):
+            os.makedirs(PIXEL_CACHE_PATH)
+
+        with open(temp_path, 'wb') as cache_file:
+            cache_file.write(header)
+            cache_file.write(image.tostring(surf, pixel_format))
+
+        # Windows won't rename a file over an existing one.
+        if os.path.exists(cache_path):
+            os.remove(cache_path)
+        os.rename(temp_path, cache_path)
+    except (IOError, OSError):
+        pass
+
+
+def clear_cache():
+    """Delete every cache file and the manifest, so that all images
+    will be loaded from their source files again.
+    """
+    global _manifest
+
+    with _manifest_lock:
+        _manifest = None
+        if not os.path.isdir(PIXEL_CACHE_PATH):
+            return
+
+        for filename in os.listdir(PIXEL_CACHE_PATH):
+            if (filename.endswith('.pix') or filename.endswith('.tmp') or
+                    filename == os.path.basename(MANIFEST_PATH)):
+                os.remove(os.path.join(PIXEL_CACHE_PATH, filename))
@@ -0,0 +1,46 @@
+"""This module keeps running counts of notable events within the game,
+such as draws that were skipped, so that their frequency can be
+checked while tuning performance.
+
+Counters are identified by name and start at zero. They are shared by
+the whole game and are never reset unless reset_counts() is called.
+
+Module Constants:
+    CULLED_DRAWS (String): The name of the counter for draws that were
+        skipped because the graphic was entirely outside of the
+        visible area of its parent Surface.
+"""
+CULLED_DRAWS = 'culled draws'
+
+_counts = {}
+
+
+def count(name, amount=1):
+    """Add to one of the counters.
+
+    Args:
+        name (String): The name of the counter.
+        amount (int): Optional. The amount to add to the counter.
+    """
+    _counts[name] = _counts.get(name, 0) + amount
+
+
+def get_count(name):
+    """Return the current value of a counter as an integer.
+
+    Args:
+        name (String): The name of the counter.
+    """
+    return _counts.get(name, 0)
+
+
+def get_all_counts():
+    """Return a dict containing the current value of every counter,
+    keyed by name.
+    """
+    return dict(_counts)
+
+
+def reset_counts():
+    """Set all counters back to zero."""
+    _counts.clear()
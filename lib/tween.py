@@ -0,0 +1,362 @@
+"""This module contains a tweening engine for animating values over a
+fixed number of update frames, such as the positions of Graphics
+during screen transitions or the opacity of a fade.
+
+All active Tweens are kept by a single TweenScheduler, which steps
+them together once per frame. Since the game runs at a variable frame
+rate, the scheduler accumulates elapsed time and steps its Tweens in
+whole frames of 1/FRAME_RATE seconds, so that every transition lasts
+exactly as long regardless of how fast the game is running.
+
+Module Constants:
+    LINEAR (String): The name of the easing that changes a value at a
+        constant rate.
+    EASE_IN (String): The name of the easing that starts slowly and
+        speeds up towards the end.
+    EASE_OUT (String): The name of the easing that starts quickly and
+        slows down towards the end.
+    EASE_IN_OUT (String): The name of the easing that starts and ends
+        slowly, with the fastest change in the middle.
+    EASING_TABLE_SIZE (int): The number of intervals that each easing
+        table is divided into. Progress values that fall between two
+        table entries are linearly interpolated.
+    EASING_TABLES (dict of String: tuple of float): Maps the name of
+        each easing to its precomputed table of eased progress values.
+    MAX_STEPS_PER_UPDATE (int): The greatest number of frames that the
+        TweenScheduler will step through in a single update. This stops
+        a long stall, such as a slow State load, from fast-forwarding
+        every Tween to its end at once.
+"""
+from threading import Lock
+from math import ceil
+from customize.globals import FRAME_RATE
+
+
+LINEAR = 'linear'
+EASE_IN = 'ease in'
+EASE_OUT = 'ease out'
+EASE_IN_OUT = 'ease in out'
+EASING_TABLE_SIZE = 256
+MAX_STEPS_PER_UPDATE = 4
+
+
+def build_easing_table(easing_function):
+    """Return a tuple of floats containing an easing function's values
+    sampled across the full range of progress from 0.0 to 1.0.
+
+    Args:
+        easing_function: A function that takes a float for progress
+            between 0.0 and 1.0 and returns the eased progress as a
+            float.
+    """
+    return tuple([easing_function(float(i) / EASING_TABLE_SIZE)
+                  for i in xrange(0, EASING_TABLE_SIZE + 1)])
+
+
+EASING_TABLES = {
+    LINEAR: build_easing_table(lambda t: t),
+    EASE_IN: build_easing_table(lambda t: t * t),
+    EASE_OUT: build_easing_table(lambda t: 1.0 - ((1.0 - t) * (1.0 - t))),
+    EASE_IN_OUT: build_easing_table(lambda t: t * t * (3.0 - (2.0 * t))),
+}
+
+
+def ease(easing, progress):
+    """Return a float for the eased value of some progress, looked up
+    from the easing's precomputed table.
+
+    Args:
+        easing: A String for the name of the easing to use.
+        progress: A float between 0.0 and 1.0 for how far along the
+            transition is.
+    """
+    table = EASING_TABLES[easing]
+    position = progress * EASING_TABLE_SIZE
+    index = int(position)
+
+    if index >= EASING_TABLE_SIZE:
+        return table[EASING_TABLE_SIZE]
+    else:
+        remainder = position - index
+        return table[index] + ((table[index + 1] - table[index]) * remainder)
+
+
+def frames_for_distance(distance, speed):
+    """Return an integer for the number of update frames needed to
+    cover some distance at a constant speed. It will always be at
+    least 1.
+
+    Args:
+        distance: A float for the distance to travel.
+        speed: A float for the speed of travel, in units per second.
+    """
+    frames = int(ceil(abs(float(distance)) / speed * FRAME_RATE))
+    return max(frames, 1)
+
+
+def frames_for_seconds(seconds):
+    """Return an integer for the number of update frames that make up
+    a length of time. It will always be at least 1.
+
+    Args:
+        seconds: A float for the length of time, in seconds.
+    """
+    return max(int(ceil(seconds * FRAME_RATE)), 1)
+
+
+class Tween(object):
+    """Gradually changes a value from a starting point to an end point
+    over a set number of update frames.
+
+    Attributes:
+        start: A float for the value at the beginning of the Tween.
+        end: A float for the value at the end of the Tween.
+        duration: An integer for the length of the Tween, in update
+            frames.
+        delay: An integer for the number of update frames left to wait
+            before the Tween begins changing its value.
+        easing: A String for the name of the easing that shapes how the
+            value changes over time. See EASING_TABLES for the possible
+            values.
+        on_update: A function that will be called with the new value and
+            the change from the previous value each time the Tween is
+            stepped. It can be None if the Tween is only used as a
+            timer.
+        on_complete: A function with no arguments that will be called
+            once the Tween reaches its end. It can be None.
+        owner: The object that started this Tween. It can be used to
+            look up or cancel all of that object's Tweens at once.
+        frame: An integer for the number of frames that the Tween has
+            been running, not counting its delay.
+        value: A float for the Tween's current value.
+        is_finished: A Boolean indicating whether the Tween has reached
+            its end or has been cancelled.
+    """
+    def __init__(self, start, end, duration, on_update=None,
+                 on_complete=None, easing=LINEAR, delay=0, owner=None):
+        """Declare and initialize instance variables.
+
+        Args:
+            start: A float for the value at the beginning of the Tween.
+            end: A float for the value at the end of the Tween.
+            duration: An integer for the length of the Tween, in update
+                frames.
+            on_update: Optional. A function that will be called with
+                the new value and the change from the previous value
+                each time the Tween is stepped.
+            on_complete: Optional. A function with no arguments that
+                will be called once the Tween reaches its end.
+            easing: Optional. A String for the name of the easing to
+                use. The default is LINEAR.
+            delay: Optional. An integer for the number of frames to
+                wait before the Tween starts.
+            owner: Optional. The object responsible for this Tween.
+        """
+        self.start = float(start)
+        self.end = float(end)
+        self.duration = max(int(duration), 1)
+        self.delay = delay
+        self.easing = easing
+        self.on_update = on_update
+        self.on_complete = on_complete
+        self.owner = owner
+        self.frame = 0
+        self.value = self.start
+        self.is_finished = False
+
+    def step(self):
+        """Advance the Tween by one update frame.
+
+        If the Tween reaches its end, the completion callback will be
+        called and the Tween will be marked as finished.
+        """
+        if self.is_finished:
+            return
+
+        if self.delay > 0:
+            self.delay -= 1
+            return
+
+        self.frame += 1
+        self.set_progress(float(self.frame) / self.duration)
+
+        if self.frame >= self.duration:
+            self.is_finished = True
+            if self.on_complete is not None:
+                self.on_complete()
+
+    def set_progress(self, progress):
+        """Set the Tween's value based on how far along it is, and pass
+        it to the update callback.
+
+        Args:
+            progress: A float between 0.0 and 1.0 for how far along the
+                Tween is.
+        """
+        old_value = self.value
+        self.value = (self.start +
+                      ((self.end - self.start) * ease(self.easing, progress)))
+
+        if self.on_update is not None:
+            self.on_update(self.value, self.value - old_value)
+
+    def finish(self):
+        """Jump straight to the end of the Tween, calling both of its
+        callbacks as if it had run to completion.
+        """
+        if self.is_finished:
+            return
+
+        self.delay = 0
+        self.frame = self.duration - 1
+        self.step()
+
+    def cancel(self):
+        """Stop the Tween where it is without calling its completion
+        callback.
+        """
+        self.is_finished = True
+
+
+class TweenScheduler(object):
+    """Keeps track of every active Tween within the game and steps all
+    of them together on a fixed timestep.
+
+    Attributes:
+        tweens: A list of the Tweens currently being run.
+        new_tweens: A list of Tweens that have been started since the
+            last step. They will join the others at the next step.
+            Game States are built on a separate thread, so this list is
+            protected by lock.
+        lock: A Lock that guards new_tweens.
+        time_pool: A float for the time, in seconds, that has elapsed
+            but has not yet been stepped through.
+    """
+    def __init__(self):
+        """Declare and initialize instance variables."""
+        self.tweens = []
+        self.new_tweens = []
+        self.lock = Lock()
+        self.time_pool = 0.0
+
+    def start(self, start, end, duration, on_update=None, on_complete=None,
+              easing=LINEAR, delay=0, owner=None):
+        """Create a new Tween, add it to the scheduler, and return it.
+
+        Args:
+            start: A float for the value at the beginning of the Tween.
+            end: A float for the value at the end of the Tween.
+            duration: An integer for the length of the Tween, in update
+                frames.
+            on_update: Optional. A function that will be called with
+                the new value and the change from the previous value
+                each time the Tween is stepped.
+            on_complete: Optional. A function with no arguments that
+                will be called once the Tween reaches its end.
+            easing: Optional. A String for the name of the easing to
+                use. The default is LINEAR.
+            delay: Optional. An integer for the number of frames to
+                wait before the Tween starts.
+            owner: Optional. The object responsible for this Tween.
+        """
+        new_tween = Tween(start, end, duration, on_update, on_complete,
+                          easing, delay, owner)
+        with self.lock:
+            self.new_tweens.append(new_tween)
+        return new_tween
+
+    def start_timer(self, duration, on_complete, owner=None):
+        """Call a function once a number of update frames have passed,
+        and return the Tween used as the timer.
+
+        Args:
+            duration: An integer for the number of frames to wait.
+            on_complete: A function with no arguments that will be
+                called once the time is up.
+            owner: Optional. The object responsible for the timer.
+        """
+        return self.start(0.0, 1.0, duration, on_complete=on_complete,
+                          owner=owner)
+
+    def update(self, seconds):
+        """Step all active Tweens once for every full frame of time
+        that has passed since the last update.
+
+        Args:
+            seconds: A float for the time elapsed, in seconds, since the
+                last update.
+        """
+        frame_time = 1.0 / FRAME_RATE
+        self.time_pool += seconds
+        steps = 0
+
+        while self.time_pool >= frame_time and steps < MAX_STEPS_PER_UPDATE:
+            self.step()
+            self.time_pool -= frame_time
+            steps += 1
+
+        if steps >= MAX_STEPS_PER_UPDATE:
+            self.time_pool = 0.0
+
+    def step(self):
+        """Advance all active Tweens by one frame and drop the ones
+        that have finished.
+        """
+        with self.lock:
+            self.tweens.extend(self.new_tweens)
+            self.new_tweens = []
+
+        # Iterate over a copy, as completion callbacks may start or
+        # cancel other Tweens.
+        for tween in list(self.tweens):
+            tween.step()
+
+        self.tweens = [tween for tween in self.tweens
+                       if not tween.is_finished]
+
+    def get_tweens(self, owner=None):
+        """Return a list of all unfinished Tweens.
+
+        Args:
+            owner: Optional. If given, only that object's Tweens will
+                be returned.
+        """
+        with self.lock:
+            all_tweens = self.tweens + self.new_tweens
+
+        return [tween for tween in all_tweens if not tween.is_finished and
+                (owner is None or tween.owner is owner)]
+
+    def is_running(self, owner=None):
+        """Return a Boolean indicating whether any Tweens are active.
+
+        Args:
+            owner: Optional. If given, only that object's Tweens will
+                be checked.
+        """
+        return len(self.get_tweens(owner)) > 0
+
+    def finish(self, owner):
+        """Jump all of an object's Tweens to their ends, calling their
+        callbacks.
+
+        Only the Tweens that are running when this is called are
+        finished. Any that their callbacks start are left to run
+        normally, since a callback that keeps starting new Tweens would
+        otherwise never let this return.
+
+        Args:
+            owner: The object whose Tweens will be finished.
+        """
+        for tween in self.get_tweens(owner):
+            tween.finish()
+
+    def cancel(self, owner):
+        """Stop all of an object's Tweens without calling their
+        completion callbacks.
+
+        Args:
+            owner: The object whose Tweens will be cancelled.
+        """
+        for tween in self.get_tweens(owner):
+            tween.cancel()